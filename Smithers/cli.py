@@ -0,0 +1,361 @@
+# cli.py
+import argparse
+import csv
+import os
+import struct
+import sys
+from array import array
+from datetime import date, datetime
+from typing import List, Optional, Sequence, Tuple
+from helpers.columnar_store import ColumnarStore, ColumnarReader, TextColumn
+from helpers.data_processing import DataProcessor
+from helpers.time_series import TimeSeries
+from models.factor_distribution import FactorDistribution
+from models.factor_index import FactorIndex
+from models.factor_table import FactorTable
+from models.household import Household
+from models.option_space_verifier import OptionSpaceVerifier
+from models.session_stats import SessionStats
+
+def parse_date(value: str) -> date:
+    """Parse a YYYY-MM-DD command line date."""
+    return datetime.strptime(value, '%Y-%m-%d').date()
+
+def read_household(path: str) -> Household:
+    """
+    Load profiles from a CSV file ("-" reads stdin).
+    See Household.add_record for the columns.
+    """
+    household = Household()
+    with (sys.stdin if path == '-' else open(path, newline='', encoding='utf-8')) as source:
+        for line, record in enumerate(csv.DictReader(source), start=2):
+            try:
+                household.add_record(record)
+            except ValueError as e:
+                raise SystemExit(f"{path}:{line}: {e}")
+    return household
+
+def yearly_command(args: argparse.Namespace) -> None:
+    """Write each profile's cumulative total at the end of every year of life."""
+    household = read_household(args.input)
+    summary = household.aggregate(args.today)
+    kg_per_day = DataProcessor.BASE_POOPS_PER_DAY * DataProcessor.BASE_GRAMS_PER_POOP / 1000
+
+    writer = csv.writer(sys.stdout)
+    writer.writerow(
+        ['name', 'adjustment_factor', 'total_kg_today'] +
+        [f"year_{year}" for year in range(1, args.years + 1)]
+    )
+    for index, name in enumerate(summary['names']):
+        factor = summary['factors'][index]
+        birth_date = date.fromordinal(household.birth_days[index])
+        curve = TimeSeries.build_lifetime_curve(
+            birth_date,
+            kg_per_day * factor,
+            today=args.today,
+            life_expectancy_years=args.years
+        )
+        years = TimeSeries.yearly_totals(curve['cumulative'])[:args.years]
+        writer.writerow(
+            [name, f"{factor:.4f}", f"{summary['total_kg'][index]:.3f}"] +
+            [f"{total:.3f}" for total in years]
+        )
+
+def attribute_command(args: argparse.Namespace) -> None:
+    """Write each profile's log-space contribution per step."""
+    household = read_household(args.input)
+    table = household.table
+    factors = table.evaluate(household.columns, len(household))
+    contributions = table.attribute(household.columns, len(household))
+
+    writer = csv.writer(sys.stdout)
+    writer.writerow(
+        ['name', 'adjustment_factor', 'log_total'] + [f"log_{key}" for key in table.keys]
+    )
+    for index, name in enumerate(household.names):
+        values = [contributions[key][index] for key in table.keys]
+        writer.writerow(
+            [name, f"{factors[index]:.4f}", f"{sum(values):.6f}"] +
+            [f"{value:.6f}" for value in values]
+        )
+
+def lookup_command(args: argparse.Namespace) -> None:
+    """List option combinations by adjustment factor or lifetime weight."""
+    index = FactorIndex()
+    if args.top is not None:
+        entries = index.top(args.top)
+    elif args.bottom is not None:
+        entries = index.bottom(args.bottom)
+    else:
+        if args.kg is not None:
+            days = args.age * TimeSeries.DAYS_PER_YEAR
+            low, high = (index.factor_for_kg(kg, days) for kg in args.kg)
+        else:
+            low, high = args.factor
+        print(f"# {index.count_between(low, high)} of {len(index)} combinations", file=sys.stderr)
+        entries = index.between(low, high, args.limit)
+
+    writer = csv.writer(sys.stdout)
+    writer.writerow(['adjustment_factor'] + list(index.table.keys))
+    for factor, row in entries:
+        writer.writerow([f"{factor:.4f}"] + list(index.describe(row).values()))
+
+def rank_input(path: str, priors: Optional[dict]) -> Tuple[array, array, Sequence]:
+    """Percentiles, factors and row names for a profiles CSV or export directory."""
+    if os.path.isdir(path):
+        table = FactorTable()
+        with ColumnarReader(path) as reader:
+            columns = {}
+            for key in table.keys:
+                if key in reader.names:
+                    if reader.options(key) != table.options[key]:
+                        raise SystemExit(f"{path}: options for {key} don't match this version")
+                    columns[key] = reader[key]
+            factors = table.evaluate(columns, reader.rows)
+            percentiles = FactorDistribution.rank_columns(table, columns, reader.rows, priors)
+            names = list(reader['name']) if 'name' in reader.names else range(len(factors))
+    else:
+        household = read_household(path)
+        factors = household.table.evaluate(household.columns, len(household))
+        percentiles = FactorDistribution.rank_columns(
+            household.table, household.columns, len(household), priors
+        )
+        names = household.names
+    return percentiles, factors, names
+
+def percentile_command(args: argparse.Namespace) -> None:
+    """Write each profile's model-based percentile within its region."""
+    priors = None
+    if args.priors:
+        try:
+            priors = FactorDistribution.load_priors(args.priors)
+            # Check the weights now, so a bad prior is blamed on its file
+            table = FactorTable()
+            for region in table.options[FactorDistribution.REGION_KEY]:
+                FactorDistribution.for_region(table, region, priors)
+        except (OSError, ValueError) as e:
+            raise SystemExit(f"{args.priors}: {e}")
+    try:
+        percentiles, factors, names = rank_input(args.input, priors)
+    except ValueError as e:
+        raise SystemExit(f"{args.input}: {e}")
+
+    writer = csv.writer(sys.stdout)
+    writer.writerow(['name', 'adjustment_factor', 'model_percentile'])
+    for name, factor, percentile in zip(names, factors, percentiles):
+        writer.writerow([name, f"{factor:.4f}", f"{percentile:.2f}"])
+
+def check_output(output: str, inputs: Sequence[str]) -> None:
+    """Refuse to write an output over one of the files it is built from."""
+    for path in inputs:
+        if path != '-' and os.path.exists(output) and os.path.exists(path) \
+                and os.path.samefile(output, path):
+            raise SystemExit(f"{output}: is also an input; choose another output file")
+
+def read_stats(path: Optional[str], missing_ok: bool = False) -> SessionStats:
+    """Load a stats file (default: the app's own), exiting with a message if it's unreadable."""
+    path = path or SessionStats.get_data_path()
+    if missing_ok and not os.path.exists(path):
+        return SessionStats()
+    try:
+        with open(path, 'rb') as stats_file:
+            return SessionStats.from_bytes(stats_file.read())
+    except (OSError, ValueError, struct.error) as e:
+        raise SystemExit(f"{path}: {e}")
+
+def sketch_command(args: argparse.Namespace) -> None:
+    """Build, merge or show session percentile stats."""
+    if args.action == 'build':
+        check_output(args.output, args.inputs)
+        # One batch worker: every profile in the CSV counts as a session
+        stats = SessionStats()
+        for path in args.inputs:
+            household = read_household(path)
+            summary = household.aggregate(args.today)
+            regions = household.columns['region']
+            for index in range(len(household)):
+                stats.record(
+                    household.table.options['region'][regions[index]],
+                    summary['days'][index] / 365,
+                    summary['total_kg'][index]
+                )
+        stats.save(args.output)
+    elif args.action == 'merge':
+        check_output(args.output, args.inputs)
+        stats = read_stats(args.output, missing_ok=True) if args.append else SessionStats()
+        for path in args.inputs:
+            try:
+                stats.merge(read_stats(path))
+            except ValueError as e:
+                raise SystemExit(f"{path}: {e}")
+        stats.save(args.output)
+    else:
+        stats = read_stats(args.stats, missing_ok=True)
+
+    writer = csv.writer(sys.stdout)
+    writer.writerow(['region', 'age_band', 'sessions', 'p10_kg', 'p50_kg', 'p90_kg'])
+    for key, sketch in stats.items():
+        region, age_band = key.split('|')
+        writer.writerow(
+            [region, age_band, sketch.count] +
+            [f"{sketch.quantile(fraction):.1f}" for fraction in (0.1, 0.5, 0.9)]
+        )
+
+def export_command(args: argparse.Namespace) -> None:
+    """Write every profile's codes and totals as columnar .npy files."""
+    household = read_household(args.input)
+    summary = household.aggregate(args.today)
+
+    columns = {'name': household.names, **household.columns}
+    metadata = {key: {'options': household.table.options[key]} for key in household.columns}
+    epoch = ColumnarStore.EPOCH.toordinal()  # Household keeps date ordinals
+    columns['birth_date'] = array('i', (days - epoch for days in household.birth_days))
+    metadata['birth_date'] = {'unit': 'days since 1970-01-01'}
+    columns['adjustment_factor'] = summary['factors']
+    columns['total_kg'] = array('f' if args.float32 else 'd', summary['total_kg'])
+    metadata['total_kg'] = {'as_of': (args.today or date.today()).isoformat()}
+
+    header_path = ColumnarStore.write(args.output, columns, metadata)
+    print(f"Wrote {len(household)} rows to {header_path}")
+
+def inspect_command(args: argparse.Namespace) -> None:
+    """Print the columns of an export and a summary of each."""
+    with ColumnarReader(args.export) as reader:
+        print(f"{reader.rows} rows")
+        for name in reader.names:
+            column = reader[name]
+            if not reader.rows:
+                print(f"{name} ({column.format})")
+            elif isinstance(column, TextColumn):
+                print(f"{name} ({column.format}): first {column[0]!r}, last {column[-1]!r}")
+            else:
+                print(f"{name} ({column.format}): min {min(column)}, max {max(column)}, "
+                      f"mean {sum(column) / reader.rows:.4f}")
+
+def verify_command(args: argparse.Namespace) -> None:
+    """Check every answer combination; exit with status 1 if any check fails."""
+    report = OptionSpaceVerifier().run(args.age)
+    print(OptionSpaceVerifier.format_report(report))
+    if not report['passed']:
+        raise SystemExit(1)
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog='cli.py',
+        description="Poop Calculator batch tools (no window needed)."
+    )
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    yearly = commands.add_parser(
+        'yearly',
+        help="Cumulative lifetime totals per year for every profile in a CSV"
+    )
+    yearly.add_argument('input', help="Profiles CSV, or - for stdin")
+    yearly.add_argument(
+        '--years',
+        type=int,
+        default=TimeSeries.LIFE_EXPECTANCY_YEARS,
+        help="Number of year columns (default: %(default)s)"
+    )
+    yearly.add_argument(
+        '--today',
+        type=parse_date,
+        default=None,
+        help="Date to total up to, YYYY-MM-DD (default: today)"
+    )
+    yearly.set_defaults(handler=yearly_command)
+
+    attribute = commands.add_parser(
+        'attribute',
+        help="Per-step log-space contributions to each profile's adjustment factor"
+    )
+    attribute.add_argument('input', help="Profiles CSV, or - for stdin")
+    attribute.set_defaults(handler=attribute_command)
+
+    lookup = commands.add_parser(
+        'lookup',
+        help="Find answer combinations by adjustment factor or lifetime weight"
+    )
+    query = lookup.add_mutually_exclusive_group(required=True)
+    query.add_argument('--factor', nargs=2, type=float, metavar=('MIN', 'MAX'),
+                       help="Combinations with MIN <= factor <= MAX")
+    query.add_argument('--kg', nargs=2, type=float, metavar=('MIN', 'MAX'),
+                       help="Combinations whose lifetime total is between MIN and MAX kg (see --age)")
+    query.add_argument('--top', type=int, metavar='K', help="The K largest factors")
+    query.add_argument('--bottom', type=int, metavar='K', help="The K smallest factors")
+    lookup.add_argument('--age', type=float, default=TimeSeries.LIFE_EXPECTANCY_YEARS,
+                        help="Age in years for --kg (default: %(default)s)")
+    lookup.add_argument('--limit', type=int, default=20,
+                        help="Most combinations to list for a range (default: %(default)s)")
+    lookup.set_defaults(handler=lookup_command)
+
+    percentile = commands.add_parser(
+        'percentile',
+        help="Model-based percentile of each profile within its region: among "
+             "answer combinations, or among people when --priors is given"
+    )
+    percentile.add_argument('input', help="Profiles CSV, - for stdin, or an export directory")
+    percentile.add_argument('--priors', default=None,
+                            help="JSON file of per-region option weights (default: every option equally common)")
+    percentile.set_defaults(handler=percentile_command)
+
+    sketch = commands.add_parser(
+        'sketch',
+        help="Build, merge or show per-region/age-band session percentile stats"
+    )
+    sketch_actions = sketch.add_subparsers(dest='action', required=True)
+    build = sketch_actions.add_parser('build', help="Stats from profile CSVs, one session per profile")
+    build.add_argument('-o', '--output', required=True, help="Stats file to write")
+    build.add_argument('inputs', nargs='+', help="Profile CSVs, or - for stdin")
+    build.add_argument('--today', type=parse_date, default=None,
+                       help="Date to total up to, YYYY-MM-DD (default: today)")
+    merge = sketch_actions.add_parser('merge', help="Combine stats files")
+    merge.add_argument('-o', '--output', required=True, help="Stats file to write")
+    merge.add_argument('inputs', nargs='+', help="Stats files to combine")
+    merge.add_argument('--append', action='store_true',
+                       help="Add to the existing output instead of replacing it")
+    show = sketch_actions.add_parser('show', help="Summarize a stats file")
+    show.add_argument('stats', nargs='?', default=None,
+                      help="Stats file (default: the app's own stats file)")
+    sketch.set_defaults(handler=sketch_command)
+
+    export = commands.add_parser(
+        'export',
+        help="Write profiles from a CSV as memory-mappable .npy columns"
+    )
+    export.add_argument('input', help="Profiles CSV, or - for stdin")
+    export.add_argument('output', help="Directory for header.json and the .npy files")
+    export.add_argument(
+        '--float32',
+        action='store_true',
+        help="Store total_kg as float32 instead of float64"
+    )
+    export.add_argument(
+        '--today',
+        type=parse_date,
+        default=None,
+        help="Date to total up to, YYYY-MM-DD (default: today)"
+    )
+    export.set_defaults(handler=export_command)
+
+    inspect = commands.add_parser('inspect', help="Summarize a columnar export")
+    inspect.add_argument('export', help="Directory written by the export command")
+    inspect.set_defaults(handler=inspect_command)
+
+    verify = commands.add_parser(
+        'verify',
+        help="Run every answer combination through the calculator and report problems and speed"
+    )
+    verify.add_argument('--age', type=float, default=40.0,
+                        help="Age in years for the totals (default: %(default)s)")
+    verify.set_defaults(handler=verify_command)
+
+    return parser
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """Entry point for the command line tools."""
+    args = build_parser().parse_args(argv)
+    args.handler(args)
+
+if __name__ == "__main__":
+    main()
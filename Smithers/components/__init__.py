@@ -1,4 +1,9 @@
 # components/__init__.py
 from .progress_indicator import ProgressIndicator
+from .option_step_renderer import OptionStepRenderer
+from .step_navigator import StepNavigator
+from .lazy_date_entry import LazyDateEntry, PlainDateEntry
+from .lifetime_chart import LifetimeChart
+from .factor_chart import FactorChart
 
-__all__ = ['ProgressIndicator']
\ No newline at end of file
+__all__ = ['ProgressIndicator', 'OptionStepRenderer', 'StepNavigator', 'LazyDateEntry', 'PlainDateEntry', 'LifetimeChart', 'FactorChart']
\ No newline at end of file
@@ -0,0 +1,173 @@
+import math
+import tkinter as tk
+from typing import Dict, Any, List, Optional, Sequence, Tuple
+from styles import StyleConfig
+
+class FactorChart(tk.Canvas):
+    """
+    Tornado chart of adjustment factors: one row per factor, bars growing
+    right of the 1.0x line for factors that increase the total and left for
+    factors that reduce it (on a log scale, so 2x and 0.5x are equally long).
+    With several profiles each row holds one thin bar per profile.
+
+    Geometry is computed in layout() without touching Tk, so it can be done
+    on a worker thread; redraw() then moves pooled canvas items into place,
+    so new values or a new size reuse the existing items instead of
+    recreating them.
+    """
+
+    LABEL_WIDTH = 110
+    LEGEND_SPACING = 90
+    PADDING = 10
+    RESIZE_DELAY_MS = 80
+
+    def __init__(self, parent, **kwargs):
+        kwargs.setdefault('highlightthickness', 0)
+        kwargs.setdefault('bg', StyleConfig.COLOR_BACKGROUND)
+        super().__init__(parent, **kwargs)
+        self.labels: List[str] = []
+        self.series: List[Tuple[str, Sequence[float]]] = []
+        self.pools: Dict[str, List[int]] = {'bar': [], 'label': [], 'value': [], 'legend': []}
+        self.resize_job = None
+        self.cached_layout = None
+
+        self.axis = self.create_line(0, 0, 0, 0, fill=StyleConfig.COLOR_TEXT)
+        self.bind('<Configure>', self.on_resize)
+
+    def set_data(self, labels: Sequence[str], series: Sequence[Tuple[str, Sequence[float]]],
+                 layout: Optional[Dict[str, Any]] = None) -> None:
+        """
+        Show new factors.
+
+        Args:
+            labels: Row names
+            series: (profile name, one factor per label) for each profile
+            layout: layout() result computed ahead of time (e.g. on a worker
+                thread); used if it was made for the current canvas size
+        """
+        self.labels = list(labels)
+        self.series = list(series)
+        self.cached_layout = layout
+        self.redraw()
+
+    def on_resize(self, event):
+        """Redraw once resizing has paused."""
+        if self.resize_job is not None:
+            self.after_cancel(self.resize_job)
+        self.resize_job = self.after(self.RESIZE_DELAY_MS, self.redraw)
+
+    @classmethod
+    def layout(cls, labels: Sequence[str], series: Sequence[Tuple[str, Sequence[float]]],
+               width: int, height: int) -> Dict[str, Any]:
+        """
+        Compute every item's position.
+
+        Args:
+            labels: Row names
+            series: (profile name, one factor per label) for each profile
+            width: Canvas width in pixels
+            height: Canvas height in pixels
+
+        Returns:
+            Dict[str, Any]: The canvas 'size', 'axis' coordinates and lists
+            of 'bars' (x0, y0, x1, y1, series index), 'labels' (x, y, text),
+            'values' (x, y, text, anchor) and 'legend' (x, y, text, series
+            index), or None if the canvas is too small to draw in
+        """
+        if width <= cls.LABEL_WIDTH + 2 * cls.PADDING or height <= 3 * cls.PADDING:
+            return None
+
+        rows = len(labels)
+        plot_left = cls.LABEL_WIDTH
+        plot_right = width - cls.PADDING
+        center = (plot_left + plot_right) / 2
+        half_width = max((plot_right - plot_left) / 2 - 30, 1)  # Room for value text
+        row_height = (height - 3 * cls.PADDING) / max(rows, 1)
+        bar_height = row_height * 0.8 / max(len(series), 1)
+
+        logs = [[math.log(max(value, 1e-9)) for value in values] for _, values in series]
+        largest = max((abs(value) for values in logs for value in values), default=0.0) or 1.0
+
+        layout = {
+            'size': (width, height),
+            'axis': (center, cls.PADDING, center, height - 2 * cls.PADDING),
+            'bars': [],
+            'labels': [],
+            'values': [],
+            'legend': [],
+        }
+        for row, label in enumerate(labels):
+            top = cls.PADDING + row * row_height + row_height * 0.1
+            layout['labels'].append((plot_left - 5, top + row_height * 0.4, label))
+            for index, (_, values) in enumerate(series):
+                length = logs[index][row] / largest * half_width
+                y0 = top + index * bar_height
+                layout['bars'].append((center, y0, center + length, y0 + bar_height, index))
+                if len(series) == 1:
+                    anchor = tk.W if length >= 0 else tk.E
+                    offset = 3 if length >= 0 else -3
+                    layout['values'].append(
+                        (center + length + offset, y0 + bar_height / 2, f"{values[row]:.2f}x", anchor)
+                    )
+
+        if len(series) > 1:
+            for index, (name, _) in enumerate(series):
+                layout['legend'].append(
+                    (plot_left + index * cls.LEGEND_SPACING, height - cls.PADDING, name, index)
+                )
+        return layout
+
+    def redraw(self):
+        """Lay the chart out for the current size and update items in place."""
+        self.resize_job = None
+        size = (self.winfo_width(), self.winfo_height())
+        layout = self.cached_layout
+        if layout is None or layout['size'] != size:
+            layout = self.layout(self.labels, self.series, *size)
+            if layout is None:
+                return
+            self.cached_layout = layout
+        colors = (StyleConfig.COLOR_PRIMARY, StyleConfig.COLOR_ACCENT, StyleConfig.COLOR_SECONDARY)
+
+        self.coords(self.axis, *layout['axis'])
+
+        bars = self.get_items('bar', len(layout['bars']), lambda: self.create_rectangle(0, 0, 0, 0, width=0))
+        for item, (x0, y0, x1, y1, index) in zip(bars, layout['bars']):
+            self.coords(item, min(x0, x1), y0, max(x0, x1), y1)
+            self.itemconfigure(item, fill=colors[index % len(colors)], state=tk.NORMAL)
+
+        labels = self.get_items('label', len(layout['labels']), lambda: self.create_label(anchor=tk.E))
+        for item, (x, y, text) in zip(labels, layout['labels']):
+            self.coords(item, x, y)
+            self.itemconfigure(item, text=text, state=tk.NORMAL)
+
+        values = self.get_items('value', len(layout['values']), self.create_label)
+        for item, (x, y, text, anchor) in zip(values, layout['values']):
+            self.coords(item, x, y)
+            self.itemconfigure(item, text=text, anchor=anchor, state=tk.NORMAL)
+
+        legend = self.get_items('legend', len(layout['legend']), lambda: self.create_label(anchor=tk.W))
+        for item, (x, y, text, index) in zip(legend, layout['legend']):
+            self.coords(item, x, y)
+            self.itemconfigure(item, text=text, fill=colors[index % len(colors)], state=tk.NORMAL)
+
+    def create_label(self, **options) -> int:
+        """Create a text item in the chart's font and color."""
+        return self.create_text(
+            0, 0,
+            fill=StyleConfig.COLOR_TEXT,
+            font=StyleConfig.get_font("small"),
+            **options
+        )
+
+    def get_items(self, kind: str, count: int, create) -> List[int]:
+        """
+        Return `count` pooled items of a kind, creating any that are missing
+        and hiding the rest.
+        """
+        pool = self.pools[kind]
+        while len(pool) < count:
+            pool.append(create())
+        for item in pool[count:]:
+            self.itemconfigure(item, state=tk.HIDDEN)
+        return pool[:count]
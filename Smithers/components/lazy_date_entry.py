@@ -0,0 +1,88 @@
+import importlib
+from datetime import datetime
+import tkinter as tk
+from tkinter import ttk
+
+class PlainDateEntry(ttk.Entry):
+    """
+    Text entry with the small part of the tkcalendar.DateEntry API the app
+    uses (get_date, set_date, <<DateEntrySelected>>).
+    Used when tkcalendar is not installed.
+    """
+
+    DATE_FORMAT = '%Y-%m-%d'
+
+    def __init__(self, parent, year=None, font=None, width=15, **kwargs):
+        # Calendar-only options (colors, pattern, maxdate) are ignored
+        super().__init__(parent, width=width, font=font)
+        if year is not None:
+            self.insert(0, f"{year}-01-01")
+        self.bind('<Return>', self.on_commit)
+        self.bind('<FocusOut>', self.on_commit)
+
+    def get_date(self):
+        """Parse the entry as a date; raises ValueError if it isn't one."""
+        return datetime.strptime(self.get().strip(), self.DATE_FORMAT).date()
+
+    def set_date(self, date):
+        """Replace the entry text with a date."""
+        self.delete(0, tk.END)
+        self.insert(0, date.strftime(self.DATE_FORMAT))
+
+    def on_commit(self, event):
+        """Announce a valid date the same way DateEntry does."""
+        try:
+            self.get_date()
+        except ValueError:
+            return
+        self.event_generate('<<DateEntrySelected>>')
+
+
+class LazyDateEntry:
+    """
+    Loads tkcalendar (and its Babel locale data) only when a date entry is
+    about to be built, or during idle time after the first paint.
+    Falls back to PlainDateEntry if tkcalendar can't be imported.
+    """
+
+    _entry_class = None
+
+    @classmethod
+    def load(cls):
+        """
+        Import tkcalendar once and return the entry class to use.
+
+        Returns:
+            type: tkcalendar.DateEntry or PlainDateEntry
+        """
+        if cls._entry_class is None:
+            try:
+                cls._entry_class = importlib.import_module('tkcalendar').DateEntry
+            except ImportError:
+                cls._entry_class = PlainDateEntry
+        return cls._entry_class
+
+    @classmethod
+    def prefetch(cls, widget):
+        """
+        Schedule the import for when Tk is idle.
+
+        Args:
+            widget: Any widget, used to reach the event loop
+        """
+        if cls._entry_class is None:
+            widget.after_idle(cls.load)
+
+    @classmethod
+    def create(cls, parent, **kwargs):
+        """
+        Create a date entry, importing tkcalendar now if it wasn't prefetched.
+
+        Args:
+            parent: Parent widget
+            **kwargs: DateEntry options
+
+        Returns:
+            The created date entry widget
+        """
+        return cls.load()(parent, **kwargs)
@@ -0,0 +1,138 @@
+import tkinter as tk
+from helpers.time_series import TimeSeries
+from styles import StyleConfig
+
+class LifetimeChart(tk.Canvas):
+    """
+    Cumulative lifetime curve: a solid line up to today and a dashed
+    projection after it.
+    The day-resolution curve is downsampled to the canvas width, and the
+    same few canvas items are moved on every redraw instead of recreated.
+    """
+
+    PADDING = 30
+
+    def __init__(self, parent, **kwargs):
+        kwargs.setdefault('height', 200)
+        kwargs.setdefault('highlightthickness', 0)
+        kwargs.setdefault('bg', StyleConfig.COLOR_BACKGROUND)
+        super().__init__(parent, **kwargs)
+        self.curve = None
+        self.cached_layout = None
+
+        self.axis = self.create_line(0, 0, 0, 0, 0, 0, fill=StyleConfig.COLOR_TEXT)
+        self.history_line = self.create_line(0, 0, 0, 0, fill=StyleConfig.COLOR_PRIMARY, width=2)
+        self.projection_line = self.create_line(
+            0, 0, 0, 0,
+            fill=StyleConfig.COLOR_PRIMARY,
+            dash=(4, 3)
+        )
+        self.today_label = self.create_text(
+            0, 0,
+            anchor=tk.SW,
+            fill=StyleConfig.COLOR_TEXT,
+            font=StyleConfig.get_font("small")
+        )
+        self.total_label = self.create_text(
+            0, 0,
+            anchor=tk.NE,
+            fill=StyleConfig.COLOR_TEXT,
+            font=StyleConfig.get_font("small")
+        )
+        self.bind('<Configure>', lambda e: self.redraw())
+
+    def set_curve(self, curve, layout=None):
+        """
+        Show a curve from TimeSeries.build_lifetime_curve.
+
+        Args:
+            curve: Curve dictionary with 'cumulative' and 'today_index'
+            layout: layout() result computed ahead of time (e.g. on a worker
+                thread); used if it was made for the current canvas size
+        """
+        self.curve = curve
+        self.cached_layout = layout
+        self.redraw()
+
+    @classmethod
+    def layout(cls, curve, width, height):
+        """
+        Compute the chart geometry for a canvas size without touching Tk,
+        so it can be done off the UI thread.
+
+        Args:
+            curve: Curve dictionary with 'cumulative' and 'today_index'
+            width: Canvas width in pixels
+            height: Canvas height in pixels
+
+        Returns:
+            dict: Item coordinates and label texts, or None if the canvas
+            is too small to draw in
+        """
+        if width <= 2 * cls.PADDING or height <= 2 * cls.PADDING:
+            return None
+
+        values = curve['cumulative']
+        today_index = curve['today_index']
+        plot_width = width - 2 * cls.PADDING
+        plot_height = height - 2 * cls.PADDING
+        last_index = max(len(values) - 1, 1)
+        peak = values[-1] or 1.0
+
+        def to_canvas(index, value):
+            return (
+                cls.PADDING + index / last_index * plot_width,
+                height - cls.PADDING - value / peak * plot_height
+            )
+
+        # One point per pixel column is all the canvas can show
+        history = TimeSeries.downsample(values[:today_index + 1], max(int(plot_width * today_index / last_index), 2))
+        projection = TimeSeries.downsample(values[today_index:], max(int(plot_width) - len(history), 2))
+        history_coords = [c for index, value in history for c in to_canvas(index, value)]
+        projection_coords = [
+            c for index, value in projection for c in to_canvas(index + today_index, value)
+        ]
+        if len(history_coords) < 4:
+            history_coords *= 2  # A line needs two points
+        if len(projection_coords) < 4:
+            projection_coords *= 2
+
+        today_x, today_y = to_canvas(today_index, values[today_index])
+        return {
+            'size': (width, height),
+            'axis': (
+                cls.PADDING, cls.PADDING,
+                cls.PADDING, height - cls.PADDING,
+                width - cls.PADDING, height - cls.PADDING
+            ),
+            'history': history_coords,
+            'projection': projection_coords,
+            'today_label': (today_x + 4, today_y - 4, f"Today: {values[today_index]:,.0f} kg"),
+            'total_label': (
+                width - cls.PADDING,
+                cls.PADDING - 15,
+                f"By age {len(values) // TimeSeries.DAYS_PER_YEAR}: {values[-1]:,.0f} kg"
+            ),
+        }
+
+    def redraw(self):
+        """Fit the curve to the current canvas size."""
+        if self.curve is None:
+            return
+        size = (self.winfo_width(), self.winfo_height())
+        layout = self.cached_layout
+        if layout is None or layout['size'] != size:
+            layout = self.layout(self.curve, *size)
+            if layout is None:
+                return
+            self.cached_layout = layout
+
+        self.coords(self.axis, *layout['axis'])
+        self.coords(self.history_line, *layout['history'])
+        self.coords(self.projection_line, *layout['projection'])
+        for item, (x, y, text) in (
+            (self.today_label, layout['today_label']),
+            (self.total_label, layout['total_label']),
+        ):
+            self.coords(item, x, y)
+            self.itemconfigure(item, text=text)
@@ -0,0 +1,148 @@
+import tkinter as tk
+from tkinter import ttk
+from helpers.ui_helpers import UIHelper
+
+class OptionStepRenderer(ttk.Frame):
+    """
+    One reusable widget tree per layout type.
+    Catalog-driven steps don't build widgets of their own: when a step is
+    shown, the renderer for its layout is packed into the step's frame and
+    filled with that step's header, options and info text.
+    """
+
+    LAYOUTS = ('combobox', 'radio')
+
+    _renderers = {}  # (parent widget path, layout) -> renderer
+
+    @classmethod
+    def for_layout(cls, parent, layout):
+        """
+        Return the shared renderer for a layout, building it on first use.
+
+        Args:
+            parent: Common parent of the step frames
+            layout: One of LAYOUTS
+
+        Returns:
+            OptionStepRenderer: The shared renderer
+        """
+        if layout not in cls.LAYOUTS:
+            raise ValueError(f"Unknown step layout: {layout}")
+        key = (str(parent), layout)
+        renderer = cls._renderers.get(key)
+        if renderer is None or not renderer.winfo_exists():
+            renderer = cls(parent, layout)
+            cls._renderers[key] = renderer
+        return renderer
+
+    def __init__(self, parent, layout):
+        """
+        Build the widget tree once.
+
+        Args:
+            parent: Common parent of the step frames
+            layout: One of LAYOUTS
+        """
+        super().__init__(parent)
+        self.layout = layout
+        self.step = None
+        self.variable = tk.StringVar()
+        self.dropdown = None
+        self.radio_frame = None
+        self.radio_buttons = []
+
+        # Create a central content frame for vertical centering
+        spacer_top = ttk.Frame(self)
+        spacer_top.pack(expand=True)
+
+        content_frame = ttk.Frame(self)
+        content_frame.pack(expand=False)
+
+        # Create header label with reduced padding
+        self.header_label = ttk.Label(content_frame, style="Header.TLabel")
+        self.header_label.pack(pady=(0, 3))
+
+        if layout == 'combobox':
+            # Create options dropdown with specific width
+            self.dropdown = ttk.Combobox(
+                content_frame,
+                textvariable=self.variable,
+                state='readonly',
+                width=25  # Set specific width
+            )
+            self.dropdown.pack(pady=3)
+            self.dropdown.bind('<<ComboboxSelected>>', lambda e: self.on_select())
+        else:
+            # Radio buttons are pooled and re-labelled per step
+            self.radio_frame = ttk.Frame(content_frame)
+            self.radio_frame.pack(fill=tk.X, pady=3)
+
+        # Create info label with specific width and reduced padding
+        self.info_label = UIHelper.create_info_label(
+            content_frame,
+            "",
+            wraplength=300
+        )
+        self.info_label.pack(pady=5)
+
+        spacer_bottom = ttk.Frame(self)
+        spacer_bottom.pack(expand=True)
+
+    def show(self, step):
+        """
+        Fill the tree with a step's catalog and display it in the step's frame.
+
+        Args:
+            step: The OptionStep being shown
+        """
+        self.step = step
+        self.header_label.configure(text=step.HEADER)
+
+        labels = list(step.display_labels.keys())
+        if self.layout == 'combobox':
+            self.dropdown['values'] = labels
+        else:
+            self.fill_radio_buttons(step, labels)
+
+        self.variable.set(step.get_display_label(step.selected))
+        self.info_label.configure(text=step.info_text)
+
+        self.pack(in_=step.frame, fill=tk.BOTH, expand=True, padx=5, pady=5)
+        self.lift(step.frame)
+
+    def fill_radio_buttons(self, step, labels):
+        """Re-label pooled radio buttons, creating more only when needed."""
+        while len(self.radio_buttons) < len(labels):
+            radio_btn = ttk.Radiobutton(
+                self.radio_frame,
+                variable=self.variable,
+                command=self.on_select
+            )
+            self.radio_buttons.append(radio_btn)
+
+        for index, radio_btn in enumerate(self.radio_buttons):
+            if index < len(labels):
+                radio_btn.configure(
+                    text=step.option_label(labels[index]),
+                    value=labels[index]
+                )
+                radio_btn.pack(anchor=tk.W, pady=1)  # Reduced padding between radio buttons
+            else:
+                radio_btn.pack_forget()
+
+    def on_select(self):
+        """Forward a selection to the step currently using the tree."""
+        if self.step is not None:
+            self.step.on_option_change(self.variable.get())
+            self.info_label.configure(text=self.step.info_text)
+
+    def release(self, step):
+        """
+        Detach the tree from a step if that step is still using it.
+
+        Args:
+            step: The step giving up the tree
+        """
+        if self.step is step:
+            self.pack_forget()
+            self.step = None
@@ -79,6 +79,17 @@ class ProgressIndicator(ttk.Frame):
         if step_title:
             self.step_description.config(text=step_title)
 
+    def show_loading(self, text="Loading..."):
+        """
+        Show a placeholder while the steps are still being loaded.
+        
+        Args:
+            text: Status text to display
+        """
+        self.progress_bar["value"] = 0
+        self.step_label.config(text=text)
+        self.step_description.config(text="")
+
     def reset(self):
         """Reset the progress indicator to initial state."""
         self.current_step = 1
@@ -0,0 +1,149 @@
+from collections import OrderedDict
+
+class StepNavigator:
+    """
+    Shows one step at a time by stacking every step frame in the same grid
+    cell and raising the active one.
+    Switching touches only the step being shown, so it costs the same no
+    matter how many steps the wizard has.
+
+    Built steps are kept in least-recently-used order. When the number of
+    live steps or their estimated widget count exceeds the budget, the
+    coldest steps are destroyed and rebuilt on their next display. Steps
+    drawn by a shared tree (shares_widgets) stay out of the budget:
+    evicting one would free nothing.
+    """
+
+    def __init__(self, container, steps, max_live_steps=None, max_widgets=None, answers=None):
+        """
+        Stack the step frames inside a container.
+
+        Args:
+            container: Parent of every step frame
+            steps: Ordered list of Step instances
+            max_live_steps: Most steps allowed to keep their widgets (None = no limit)
+            max_widgets: Most widgets allowed across built steps (None = no limit)
+            answers: Stored answers used to restore rebuilt steps
+        """
+        self.container = container
+        self.steps = steps
+        self.max_live_steps = max_live_steps
+        self.max_widgets = max_widgets
+        self.answers = answers if answers is not None else {}
+        self.current_index = None   # Index of the visible step
+        self.previous_index = None  # Index of the step shown before it
+        self.live_steps = OrderedDict()  # Index -> widget count, coldest first
+        self.evicted = set()             # Indices whose widgets were destroyed
+
+        self.container.grid_rowconfigure(0, weight=1)
+        self.container.grid_columnconfigure(0, weight=1)
+        self.container.grid_propagate(False)
+        for step in self.steps:
+            step.frame.grid(row=0, column=0, sticky='nsew')
+
+    def show(self, index):
+        """
+        Raise the step at an index, building its widgets on first display.
+
+        Args:
+            index: Index of the step to show
+
+        Returns:
+            Step: The step now visible, or None for an invalid index
+        """
+        if not 0 <= index < len(self.steps):
+            return None
+
+        step = self.steps[index]
+        if not getattr(step, 'widgets_created', False):
+            step.create_widgets()
+            step.widgets_created = True
+            # Fresh widgets start at their defaults: put the stored answer
+            # (or what was entered before an eviction) back
+            self.evicted.discard(index)
+            step.restore_input({**self.answers, **step.inputs})
+            if not getattr(step, 'shares_widgets', False):
+                self.live_steps[index] = self.count_widgets(step.frame)
+        if index in self.live_steps:
+            self.live_steps.move_to_end(index)
+
+        step.frame.tkraise()
+        step.on_show()
+
+        if index != self.current_index:
+            self.previous_index = self.current_index
+            self.current_index = index
+
+        self.enforce_budget()
+        return step
+
+    def load_answers(self, answers):
+        """
+        Switch every step to another set of stored answers, e.g. a resumed
+        session or another profile. Built steps show them at once; the rest
+        pick them up when they are built.
+
+        Args:
+            answers: Stored answers keyed like store_input() results
+        """
+        self.answers = answers
+        for step in self.steps:
+            if not getattr(step, 'is_loaded', True):
+                continue  # Never imported, so nothing entered to forget
+            step.inputs = {}
+            if step.widgets_created:
+                step.restore_input(answers)
+
+    def back(self):
+        """
+        Return to the previously visible step, if any.
+
+        Returns:
+            Step: The step now visible, or None if there was no previous step
+        """
+        if self.previous_index is None:
+            return None
+        return self.show(self.previous_index)
+
+    def enforce_budget(self):
+        """Evict the least recently shown steps until the budget is met."""
+        while self.over_budget():
+            coldest = next(iter(self.live_steps))
+            if coldest == self.current_index:
+                break  # Never evict the visible step
+            self.evict(coldest)
+
+    def over_budget(self):
+        """Return True if the built steps exceed either limit."""
+        if self.max_live_steps is not None and len(self.live_steps) > self.max_live_steps:
+            return True
+        if self.max_widgets is not None and sum(self.live_steps.values()) > self.max_widgets:
+            return True
+        return False
+
+    def evict(self, index):
+        """
+        Destroy a step's widgets, keeping its current answer for the rebuild.
+
+        Args:
+            index: Index of the step to evict
+        """
+        step = self.steps[index]
+        snapshot = step.store_input()
+        if snapshot:
+            step.inputs = snapshot
+        step.destroy_widgets()
+        step.widgets_created = False
+        del self.live_steps[index]
+        self.evicted.add(index)
+
+    @staticmethod
+    def count_widgets(widget):
+        """Estimate a step's footprint as the number of widgets under it."""
+        count = 0
+        pending = list(widget.winfo_children())
+        while pending:
+            child = pending.pop()
+            count += 1
+            pending.extend(child.winfo_children())
+        return count
@@ -1,56 +1,177 @@
 # core.py
+import asyncio
 import tkinter as tk
+from datetime import date, datetime
 from tkinter import ttk
 from helpers.error_handlers import ErrorHandler
+from helpers.async_tk import AsyncTk
 from helpers.ui_helpers import UIHelper
+from helpers.glyph_support import GlyphSupport
+from helpers.boot_timeline import BootTimeline
+from helpers.data_processing import DataProcessor
+from models.household import Household
+from models.factor_distribution import FactorDistribution
+from models.what_if import WhatIf
+from models.session_stats import SessionStats
+from models.answer_journal import AnswerJournal
 from styles import StyleConfig
 from steps_manager import StepsManager
+from step_graph import StepGraph
 from components.progress_indicator import ProgressIndicator
+from components.step_navigator import StepNavigator
+from components.lazy_date_entry import LazyDateEntry
 
 class PoopCalculatorApp:
-    def __init__(self, root):
+    # Budget for built step UIs; colder steps are destroyed and rebuilt on demand
+    MAX_LIVE_STEPS = 4
+    MAX_LIVE_WIDGETS = None
+
+    # Fallback start for the deferred boot if the shell is never exposed
+    BOOT_FALLBACK_MS = 100
+
+    # Skip steps whose answers can't change the result under the current model.
+    # Off: the shipped model reads only diet and region, so this would hide
+    # most of the wizard (cli.py verify lists the steps it ignores)
+    SKIP_IRRELEVANT_STEPS = False
+
+    def __init__(self, root, timeline=None):
         """
         Initialize the Poop Calculator application.
+        Only the window shell and progress header are built here; steps are
+        loaded in idle chunks once the shell has been painted.
         
         Args:
             root: The root Tkinter window
+            timeline: Optional BootTimeline started by the caller
         """
         print("Initializing PoopCalculatorApp...")  # Debug print
         
         self.root = root
         self.root.title("Poop Calculator")
         self.root.geometry("600x500")  # Reduced size
+        self.timeline = timeline or BootTimeline()
         
         # Initialize variables
         self.current_step_index = 0
         self.current_step = None
-        self.user_data = {}
+        self.user_data = {}  # Answers of the active profile
+        self.household = Household()
+        self.active_profile = self.household.add("Profile 1")
+        self.profile_selector = None
         self.prev_button = None  # Initialize button variables
         self.next_button = None
+        self.steps_manager = None
+        self.steps = []
+        self.navigator = None
+        self.step_graph = None
+        self.boot_stages = None
+        self.results_job = None  # Future of results being computed
+        self.recorded_state = None  # Household state last added to the session stats
+        self.journal = self.open_journal()
+
+        # Background work runs on an asyncio loop beside the Tk mainloop
+        self.async_tk = AsyncTk(self.root)
+        self.sessions_lock = asyncio.Lock()
         
-        # Configure styles
-        StyleConfig.configure_styles()
+        # Configure styles (no-op if this interpreter is already styled)
+        StyleConfig.configure_styles(self.root)
+
+        # Decide on emoji vs plain-text labels before any step is built
+        GlyphSupport.probe(self.root)
         
         # Set up the UI first
         print("Setting up UI...")  # Debug print
         self.setup_ui()
+        self.set_navigation_enabled(False)
+        self.progress_indicator.show_loading()
+        self.timeline.mark('shell_built')
         print("UI setup complete")  # Debug print
-        
-        # Initialize steps manager and get steps
+
+        # Defer everything else until the shell is on screen
+        self.main_frame.bind('<Expose>', self.on_first_expose)
+        self.root.after(self.BOOT_FALLBACK_MS, self.start_boot)
+
+    def on_first_expose(self, event):
+        """Record the first paint and start loading steps."""
+        self.main_frame.unbind('<Expose>')
+        self.timeline.mark(BootTimeline.FIRST_PAINT)
+        self.start_boot()
+
+    def start_boot(self):
+        """Begin the deferred startup stages (only once)."""
+        if self.boot_stages is None:
+            self.boot_stages = self.boot_sequence()
+            self.root.after_idle(self.run_boot_stage)
+
+    def run_boot_stage(self):
+        """Run one startup chunk, then yield to the event loop."""
+        try:
+            next(self.boot_stages)
+        except StopIteration:
+            return
+        except Exception as e:
+            ErrorHandler.handle_exception(e)
+            return
+        self.root.after_idle(self.run_boot_stage)
+
+    def boot_sequence(self):
+        """
+        Deferred startup work, yielding between chunks so the window stays
+        responsive while steps load.
+        """
+        # Initialize steps manager, importing one step module per chunk
         print("Initializing steps manager...")  # Debug print
-        self.steps_manager = StepsManager(self.content_frame)
+        self.steps_manager = StepsManager(self.content_frame, autoload=False)
+        for _ in self.steps_manager.iter_load_steps():
+            yield
         self.steps = self.steps_manager.steps
+        self.timeline.mark('steps_loaded')
         print(f"Found {len(self.steps)} steps")  # Debug print
 
-        # Update progress indicator with total steps
-        self.progress_indicator.total_steps = len(self.steps)
-        if self.steps:
-            self.progress_indicator.update_progress(1, self.steps[0].title)
-        
+        # Stack the step frames so switching is a single raise
+        self.navigator = StepNavigator(
+            self.content_frame,
+            self.steps,
+            max_live_steps=self.MAX_LIVE_STEPS,
+            max_widgets=self.MAX_LIVE_WIDGETS,
+            answers=self.user_data
+        )
+
+        # Work out which steps can affect the result
+        self.step_graph = StepGraph(
+            [step.spec for step in self.steps],
+            self.household.table,
+            prune=self.SKIP_IRRELEVANT_STEPS
+        )
+        ErrorHandler.log_info(f"Skipping steps: {self.step_graph.get_skipped()}")
+        self.current_step_index = self.step_graph.first_index(self.user_data) or 0
+        yield
+
+        # Pick up where a crashed session left off
+        self.resume_session()
+
         # Show first step
         print("Showing first step...")  # Debug print
         self.show_current_step()
+        self.timeline.mark('first_step_built')
+        yield
+
+        self.set_navigation_enabled(True)
+        self.timeline.mark(BootTimeline.INTERACTIVE)
         print("Initialization complete")  # Debug print
+        ErrorHandler.log_info(f"Startup timings:\n{self.timeline.format_report()}")
+
+        # Load the calendar in idle time if the first step didn't need it
+        LazyDateEntry.prefetch(self.root)
+
+    def set_navigation_enabled(self, enabled):
+        """Enable or disable navigation (Previous stays off on the first step)."""
+        if self.next_button:
+            self.next_button.config(state='normal' if enabled else 'disabled')
+        if self.prev_button:
+            self.prev_button.config(
+                state='normal' if enabled and self.has_previous_step() else 'disabled'
+            )
 
     @ErrorHandler.handle_exception_decorator
     def setup_ui(self):
@@ -67,10 +188,35 @@ class PoopCalculatorApp:
         
         self.title_label = ttk.Label(
             self.header_frame,
-            text="💩 Poop Calculator",
+            text=GlyphSupport.text("💩 Poop Calculator"),
             style="Title.TLabel"
         )
         self.title_label.pack(side=tk.LEFT)
+
+        # Household profiles: everyone is edited through the same steps
+        ttk.Button(
+            self.header_frame,
+            text="−",
+            command=self.remove_profile,
+            width=2
+        ).pack(side=tk.RIGHT)
+        ttk.Button(
+            self.header_frame,
+            text="+",
+            command=self.add_profile,
+            width=2
+        ).pack(side=tk.RIGHT, padx=(0, 2))
+        self.profile_selector = ttk.Combobox(
+            self.header_frame,
+            state='readonly',
+            width=12
+        )
+        self.profile_selector.pack(side=tk.RIGHT, padx=(0, 2))
+        self.profile_selector.bind(
+            '<<ComboboxSelected>>',
+            lambda e: self.switch_profile(self.profile_selector.current())
+        )
+        self.refresh_profile_selector()
         
         # Progress Section with reduced padding
         self.progress_indicator = ProgressIndicator(self.main_frame, total_steps=0)
@@ -129,41 +275,48 @@ class PoopCalculatorApp:
             print("No steps found!")  # Debug print
             return
             
-        # Hide all steps
-        for step in self.steps:
-            step.frame.pack_forget()
-        
-        # Show current step
-        current_step = self.steps[self.current_step_index]
-        current_step.frame.pack(fill=tk.BOTH, expand=True)
-        
-        # Create widgets for current step if they haven't been created yet
-        if not hasattr(current_step, 'widgets_created'):
-            current_step.create_widgets()
-            current_step.widgets_created = True
+        # Raise the current step (its widgets are built on first display)
+        current_step = self.navigator.show(self.current_step_index)
+
+        # Results still being computed for a step we've left aren't wanted
+        self.cancel_results()
+
+        if getattr(current_step, 'display_results', None) is not None:
+            current_step.show_calculating()
+            self.start_results(
+                lambda computed: current_step.display_results(
+                    computed['results'],
+                    computed['household'],
+                    computed['what_if'],
+                    computed['prepared']
+                ),
+                prepare=current_step.prepare_results,
+                chart_size=current_step.get_chart_size()
+            )
         
         print("Updating navigation buttons...")  # Debug print
         # Update navigation buttons
+        has_previous = self.has_previous_step()
         if hasattr(self, 'prev_button') and self.prev_button:
             self.prev_button.config(
-                state='normal' if self.current_step_index > 0 else 'disabled',
-                text="← Previous" if self.current_step_index > 0 else ""
+                state='normal' if has_previous else 'disabled',
+                text="← Previous" if has_previous else ""
             )
         else:
             print("Previous button not found!")  # Debug print
             
         if hasattr(self, 'next_button') and self.next_button:
             self.next_button.config(
-                text="Finish →" if self.current_step_index == len(self.steps) - 1 else "Next →"
+                text="Finish →" if self.get_next_index(self.user_data) is None else "Next →"
             )
         else:
             print("Next button not found!")  # Debug print
         
-        # Update progress indicator
-        self.progress_indicator.update_progress(
-            self.current_step_index + 1,
-            current_step.title
-        )
+        # Update progress indicator, counting only the steps on this path
+        path = self.step_graph.path(self.user_data) if self.step_graph else range(len(self.steps))
+        position = sum(1 for index in path if index < self.current_step_index) + 1
+        self.progress_indicator.total_steps = max(len(path), position, 1)
+        self.progress_indicator.update_progress(position, current_step.title)
         print("Step display complete")  # Debug print
 
     @ErrorHandler.handle_exception_decorator
@@ -174,12 +327,20 @@ class PoopCalculatorApp:
         if current_step.validate():
             # Store the current step's data
             step_data = current_step.store_input()
+            next_index = self.get_next_index({**self.user_data, **(step_data or {})})
             if step_data:
+                self.write_journal(
+                    'record_answers',
+                    self.active_profile,
+                    step_data,
+                    self.current_step_index if next_index is None else next_index
+                )
                 self.user_data.update(step_data)
+                self.household.update(self.active_profile, self.user_data)
             
-            if self.current_step_index < len(self.steps) - 1:
+            if next_index is not None:
                 # Move to next step
-                self.current_step_index += 1
+                self.current_step_index = next_index
                 self.show_current_step()
             else:
                 # Final step completed
@@ -188,27 +349,366 @@ class PoopCalculatorApp:
     @ErrorHandler.handle_exception_decorator
     def previous_step(self):
         """Return to the previous step."""
-        if self.current_step_index > 0:
-            self.current_step_index -= 1
+        previous_index = self.get_previous_index()
+        if previous_index is not None:
+            self.current_step_index = previous_index
+            self.show_current_step()
+
+    def get_next_index(self, answers):
+        """The step after the current one for these answers, or None at the end."""
+        if self.step_graph is None:
+            following = self.current_step_index + 1
+            return following if following < len(self.steps) else None
+        return self.step_graph.next_index(self.current_step_index, answers)
+
+    def get_previous_index(self):
+        """The step Previous goes back to, or None on the first step."""
+        if self.step_graph is None:
+            return self.current_step_index - 1 if self.current_step_index > 0 else None
+        return self.step_graph.previous_index(self.current_step_index, self.user_data)
+
+    def has_previous_step(self):
+        """Whether there is a step to go back to."""
+        return self.get_previous_index() is not None
+
+    @ErrorHandler.handle_exception_decorator
+    def jump_to_step(self, index):
+        """
+        Show any step directly, e.g. from a review screen.
+        
+        Args:
+            index: Index of the step to show
+        """
+        if 0 <= index < len(self.steps) and index != self.current_step_index:
+            self.current_step_index = index
             self.show_current_step()
 
     @ErrorHandler.handle_exception_decorator
     def finish_calculation(self):
         """Process final calculations and show results."""
-        # Calculate final results
-        results = self.calculate_results()
-        
-        # Show results window
-        self.show_results(results)
+        # The session is complete, so there is nothing to resume after a crash
+        self.write_journal('finish')
+
+        # Add this session to the percentile stats (file I/O, off the UI thread),
+        # once: pressing Finish again without changing anything isn't a new session
+        self.household.update(self.active_profile, self.user_data)
+        state = self.household.get_state()
+        if state != self.recorded_state:
+            self.recorded_state = state
+            sessions = self.get_sessions(self.household.aggregate())
+            self.async_tk.run(self.record_sessions(sessions))
+
+        # Show results window once they're calculated
+        self.start_results(lambda computed: self.show_results(computed['results']))
+
+    def start_results(self, on_ready, prepare=None, chart_size=None):
+        """
+        Compute the active profile's results on the worker pool. Next is
+        disabled until they arrive; leaving the step cancels them.
+
+        Args:
+            on_ready: Called on the Tk thread with compute_results() output
+            prepare: Optional widget-free function run on the results too
+                (e.g. ResultsStep.prepare_results)
+            chart_size: Passed on to prepare
+        """
+        self.cancel_results()
+        self.household.update(self.active_profile, self.user_data)
+        if self.next_button:
+            self.next_button.config(state='disabled')
 
-    def calculate_results(self):
-        """Calculate final results based on user input."""
+        def deliver(computed):
+            if job is not self.results_job:
+                return  # Cancelled while it was running
+            self.results_job = None
+            if self.next_button:
+                self.next_button.config(state='normal')
+            on_ready(computed)
+
+        def fail(error):
+            if job is self.results_job:
+                self.cancel_results()
+                ErrorHandler.show_error(f"Could not calculate results: {error}")
+
+        job = self.async_tk.submit(
+            self.compute_results,
+            self.household.copy(),
+            self.active_profile,
+            dict(self.user_data),
+            prepare,
+            chart_size,
+            on_done=deliver,
+            on_error=fail
+        )
+        self.results_job = job
+
+    def cancel_results(self):
+        """Drop results that are still being computed."""
+        if self.results_job is not None:
+            self.results_job.cancel()
+            self.results_job = None
+            if self.next_button:
+                self.next_button.config(state='normal')
+
+    def compute_results(self, household, index, answers, prepare=None, chart_size=None):
+        """
+        Everything the results screens show, computed from a snapshot.
+        Runs on a worker thread, so it must not touch widgets or app state.
+
+        Args:
+            household: Household.copy() taken on the Tk thread
+            index: Profile to compute results for
+            answers: Copy of that profile's answers
+            prepare: Optional widget-free function called with the results,
+                chart_size and the household aggregate
+            chart_size: Passed on to prepare
+
+        Returns:
+            dict: 'results', 'household' (aggregate()), 'what_if' and
+            'prepared' (None without prepare)
+        """
+        results = self.build_results(household, index, answers)
+        summary = household.aggregate()
+        results['percentile'] = self.calculate_percentile(household, index, summary)
+        results['model_percentile'] = self.calculate_model_percentile(household, index, results)
         return {
-            "score": 0,
-            "recommendations": [],
-            "summary": "Results will be calculated here"
+            'results': results,
+            'household': summary,
+            'what_if': self.calculate_what_if(household, index, summary),
+            'prepared': prepare(results, chart_size, summary) if prepare is not None else None,
         }
 
+    def build_results(self, household, index, answers):
+        """
+        Calculate one profile's results.
+
+        Args:
+            household: Household holding the profile
+            index: Profile to calculate
+            answers: The profile's answers, passed through into the results
+        """
+        table = household.table
+        row = household.get_row(index)
+        birth_date = date.fromordinal(household.birth_days[index])
+
+        adjustment_factor = table.factor_of(row)
+        age_years = DataProcessor.calculate_days_alive(
+            datetime.combine(birth_date, datetime.min.time())
+        ) / 365
+        totals = DataProcessor.calculate_total_poop(
+            age_years,
+            DataProcessor.BASE_POOPS_PER_DAY,
+            DataProcessor.BASE_GRAMS_PER_POOP,
+            adjustment_factor
+        )
+        return {
+            **answers,
+            "age_years": age_years,
+            "poop_per_day": totals['average_per_day'],
+            "grams_per_poop": totals['adjusted_grams_per_poop'],
+            "total_poops": totals['total_poops'],
+            "adjustment_factor": adjustment_factor,
+            "factors": {
+                key: table.factors[key][code] for key, code in zip(table.keys, row)
+            }
+        }
+
+    def get_region(self, index, household=None):
+        """Return the region option a profile chose."""
+        if household is None:
+            household = self.household
+        return household.table.options['region'][household.columns['region'][index]]
+
+    def calculate_percentile(self, household, index, summary):
+        """
+        Place a profile among earlier sessions in its region and age band.
+
+        Args:
+            household: Household holding the profile
+            index: Profile to place
+            summary: household.aggregate() result
+
+        Returns:
+            (percentile, sessions) or None while there is too little data
+        """
+        try:
+            stats = SessionStats.load()
+        except (OSError, ValueError) as e:
+            ErrorHandler.log_error("Could not read session stats", e)
+            return None
+        return stats.percentile(
+            self.get_region(index, household),
+            summary['days'][index] / 365,
+            summary['total_kg'][index]
+        )
+
+    def calculate_model_percentile(self, household, index, results):
+        """
+        Place a profile's adjustment factor in the factor distribution of
+        its region (see FactorDistribution).
+
+        Args:
+            household: Household holding the profile
+            index: Profile to place
+            results: build_results() output
+        """
+        distribution = FactorDistribution.for_region(
+            household.table,
+            self.get_region(index, household)
+        )
+        return distribution.percentile(results['adjustment_factor'])
+
+    def get_sessions(self, household):
+        """Return (region, age in years, total kg) for every profile."""
+        return [
+            (self.get_region(index), household['days'][index] / 365, household['total_kg'][index])
+            for index in range(len(household['names']))
+        ]
+
+    async def record_sessions(self, sessions):
+        """
+        Add sessions to the saved stats, reading and writing the file on a
+        worker thread.
+
+        Args:
+            sessions: get_sessions() result (taken on the Tk thread)
+        """
+        async with self.sessions_lock:
+            try:
+                stats = await asyncio.to_thread(SessionStats.load)
+            except ValueError as e:
+                # Keep the unreadable file for inspection and start over
+                try:
+                    bad_path = await asyncio.to_thread(SessionStats.set_aside)
+                except OSError as move_error:
+                    ErrorHandler.log_error("Could not move unreadable session stats aside", move_error)
+                    return
+                ErrorHandler.log_error(f"Session stats were unreadable; moved to {bad_path}", e)
+                stats = SessionStats()
+            except OSError as e:
+                ErrorHandler.log_error("Could not read session stats", e)
+                return
+            for region, age_years, total_kg in sessions:
+                stats.record(region, age_years, total_kg)
+            try:
+                await asyncio.to_thread(stats.save)
+            except OSError as e:
+                ErrorHandler.log_error("Could not save session stats", e)
+
+    def calculate_what_if(self, household, index, summary):
+        """
+        Rank every single and paired answer change for a profile.
+
+        Args:
+            household: Household holding the profile
+            index: Profile to sweep
+            summary: household.aggregate() result (for days alive)
+        """
+        return WhatIf(household.table).sweep(
+            household.get_row(index),
+            summary['days'][index],
+            pairs=True
+        )
+
+    def refresh_profile_selector(self):
+        """Show the current profile names in the selector."""
+        if self.profile_selector is not None:
+            self.profile_selector['values'] = self.household.names
+            self.profile_selector.current(self.active_profile)
+
+    @ErrorHandler.handle_exception_decorator
+    def add_profile(self):
+        """Add a household member and switch to it."""
+        name = f"Profile {len(self.household) + 1}"
+        self.write_journal('add_profile', name, self.current_step_index)
+        index = self.household.add(name)
+        self.switch_profile(index)
+
+    @ErrorHandler.handle_exception_decorator
+    def remove_profile(self):
+        """Remove the active household member (one profile always remains)."""
+        if len(self.household) <= 1:
+            return
+        self.write_journal('remove_profile', self.active_profile, self.current_step_index)
+        self.household.remove(self.active_profile)
+        self.active_profile = None  # Nothing to save on the way out
+        self.switch_profile(0)
+
+    @ErrorHandler.handle_exception_decorator
+    def switch_profile(self, index):
+        """
+        Make another profile the one the steps edit.
+
+        Args:
+            index: Profile to switch to
+        """
+        if index == self.active_profile or not 0 <= index < len(self.household):
+            return
+
+        # Keep what was entered on the visible step, even if Next wasn't pressed
+        if self.active_profile is not None:
+            if self.navigator is not None and self.navigator.current_index is not None:
+                step_data = self.steps[self.navigator.current_index].store_input()
+                if step_data:
+                    self.user_data.update(step_data)
+            self.write_journal(
+                'record_answers', self.active_profile, self.user_data, self.current_step_index
+            )
+            self.household.update(self.active_profile, self.user_data)
+
+        # user_data is shared with the navigator, so replace it in place
+        self.write_journal('switch_profile', index, self.current_step_index)
+        self.active_profile = index
+        self.user_data.clear()
+        self.user_data.update(self.household.get_answers(index))
+        if self.navigator is not None:
+            self.navigator.load_answers(self.user_data)
+
+        self.refresh_profile_selector()
+        if self.steps:
+            self.show_current_step()
+
+    def open_journal(self):
+        """Open the autosave journal, or return None if it can't be used."""
+        try:
+            return AnswerJournal(
+                table=self.household.table,
+                schedule=lambda delay, sync: self.root.after(delay, self.write_journal, 'sync')
+            )
+        except OSError as e:
+            ErrorHandler.log_error("Could not open the autosave journal", e)
+            return None
+
+    def write_journal(self, method, *args):
+        """
+        Record a change before it is made (call AnswerJournal.<method>).
+        A journal that can't be written is turned off rather than
+        interrupting the session.
+        """
+        if self.journal is None:
+            return
+        try:
+            if not self.journal.has_session and method not in ('sync', 'finish'):
+                self.journal.start(self.household, self.active_profile, self.current_step_index)
+            getattr(self.journal, method)(*args)
+        except (OSError, ValueError) as e:
+            ErrorHandler.log_error("Autosave journal failed; autosave is off", e)
+            self.journal = None
+
+    def resume_session(self):
+        """Restore the profiles and step an unfinished session reached."""
+        if self.journal is None or not self.journal.has_session:
+            return
+        ErrorHandler.log_info("Resuming unfinished session")
+        self.household = self.journal.household.copy()
+        self.active_profile = self.journal.active_profile or 0
+        self.current_step_index = min(self.journal.step_index, max(len(self.steps) - 1, 0))
+        self.user_data.clear()
+        self.user_data.update(self.household.get_answers(self.active_profile))
+        if self.navigator is not None:
+            self.navigator.load_answers(self.user_data)
+        self.refresh_profile_selector()
+
     def show_results(self, results):
         """Display the final results to the user."""
         # Create results window with reduced size
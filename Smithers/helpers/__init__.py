@@ -1,7 +1,19 @@
 # helpers/__init__.py
-from .validation import ValidationHelper
-from .ui_helpers import UIHelper
-from .data_processing import DataProcessor
-from .error_handlers import ErrorHandler
+import importlib
 
-__all__ = ['ValidationHelper', 'UIHelper', 'DataProcessor', 'ErrorHandler']
\ No newline at end of file
+# Helpers are imported on first access so that Tk-free helpers (validation,
+# data processing) don't pull in tkinter through the UI helpers.
+_EXPORTS = {
+    'ValidationHelper': 'validation',
+    'UIHelper': 'ui_helpers',
+    'DataProcessor': 'data_processing',
+    'ErrorHandler': 'error_handlers'
+}
+
+__all__ = ['ValidationHelper', 'UIHelper', 'DataProcessor', 'ErrorHandler']
+
+def __getattr__(name):
+    if name in _EXPORTS:
+        module = importlib.import_module(f".{_EXPORTS[name]}", __name__)
+        return getattr(module, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
\ No newline at end of file
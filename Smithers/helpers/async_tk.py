@@ -0,0 +1,234 @@
+# helpers/async_tk.py
+import asyncio
+import concurrent.futures
+import queue
+import threading
+import tkinter as tk
+from typing import Any, Awaitable, Callable, Coroutine, Optional
+from helpers.error_handlers import ErrorHandler
+
+class AsyncTk:
+    """
+    Runs an asyncio event loop beside the Tk mainloop.
+
+    The asyncio loop lives on its own thread, so coroutines started from UI
+    callbacks never block Tk. Anything that has to touch widgets is posted
+    back through a queue that the Tk thread drains when it receives a
+    virtual event, so the UI wakes up exactly when there is work and never
+    polls. Generating that event from another thread needs a threaded Tcl
+    build; without one the Tk thread drains the queue every POLL_MS
+    instead. Only the Tk thread ever calls into widgets.
+
+    Blocking work (calculations, file I/O) goes to a shared thread pool,
+    either directly with submit() or from a coroutine with
+    asyncio.to_thread().
+    """
+
+    WAKE_EVENT = '<<AsyncTkWake>>'
+    MAX_WORKERS = 4
+    SHUTDOWN_TIMEOUT_S = 2.0
+    POLL_MS = 20   # Queue check interval when Tcl isn't threaded
+
+    def __init__(self, root: tk.Misc) -> None:
+        """
+        Start the asyncio loop thread.
+
+        Args:
+            root: The root Tkinter window (results are delivered on its thread)
+        """
+        self.root = root
+        self.loop = asyncio.new_event_loop()
+        self.executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=self.MAX_WORKERS,
+            thread_name_prefix='smithers-worker'
+        )
+        self.loop.set_default_executor(self.executor)
+        self._callbacks: queue.SimpleQueue = queue.SimpleQueue()
+        self._closed = False
+        self.threaded = self.is_threaded(root)
+        if self.threaded:
+            self.root.bind(self.WAKE_EVENT, self._drain, add='+')
+        else:
+            self.root.after(self.POLL_MS, self._poll)
+        self.root.bind('<Destroy>', self._on_destroy, add='+')
+        self._thread = threading.Thread(
+            target=self._run_loop,
+            name='smithers-asyncio',
+            daemon=True
+        )
+        self._thread.start()
+
+    @staticmethod
+    def is_threaded(root: tk.Misc) -> bool:
+        """Whether Tcl was built with threads, so other threads may call into it."""
+        try:
+            return root.tk.eval('set tcl_platform(threaded)') == '1'
+        except tk.TclError:
+            return False
+
+    def run(self, coroutine: Coroutine,
+            on_done: Optional[Callable[[Any], None]] = None,
+            on_error: Optional[Callable[[BaseException], None]] = None) -> concurrent.futures.Future:
+        """
+        Schedule a coroutine from the Tk thread (e.g. a button callback).
+
+        Args:
+            coroutine: Coroutine to run on the asyncio loop
+            on_done: Called on the Tk thread with the coroutine's result
+            on_error: Called on the Tk thread with its exception (default:
+                ErrorHandler.handle_exception)
+
+        Returns:
+            concurrent.futures.Future: Cancel it to cancel the coroutine;
+            callbacks are not called for a cancelled run
+        """
+        future = asyncio.run_coroutine_threadsafe(coroutine, self.loop)
+        future.add_done_callback(
+            lambda done: self.call_soon(self._deliver, done, on_done, on_error)
+        )
+        return future
+
+    def submit(self, function: Callable, *args,
+               on_done: Optional[Callable[[Any], None]] = None,
+               on_error: Optional[Callable[[BaseException], None]] = None) -> concurrent.futures.Future:
+        """
+        Run a blocking function on the worker pool. The function must not
+        touch widgets; use on_done for that.
+
+        Args:
+            function: Function to run on a worker thread
+            *args: Arguments to pass to it
+            on_done: Called on the Tk thread with the function's result
+            on_error: Called on the Tk thread with its exception (default:
+                ErrorHandler.handle_exception)
+
+        Returns:
+            concurrent.futures.Future: Cancelling it drops a call that hasn't
+            started; one that is already running can't be interrupted, so
+            on_done should check its result is still wanted
+        """
+        future = self.executor.submit(function, *args)
+        future.add_done_callback(
+            lambda done: self.call_soon(self._deliver, done, on_done, on_error)
+        )
+        return future
+
+    def callback(self, coroutine_function: Callable[..., Coroutine],
+                 on_done: Optional[Callable[[Any], None]] = None) -> Callable[..., concurrent.futures.Future]:
+        """
+        Wrap a coroutine function as a plain Tk callback (command=, bind()).
+
+        Args:
+            coroutine_function: async def to start on each call
+            on_done: Called on the Tk thread with each run's result
+        """
+        def start(*args, **kwargs):
+            return self.run(coroutine_function(*args, **kwargs), on_done)
+        return start
+
+    def call_soon(self, callback: Callable, *args) -> None:
+        """
+        Run a callback on the Tk thread. Safe to call from any thread.
+
+        Args:
+            callback: Function that may touch widgets
+            *args: Arguments to pass to it
+        """
+        if self._closed:
+            return
+        self._callbacks.put((callback, args))
+        if not self.threaded:
+            return  # Picked up by _poll()
+        try:
+            self.root.event_generate(self.WAKE_EVENT, when='tail')
+        except (RuntimeError, tk.TclError):
+            pass  # Window is gone or the mainloop has stopped
+
+    def on_ui(self, callback: Callable, *args) -> Awaitable:
+        """
+        Run a callback on the Tk thread and await its result from a coroutine,
+        e.g. to read a widget's value mid-task.
+        """
+        future: concurrent.futures.Future = concurrent.futures.Future()
+
+        def run_callback():
+            if future.set_running_or_notify_cancel():
+                try:
+                    future.set_result(callback(*args))
+                except Exception as e:
+                    future.set_exception(e)
+
+        self.call_soon(run_callback)
+        return asyncio.wrap_future(future)
+
+    def shutdown(self, wait: bool = True) -> None:
+        """
+        Cancel running coroutines and queued work, then stop the threads.
+
+        Args:
+            wait: Wait up to SHUTDOWN_TIMEOUT_S for the loop to finish
+                cancelling; without it the loop stops on its own
+        """
+        if self._closed:
+            return
+        self._closed = True
+        if self.loop.is_running():
+            self.loop.call_soon_threadsafe(self._cancel_all)
+        if wait:
+            self._thread.join(self.SHUTDOWN_TIMEOUT_S)
+        self.executor.shutdown(wait=False, cancel_futures=True)
+
+    def _run_loop(self) -> None:
+        asyncio.set_event_loop(self.loop)
+        try:
+            self.loop.run_forever()
+        finally:
+            self.loop.close()
+
+    def _cancel_all(self) -> None:
+        tasks = asyncio.all_tasks(self.loop)
+        for task in tasks:
+            task.cancel()
+        gathered = asyncio.gather(*tasks, return_exceptions=True)
+        gathered.add_done_callback(lambda _: self.loop.stop())
+
+    def _drain(self, event: Optional[tk.Event] = None) -> None:
+        while True:
+            try:
+                callback, args = self._callbacks.get_nowait()
+            except queue.Empty:
+                return
+            try:
+                callback(*args)
+            except Exception as e:
+                ErrorHandler.handle_exception(e)
+
+    def _poll(self) -> None:
+        self._drain()
+        if self._closed:
+            return
+        try:
+            self.root.after(self.POLL_MS, self._poll)
+        except tk.TclError:
+            pass  # Window is gone
+
+    @staticmethod
+    def _deliver(future: concurrent.futures.Future,
+                 on_done: Optional[Callable[[Any], None]],
+                 on_error: Optional[Callable[[BaseException], None]]) -> None:
+        if future.cancelled():
+            return
+        try:
+            result = future.result()
+        except Exception as e:
+            if on_error is None:
+                raise
+            on_error(e)
+            return
+        if on_done is not None:
+            on_done(result)
+
+    def _on_destroy(self, event: tk.Event) -> None:
+        if event.widget is self.root:
+            # Don't hold up closing the window while the loop winds down
+            self.shutdown(wait=False)
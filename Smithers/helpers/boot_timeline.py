@@ -0,0 +1,54 @@
+import time
+from typing import Dict, Optional
+
+class BootTimeline:
+    """
+    Records named startup milestones relative to when the app started, so
+    time-to-first-paint and time-to-interactive can be reported separately.
+    """
+
+    FIRST_PAINT = 'first_paint'
+    INTERACTIVE = 'interactive'
+
+    def __init__(self, start: Optional[float] = None) -> None:
+        """
+        Start a timeline.
+
+        Args:
+            start: perf_counter() value to measure from (defaults to now)
+        """
+        self.start = time.perf_counter() if start is None else start
+        self.marks: Dict[str, float] = {}
+
+    def mark(self, name: str) -> float:
+        """
+        Record a milestone the first time it is reached.
+
+        Args:
+            name: Milestone name
+
+        Returns:
+            float: Milliseconds from start to the milestone
+        """
+        if name not in self.marks:
+            self.marks[name] = (time.perf_counter() - self.start) * 1000
+        return self.marks[name]
+
+    def get(self, name: str) -> Optional[float]:
+        """Return a milestone in milliseconds, or None if not reached yet."""
+        return self.marks.get(name)
+
+    @property
+    def time_to_first_paint(self) -> Optional[float]:
+        return self.get(self.FIRST_PAINT)
+
+    @property
+    def time_to_interactive(self) -> Optional[float]:
+        return self.get(self.INTERACTIVE)
+
+    def format_report(self) -> str:
+        """Return every milestone in the order it was reached."""
+        return '\n'.join(
+            f"{name}: {elapsed:.1f} ms"
+            for name, elapsed in sorted(self.marks.items(), key=lambda item: item[1])
+        )
@@ -0,0 +1,296 @@
+# helpers/columnar_store.py
+import ast
+import json
+import mmap
+import os
+import sys
+from array import array
+from datetime import date, datetime
+from typing import Dict, Any, List, Optional, Sequence, Union
+
+class ColumnarStore:
+    """
+    Fixed-type columns saved as one .npy file each plus a header.json that
+    lists them, so results can be reopened without parsing.
+
+    The files are plain NPY version 1.0 (numpy.load(path, mmap_mode='r')
+    opens them too); they are written and read here with the standard
+    library only. ColumnarReader memory-maps them and hands out typed
+    memoryviews, so opening even very large exports copies nothing.
+    Text columns (e.g. profile names) are stored as fixed-width UTF-32
+    strings, numpy's '<U' type, and decoded one value at a time.
+    """
+
+    HEADER_FILE = 'header.json'
+    FORMAT_NAME = 'smithers-columns'
+    FORMAT_VERSION = 1
+    NPY_MAGIC = b'\x93NUMPY\x01\x00'
+    NPY_ALIGNMENT = 64
+
+    # array typecode -> NPY descr (little-endian)
+    DTYPES = {
+        'B': '|u1',  # option codes
+        'i': '<i4',  # dates as days since 1970-01-01
+        'f': '<f4',
+        'd': '<f8',
+    }
+    TEXT_DTYPE = '<U'   # Followed by the width in characters
+
+    EPOCH = date(1970, 1, 1)
+
+    @classmethod
+    def to_epoch_days(cls, value: date) -> int:
+        """Convert a date to days since 1970-01-01 (numpy's datetime64[D])."""
+        return value.toordinal() - cls.EPOCH.toordinal()
+
+    @classmethod
+    def from_epoch_days(cls, days: int) -> date:
+        """Convert days since 1970-01-01 back to a date."""
+        return date.fromordinal(days + cls.EPOCH.toordinal())
+
+    @classmethod
+    def write(cls, directory: str, columns: Dict[str, Union[array, Sequence[str]]],
+              metadata: Optional[Dict[str, Dict[str, Any]]] = None) -> str:
+        """
+        Write columns and their header.
+
+        Args:
+            directory: Output directory (created if needed)
+            columns: Column name -> array with a typecode from DTYPES, or a
+                list of strings for a text column
+            metadata: Optional extra header fields per column (e.g. the
+                option list a code column indexes into)
+
+        Returns:
+            str: Path of the header file
+
+        Raises:
+            ValueError: If columns differ in length or use another typecode
+        """
+        lengths = {len(values) for values in columns.values()}
+        if len(lengths) > 1:
+            raise ValueError("All columns must have the same number of rows")
+
+        os.makedirs(directory, exist_ok=True)
+        header = {
+            'format': cls.FORMAT_NAME,
+            'version': cls.FORMAT_VERSION,
+            'rows': lengths.pop() if lengths else 0,
+            'created': datetime.now().isoformat(timespec='seconds'),
+            'columns': {},
+        }
+        for name, values in columns.items():
+            file_name = f"{name}.npy"
+            path = os.path.join(directory, file_name)
+            if not isinstance(values, array):
+                dtype = cls.write_text_npy(path, values)
+            elif values.typecode in cls.DTYPES:
+                dtype = cls.DTYPES[values.typecode]
+                cls.write_npy(path, values)
+            else:
+                raise ValueError(f"Unsupported column type for {name}: {values.typecode}")
+            header['columns'][name] = {
+                'file': file_name,
+                'dtype': dtype,
+                **(metadata or {}).get(name, {}),
+            }
+
+        header_path = os.path.join(directory, cls.HEADER_FILE)
+        with open(header_path, 'w', encoding='utf-8') as file:
+            json.dump(header, file, indent=2, ensure_ascii=False)
+        return header_path
+
+    @classmethod
+    def write_npy(cls, path: str, values: array) -> None:
+        """Write one array as a 1-D NPY file."""
+        if sys.byteorder == 'big' and values.itemsize > 1:
+            values = array(values.typecode, values)
+            values.byteswap()
+
+        with open(path, 'wb') as file:
+            cls.write_npy_header(file, cls.DTYPES[values.typecode], len(values))
+            values.tofile(file)
+
+    @classmethod
+    def write_text_npy(cls, path: str, values: Sequence[str]) -> str:
+        """
+        Write strings as a 1-D NPY file of fixed-width UTF-32.
+
+        Returns:
+            str: The column's dtype
+        """
+        width = max(map(len, values), default=0) or 1
+        with open(path, 'wb') as file:
+            cls.write_npy_header(file, f"{cls.TEXT_DTYPE}{width}", len(values))
+            for value in values:
+                file.write(value.encode('utf-32-le').ljust(4 * width, b'\0'))
+        return f"{cls.TEXT_DTYPE}{width}"
+
+    @classmethod
+    def write_npy_header(cls, file, descr: str, rows: int) -> None:
+        """Write the magic and header of a 1-D NPY file."""
+        header = f"{{'descr': '{descr}', 'fortran_order': False, 'shape': ({rows},), }}"
+        # Pad so the data starts on an aligned offset, ending with a newline
+        unpadded = len(cls.NPY_MAGIC) + 2 + len(header) + 1
+        header += ' ' * (-unpadded % cls.NPY_ALIGNMENT) + '\n'
+        file.write(cls.NPY_MAGIC)
+        file.write(len(header).to_bytes(2, 'little'))
+        file.write(header.encode('latin1'))
+
+    @staticmethod
+    def read_npy_header(buffer) -> Dict[str, Any]:
+        """
+        Parse an NPY header.
+
+        Args:
+            buffer: Bytes-like view of the start of the file
+
+        Returns:
+            Dict[str, Any]: The header dictionary plus 'offset' (start of data)
+        """
+        if bytes(buffer[:6]) != b'\x93NUMPY':
+            raise ValueError("Not an NPY file")
+        major = buffer[6]
+        if major == 1:
+            length, start = int.from_bytes(buffer[8:10], 'little'), 10
+        else:
+            length, start = int.from_bytes(buffer[8:12], 'little'), 12
+        header = ast.literal_eval(bytes(buffer[start:start + length]).decode('latin1'))
+        header['offset'] = start + length
+        return header
+
+
+class TextColumn(Sequence[str]):
+    """
+    A text column over a mapped file: fixed-width UTF-32 values, each
+    decoded when it is read.
+    """
+
+    def __init__(self, data: memoryview, width: int) -> None:
+        self.data = data
+        self.item_size = 4 * width
+        self.format = f"{ColumnarStore.TEXT_DTYPE}{width}"
+
+    def __len__(self) -> int:
+        return len(self.data) // self.item_size
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("text column index out of range")
+        start = index * self.item_size
+        raw = bytes(self.data[start:start + self.item_size])
+        return raw.decode('utf-32-le').rstrip('\0')
+
+
+class ColumnarReader:
+    """
+    Opens a ColumnarStore export by memory-mapping each column.
+    Columns are memoryviews cast to the stored type (TextColumns for
+    text): indexing, slicing and iterating read straight from the mapped
+    file. Each file's NPY header is checked against the export's header,
+    so a truncated or mismatched column raises instead of being misread.
+
+    Use as a context manager (or call close()) to release the mappings.
+    """
+
+    # NPY descr -> memoryview format
+    FORMATS = {'|u1': 'B', '<i4': 'i', '<f4': 'f', '<f8': 'd'}
+
+    def __init__(self, directory: str) -> None:
+        """
+        Read the header; columns are mapped on first access.
+
+        Args:
+            directory: Directory written by ColumnarStore.write
+        """
+        self.directory = directory
+        with open(os.path.join(directory, ColumnarStore.HEADER_FILE), encoding='utf-8') as file:
+            self.header = json.load(file)
+        if self.header.get('format') != ColumnarStore.FORMAT_NAME:
+            raise ValueError(f"Not a columnar export: {directory}")
+        self.rows: int = self.header['rows']
+        self._maps: List[mmap.mmap] = []
+        self._views: List[memoryview] = []  # Every view over a mapping, for close()
+        self._columns: Dict[str, memoryview] = {}
+
+    @property
+    def names(self) -> List[str]:
+        return list(self.header['columns'])
+
+    def __getitem__(self, name: str) -> memoryview:
+        return self.column(name)
+
+    def column(self, name: str) -> Union[memoryview, TextColumn]:
+        """
+        Return a column as a typed, zero-copy view.
+
+        Args:
+            name: Column name from the header
+
+        Returns:
+            memoryview: One item per row (a TextColumn for text)
+
+        Raises:
+            ValueError: If the file's type or shape doesn't match the header,
+                or it holds fewer rows than the header says
+        """
+        if name not in self._columns:
+            info = self.header['columns'][name]
+            dtype = info['dtype']
+            if dtype.startswith(ColumnarStore.TEXT_DTYPE):
+                fmt = None
+                item_size = 4 * int(dtype[len(ColumnarStore.TEXT_DTYPE):])
+            else:
+                fmt = self.FORMATS[dtype]
+                item_size = array(fmt).itemsize
+                if fmt != 'B' and sys.byteorder == 'big':
+                    raise ValueError("Little-endian columns can't be mapped on this machine")
+
+            path = os.path.join(self.directory, info['file'])
+            with open(path, 'rb') as file:
+                mapped = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+            self._maps.append(mapped)
+            view = memoryview(mapped)
+            self._views.append(view)
+            npy_header = ColumnarStore.read_npy_header(view)
+            if npy_header.get('descr') != dtype or npy_header.get('fortran_order'):
+                raise ValueError(f"{path}: holds {npy_header.get('descr')}, header says {dtype}")
+            if tuple(npy_header.get('shape', ())) != (self.rows,):
+                raise ValueError(f"{path}: shape {npy_header.get('shape')}, header says {self.rows} rows")
+
+            size = self.rows * item_size
+            data = view[npy_header['offset']:npy_header['offset'] + size]
+            self._views.append(data)
+            if len(data) != size:
+                raise ValueError(f"{path}: truncated, {len(data)} of {size} data bytes")
+            if fmt is None:
+                column = TextColumn(data, item_size // 4)
+            else:
+                column = data.cast(fmt)
+                self._views.append(column)
+            self._columns[name] = column
+        return self._columns[name]
+
+    def options(self, name: str) -> Optional[List[str]]:
+        """Return the option list a code column indexes into, if any."""
+        return self.header['columns'][name].get('options')
+
+    def close(self) -> None:
+        """Release every view and mapping."""
+        self._columns.clear()
+        for view in reversed(self._views):
+            view.release()
+        self._views.clear()
+        for mapped in self._maps:
+            mapped.close()
+        self._maps.clear()
+
+    def __enter__(self) -> 'ColumnarReader':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
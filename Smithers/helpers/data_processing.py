@@ -1,8 +1,13 @@
 # helpers/data_processing.py
+import math
 from datetime import datetime
 from typing import Dict, Any, Union, List
 
 class DataProcessor:
+    # Baseline output before adjustment factors are applied
+    BASE_POOPS_PER_DAY = 1.0
+    BASE_GRAMS_PER_POOP = 128.0
+
     @staticmethod
     def calculate_age(birthdate: datetime) -> int:
         """Calculate age from birthdate"""
@@ -43,8 +48,8 @@ class DataProcessor:
         }
 
     @staticmethod
-    def calculate_adjustment_factor(inputs: Dict[str, Any]) -> float:
-        """Calculate overall adjustment factor from all inputs"""
+    def get_factors(inputs: Dict[str, Any]) -> Dict[str, float]:
+        """Return each factor the adjustment uses, in a fixed order"""
         factors = {
             'diet': inputs.get('diet', {}).get('factor', 1.0),
             'region': inputs.get('region', {}).get('factor', 1.0),
@@ -55,13 +60,54 @@ class DataProcessor:
             'stress': inputs.get('stress', {}).get('factor', 1.0),
             'medications': inputs.get('medications', {}).get('total_factor', 1.0)
         }
-        
+        return {name: float(factor) for name, factor in factors.items()}
+
+    @staticmethod
+    def calculate_adjustment_factor(inputs: Dict[str, Any]) -> float:
+        """Calculate overall adjustment factor from all inputs"""
         total_factor = 1.0
-        for factor in factors.values():
-            total_factor *= float(factor)
+        for factor in DataProcessor.get_factors(inputs).values():
+            total_factor *= factor
         
         return total_factor
 
+    @staticmethod
+    def log_factor(factor: float) -> float:
+        """Natural log of a factor (-inf for 0, which removes everything)"""
+        return math.log(factor) if factor > 0 else float('-inf')
+
+    @staticmethod
+    def attribute_adjustment_factor(inputs: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Split the adjustment factor into additive per-step contributions.
+        The factor is a product, so its log is the sum of the factors' logs:
+        each step's contribution is ln(the factor its stored answer gets),
+        and for answers stored by the steps they add up to ln(total_factor).
+        Positive contributions raise the total, negative ones lower it, and
+        exp(contribution) is that step's multiplier.
+
+        Returns:
+            Dict with 'total_factor', 'log_total' and 'contributions'
+            (step key -> log contribution, in the same keys and order as
+            FactorTable.attribute)
+        """
+        # Imported here: factor_table measures its factors with this module
+        from models.factor_table import OPTION_MODELS
+
+        contributions = {}
+        for model in OPTION_MODELS:
+            key = model.STORE_KEY
+            answer = {key: inputs[key]} if key in inputs else {}
+            contributions[key] = DataProcessor.log_factor(
+                DataProcessor.calculate_adjustment_factor(answer)
+            )
+        total_factor = DataProcessor.calculate_adjustment_factor(inputs)
+        return {
+            'total_factor': total_factor,
+            'log_total': DataProcessor.log_factor(total_factor),
+            'contributions': contributions
+        }
+
     @staticmethod
     def format_number(
         number: Union[int, float],
@@ -72,6 +118,15 @@ class DataProcessor:
             return f"{number:,}"
         return f"{number:,.{decimal_places}f}"
 
+    @staticmethod
+    def format_ordinal(number: int) -> str:
+        """Format 1 as "1st", 22 as "22nd", 13 as "13th" and so on"""
+        if 10 <= number % 100 <= 20:
+            suffix = 'th'
+        else:
+            suffix = {1: 'st', 2: 'nd', 3: 'rd'}.get(number % 10, 'th')
+        return f"{number}{suffix}"
+
     @staticmethod
     def generate_comparisons(total_kg: float) -> List[str]:
         """Generate fun comparisons based on total weight"""
@@ -1,7 +1,6 @@
 # helpers/error_handlers.py
 import logging
 import traceback
-from tkinter import messagebox
 from functools import wraps
 
 class ErrorHandler:
@@ -11,6 +10,12 @@ class ErrorHandler:
     """
     
     LOG_FORMAT = '%(asctime)s - %(levelname)s - %(message)s'
+
+    @staticmethod
+    def _messagebox():
+        """Import tkinter's messagebox on first use so headless code stays Tk-free."""
+        from tkinter import messagebox
+        return messagebox
     
     @classmethod
     def setup_logging(cls):
@@ -38,7 +43,7 @@ class ErrorHandler:
         )
         
         # Show user-friendly error message
-        messagebox.showerror(
+        ErrorHandler._messagebox().showerror(
             "Error",
             f"An error occurred: {error_message}\n\n"
             "The error has been logged. Please try again or contact support."
@@ -52,7 +57,7 @@ class ErrorHandler:
         Args:
             message: The error message to display
         """
-        messagebox.showerror("Error", message)
+        ErrorHandler._messagebox().showerror("Error", message)
 
     @staticmethod
     def show_warning(message):
@@ -62,7 +67,7 @@ class ErrorHandler:
         Args:
             message: The warning message to display
         """
-        messagebox.showwarning("Warning", message)
+        ErrorHandler._messagebox().showwarning("Warning", message)
 
     @staticmethod
     def show_info(message):
@@ -72,7 +77,7 @@ class ErrorHandler:
         Args:
             message: The information message to display
         """
-        messagebox.showinfo("Information", message)
+        ErrorHandler._messagebox().showinfo("Information", message)
 
     @staticmethod
     def handle_exception_decorator(func):
@@ -136,4 +141,13 @@ class ErrorHandler:
                 f"Traceback:\n{traceback.format_exc()}"
             )
         else:
-            logging.error(error_message)
\ No newline at end of file
+            logging.error(error_message)
+    @staticmethod
+    def log_info(message):
+        """
+        Log a diagnostic message (recorded when logging is set to INFO or lower).
+
+        Args:
+            message: The message to log
+        """
+        logging.info(message)
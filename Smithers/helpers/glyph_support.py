@@ -0,0 +1,197 @@
+import hashlib
+import json
+import os
+import platform
+import time
+import unicodedata
+from pathlib import Path
+from typing import Dict, Any, Iterable, Iterator, List, Optional, Tuple
+from models.birth_date_model import BirthDateModel
+from models.factor_table import OPTION_MODELS
+from models.results_model import ResultsModel
+from styles import StyleConfig
+
+class GlyphSupport:
+    """
+    Probes whether the UI font can draw the emoji used throughout the option
+    catalogs and swaps them for plain text when it can't.
+    The probe result is cached on disk per machine and font configuration.
+    """
+
+    # Models whose catalogs and help texts are shown in the UI
+    CATALOG_MODELS = OPTION_MODELS + (BirthDateModel, ResultsModel)
+
+    # Emoji presentation selector that may follow a glyph
+    EMOJI_SELECTOR = '\ufe0f'
+
+    # Unassigned code points that no font covers, one per UTF-16 width
+    MISSING_REFERENCES = ("\u0378", "\U0001FFFD")
+
+    CACHE_VERSION = 1
+
+    # Probe state
+    catalog_glyphs: Optional[Tuple[str, ...]] = None
+    emoji_supported = True
+    missing_glyphs: List[str] = []
+    probe_ms: Optional[float] = None
+    from_cache = False
+
+    @classmethod
+    def get_catalog_glyphs(cls) -> Tuple[str, ...]:
+        """Return every pictograph used in labels, options and results (cached)."""
+        if cls.catalog_glyphs is None:
+            cls.catalog_glyphs = cls.find_glyphs(cls.iter_catalog_texts())
+        return cls.catalog_glyphs
+
+    @classmethod
+    def iter_catalog_texts(cls) -> Iterator[str]:
+        """Yield every text from CATALOG_MODELS that can reach a label."""
+        def walk(value):
+            if isinstance(value, str):
+                yield value
+            elif isinstance(value, dict):
+                for key, item in value.items():
+                    yield from walk(key)
+                    yield from walk(item)
+
+        for model in cls.CATALOG_MODELS:
+            for name in ('OPTIONS', 'INFO_TEXT', 'HEADERS', 'COMPARISONS'):
+                yield from walk(getattr(model, name, None))
+
+    @classmethod
+    def find_glyphs(cls, texts: Iterable[str]) -> Tuple[str, ...]:
+        """
+        Pick the pictographs (Unicode symbols, with any emoji selector that
+        follows them) out of some texts.
+
+        Args:
+            texts: Texts to scan
+
+        Returns:
+            Tuple[str, ...]: Distinct glyphs in order of first use
+        """
+        glyphs = {}
+        for text in texts:
+            for index, char in enumerate(text):
+                if unicodedata.category(char) != 'So':
+                    continue
+                if text[index + 1:index + 2] == cls.EMOJI_SELECTOR:
+                    char += cls.EMOJI_SELECTOR
+                glyphs.setdefault(char, None)
+        return tuple(glyphs)
+
+    @staticmethod
+    def get_cache_path() -> Path:
+        """Return the per-user cache file for probe results."""
+        cache_root = os.environ.get('XDG_CACHE_HOME') or Path.home() / '.cache'
+        return Path(cache_root) / 'smithers' / 'glyph_probe.json'
+
+    @classmethod
+    def get_cache_key(cls, root, font) -> str:
+        """
+        Build a key that changes whenever the probe could give another answer.
+
+        Args:
+            root: The root Tkinter window
+            font: The tkfont.Font being probed
+
+        Returns:
+            str: Hex digest identifying machine, Tk build, font and glyph set
+        """
+        parts = [
+            str(cls.CACHE_VERSION),
+            platform.node(),
+            platform.system(),
+            str(root.tk.call('info', 'patchlevel')),
+            str(root.tk.call('tk', 'windowingsystem')),
+            json.dumps(font.actual(), sort_keys=True),
+            ''.join(cls.get_catalog_glyphs())
+        ]
+        return hashlib.sha1('\0'.join(parts).encode('utf-8')).hexdigest()
+
+    @classmethod
+    def load_cache(cls) -> Dict[str, Any]:
+        """Read cached probe results, ignoring unreadable files."""
+        try:
+            with open(cls.get_cache_path(), encoding='utf-8') as cache_file:
+                data = json.load(cache_file)
+            return data if isinstance(data, dict) else {}
+        except (OSError, ValueError):
+            return {}
+
+    @classmethod
+    def save_cache(cls, key: str, result: Dict[str, Any]) -> None:
+        """Store one probe result (best effort; kiosks may be read-only)."""
+        data = cls.load_cache()
+        data[key] = result
+        path = cls.get_cache_path()
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_suffix('.tmp')
+            with open(tmp_path, 'w', encoding='utf-8') as cache_file:
+                json.dump(data, cache_file)
+            os.replace(tmp_path, path)
+        except OSError:
+            pass
+
+    @classmethod
+    def probe(cls, root, glyphs: Optional[Iterable[str]] = None) -> bool:
+        """
+        Decide whether emoji can be shown, using the cache when possible.
+        Must run after the fonts exist and before any step is built.
+
+        Args:
+            root: The root Tkinter window
+            glyphs: Glyphs to check (defaults to get_catalog_glyphs())
+
+        Returns:
+            bool: True if every glyph can be rendered
+        """
+        glyphs = tuple(glyphs or cls.get_catalog_glyphs())
+        font = StyleConfig.get_font("regular")
+        key = cls.get_cache_key(root, font)
+
+        cached = cls.load_cache().get(key)
+        if isinstance(cached, dict) and 'missing' in cached:
+            cls.missing_glyphs = list(cached['missing'])
+            cls.probe_ms = cached.get('probe_ms')
+            cls.emoji_supported = not cls.missing_glyphs
+            cls.from_cache = True
+            return cls.emoji_supported
+
+        # Measuring forces Tk's fallback search, which is the cost we avoid later
+        start = time.perf_counter()
+        reference_widths = {font.measure(char) for char in cls.MISSING_REFERENCES}
+        missing = [
+            glyph for glyph in glyphs
+            if cls._is_missing(font.measure(glyph), reference_widths)
+        ]
+        cls.probe_ms = (time.perf_counter() - start) * 1000
+
+        cls.missing_glyphs = missing
+        cls.emoji_supported = not missing
+        cls.from_cache = False
+        cls.save_cache(key, {'missing': missing, 'probe_ms': cls.probe_ms})
+        return cls.emoji_supported
+
+    @staticmethod
+    def _is_missing(width: int, reference_widths: set) -> bool:
+        """A glyph drawn as nothing or as the missing-glyph box is unsupported."""
+        return width <= 0 or width in reference_widths
+
+    @classmethod
+    def text(cls, value: str) -> str:
+        """
+        Return display text with unsupported glyphs removed.
+
+        Args:
+            value: Text that may contain catalog glyphs
+
+        Returns:
+            str: The original text, or its plain-text form
+        """
+        if cls.emoji_supported or not value:
+            return value
+        for glyph in cls.missing_glyphs:
+            value = value.replace(glyph + ' ', '').replace(glyph, '')
+        return value.replace('\ufe0f', '').strip()
@@ -0,0 +1,214 @@
+# helpers/quantile_sketch.py
+import math
+import random
+import struct
+import sys
+from array import array
+from bisect import bisect_right
+from typing import List, Optional, Tuple
+
+class QuantileSketch:
+    """
+    KLL streaming quantile sketch.
+
+    Values go into a stack of compactors; when a level fills up it is
+    sorted and every other value (odd or even positions, chosen at random)
+    moves up a level with twice the weight. Memory stays around 3k values
+    however many are added, and ranks are accurate to roughly 1.7 / k of
+    the count. Sketches built separately (e.g. by parallel batch workers)
+    merge into one with the same guarantee.
+    """
+
+    DEFAULT_K = 200
+    SHRINK = 2 / 3  # Capacity ratio between a level and the one above it
+    MAGIC = b'KLL1'
+    _HEADER = struct.Struct('<4sHHQdd')  # magic, k, levels, count, min, max
+
+    def __init__(self, k: int = DEFAULT_K, seed: Optional[int] = None) -> None:
+        """
+        Create an empty sketch.
+
+        Args:
+            k: Accuracy parameter (size of the top compactor)
+            seed: Seed for the compaction coin flips (for repeatable tests)
+        """
+        self.k = k
+        self.count = 0
+        self.min_value = math.inf
+        self.max_value = -math.inf
+        self.compactors: List[List[float]] = [[]]
+        self._random = random.Random(seed)
+        self._size = 0
+        self._max_size = self.capacity(0)
+
+    def capacity(self, level: int) -> int:
+        """Number of values a level holds before it is compacted."""
+        depth = len(self.compactors) - level - 1
+        return int(math.ceil(self.k * self.SHRINK ** depth)) + 1
+
+    def update(self, value: float) -> None:
+        """Add one value."""
+        self.compactors[0].append(value)
+        self.count += 1
+        self._size += 1
+        if value < self.min_value:
+            self.min_value = value
+        if value > self.max_value:
+            self.max_value = value
+        if self._size >= self._max_size:
+            self.compress()
+
+    def merge(self, other: 'QuantileSketch') -> None:
+        """
+        Fold another sketch into this one.
+
+        Args:
+            other: Sketch to add (left unchanged)
+
+        Raises:
+            ValueError: If the sketches use different k (their compactor
+                capacities, and so their error bounds, don't line up)
+        """
+        if other.k != self.k:
+            raise ValueError(f"Can't merge a sketch with k={other.k} into one with k={self.k}")
+        while len(self.compactors) < len(other.compactors):
+            self._grow()
+        for level, values in enumerate(other.compactors):
+            self.compactors[level].extend(values)
+        self.count += other.count
+        self.min_value = min(self.min_value, other.min_value)
+        self.max_value = max(self.max_value, other.max_value)
+        self._update_size()
+        while self._size >= self._max_size:
+            self.compress()
+
+    def compress(self) -> None:
+        """Compact the lowest full level into the one above it."""
+        for level, values in enumerate(self.compactors):
+            if len(values) >= self.capacity(level):
+                if level + 1 == len(self.compactors):
+                    self._grow()
+                values.sort()
+                # An odd value out stays behind at this level
+                leftover = [values.pop()] if len(values) % 2 else []
+                offset = self._random.randint(0, 1)
+                self.compactors[level + 1].extend(values[offset::2])
+                self.compactors[level] = leftover
+                break
+        self._update_size()
+
+    def rank(self, value: float) -> float:
+        """
+        Estimated fraction of values less than or equal to a value.
+
+        Args:
+            value: Value to rank
+
+        Returns:
+            float: Between 0 and 1 (0 for an empty sketch)
+        """
+        if not self.count:
+            return 0.0
+        weight_below = 0
+        for level, values in enumerate(self.compactors):
+            weight_below += sum(1 for item in values if item <= value) << level
+        return min(weight_below / self.count, 1.0)
+
+    def quantile(self, fraction: float) -> float:
+        """
+        Estimated value at a fraction of the way through the sorted values.
+
+        Args:
+            fraction: 0 for the minimum, 0.5 for the median, 1 for the maximum
+
+        Returns:
+            float: The estimated value (nan for an empty sketch)
+        """
+        if not self.count:
+            return math.nan
+        if fraction <= 0:
+            return self.min_value
+        if fraction >= 1:
+            return self.max_value
+        items, cumulative = self._weighted_items()
+        position = bisect_right(cumulative, fraction * cumulative[-1])
+        return items[min(position, len(items) - 1)][0]
+
+    def to_bytes(self) -> bytes:
+        """Serialize to a compact binary form (about 8 bytes per retained value)."""
+        lengths = array('I', (len(values) for values in self.compactors))
+        values = array('d', (value for level in self.compactors for value in level))
+        if sys.byteorder == 'big':
+            lengths.byteswap()
+            values.byteswap()
+        return b''.join((
+            self._HEADER.pack(self.MAGIC, self.k, len(self.compactors), self.count,
+                              self.min_value, self.max_value),
+            lengths.tobytes(),
+            values.tobytes(),
+        ))
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> 'QuantileSketch':
+        """
+        Rebuild a sketch from to_bytes() output.
+
+        Raises:
+            ValueError: If the data isn't a serialized sketch
+        """
+        if len(data) < cls._HEADER.size:
+            raise ValueError("Truncated quantile sketch")
+        magic, k, levels, count, min_value, max_value = cls._HEADER.unpack_from(data)
+        if magic != cls.MAGIC:
+            raise ValueError("Not a quantile sketch")
+
+        sketch = cls(k)
+        sketch.count = count
+        sketch.min_value = min_value
+        sketch.max_value = max_value
+
+        offset = cls._HEADER.size
+        lengths = _unpack_array('I', data, offset, levels)
+        offset += lengths.itemsize * levels
+        values = _unpack_array('d', data, offset, sum(lengths))
+        if offset + values.itemsize * len(values) != len(data):
+            raise ValueError("Corrupt quantile sketch")
+
+        sketch.compactors = []
+        start = 0
+        for length in lengths:
+            sketch.compactors.append(list(values[start:start + length]))
+            start += length
+        sketch._update_size()
+        return sketch
+
+    def _grow(self) -> None:
+        self.compactors.append([])
+
+    def _update_size(self) -> None:
+        self._size = sum(len(values) for values in self.compactors)
+        self._max_size = sum(self.capacity(level) for level in range(len(self.compactors)))
+
+    def _weighted_items(self) -> Tuple[List[Tuple[float, int]], List[int]]:
+        items = sorted(
+            (value, 1 << level)
+            for level, values in enumerate(self.compactors)
+            for value in values
+        )
+        cumulative = []
+        total = 0
+        for _, weight in items:
+            total += weight
+            cumulative.append(total)
+        return items, cumulative
+
+
+def _unpack_array(typecode: str, data: bytes, offset: int, count: int) -> array:
+    values = array(typecode)
+    end = offset + values.itemsize * count
+    if end > len(data):
+        raise ValueError("Truncated quantile sketch")
+    values.frombytes(data[offset:end])
+    if sys.byteorder == 'big':
+        values.byteswap()
+    return values
@@ -0,0 +1,125 @@
+# helpers/time_series.py
+from array import array
+from datetime import date, datetime
+from itertools import accumulate, repeat
+from typing import Dict, Any, List, Optional, Sequence, Tuple
+
+class TimeSeries:
+    """
+    Day-by-day lifetime curves and their reduction to chart or table size.
+    """
+
+    LIFE_EXPECTANCY_YEARS = 80
+    DAYS_PER_YEAR = 365  # Same year length the calculator uses for ages
+
+    @staticmethod
+    def cumulative(daily_values: Sequence[float]) -> array:
+        """
+        Running total of a day-resolution series.
+
+        Args:
+            daily_values: Amount for each day
+
+        Returns:
+            array: float64 cumulative totals, one per day
+        """
+        return array('d', accumulate(daily_values))
+
+    @classmethod
+    def build_lifetime_curve(
+        cls,
+        birth_date: date,
+        kg_per_day: float,
+        today: Optional[date] = None,
+        life_expectancy_years: Optional[float] = None
+    ) -> Dict[str, Any]:
+        """
+        Cumulative output from birth to the projected end of life.
+
+        Args:
+            birth_date: First day of the curve
+            kg_per_day: Adjusted daily output in kilograms
+            today: Date splitting history from projection (defaults to today)
+            life_expectancy_years: Length of the projection (defaults to
+                LIFE_EXPECTANCY_YEARS, extended to at least today)
+
+        Returns:
+            Dict[str, Any]: 'cumulative' (kg per day since birth),
+            'today_index' and 'birth_date'
+        """
+        today = today or datetime.now().date()
+        years = life_expectancy_years or cls.LIFE_EXPECTANCY_YEARS
+        today_index = max((today - birth_date).days, 0)
+        total_days = max(int(years * cls.DAYS_PER_YEAR), today_index + 1)
+        return {
+            'birth_date': birth_date,
+            'today_index': min(today_index, total_days - 1),
+            'cumulative': cls.cumulative(repeat(kg_per_day, total_days)),
+        }
+
+    @staticmethod
+    def yearly_totals(cumulative: Sequence[float], days_per_year: int = DAYS_PER_YEAR) -> List[float]:
+        """
+        Cumulative value at the end of each full year of a daily curve.
+
+        Args:
+            cumulative: Day-resolution cumulative series
+            days_per_year: Samples per year
+
+        Returns:
+            List[float]: One value per complete year
+        """
+        return list(cumulative[days_per_year - 1::days_per_year])
+
+    @staticmethod
+    def downsample(values: Sequence[float], threshold: int) -> List[Tuple[int, float]]:
+        """
+        Reduce a series to at most `threshold` points with
+        Largest-Triangle-Three-Buckets, which keeps the points that matter
+        most to the shape of the line.
+
+        Args:
+            values: Series sampled at x = 0, 1, 2, ...
+            threshold: Number of points wanted (e.g. the chart's pixel width)
+
+        Returns:
+            List[Tuple[int, float]]: (index, value) pairs, first and last kept
+        """
+        size = len(values)
+        if threshold >= size:
+            return list(enumerate(values))
+        if threshold < 3:
+            return [(0, values[0]), (size - 1, values[-1])]
+
+        sampled = [(0, values[0])]
+        bucket_size = (size - 2) / (threshold - 2)
+        previous = 0
+
+        for bucket in range(threshold - 2):
+            start = int(bucket * bucket_size) + 1
+            end = int((bucket + 1) * bucket_size) + 1
+
+            # Average of the next bucket is the third triangle corner
+            next_start = end
+            next_end = min(int((bucket + 2) * bucket_size) + 1, size)
+            count = next_end - next_start
+            average_x = (next_start + next_end - 1) / 2
+            average_y = sum(values[next_start:next_end]) / count
+
+            previous_y = values[previous]
+            best_index = start
+            best_area = -1.0
+            for index in range(start, end):
+                area = abs(
+                    (previous - average_x) * (values[index] - previous_y)
+                    - (previous - index) * (average_y - previous_y)
+                )
+                if area > best_area:
+                    best_area = area
+                    best_index = index
+
+            sampled.append((best_index, values[best_index]))
+            previous = best_index
+
+        sampled.append((size - 1, values[-1]))
+        return sampled
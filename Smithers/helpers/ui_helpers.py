@@ -2,6 +2,7 @@
 import tkinter as tk
 from tkinter import ttk
 from styles import StyleConfig
+from helpers.glyph_support import GlyphSupport
 
 class UIHelper:
     """
@@ -23,8 +24,8 @@ class UIHelper:
         """
         label = ttk.Label(
             parent,
-            text=text,
-            font=(StyleConfig.FONT_FAMILY, StyleConfig.FONT_SIZES["regular"]),
+            text=GlyphSupport.text(text),
+            font=StyleConfig.get_font("regular"),
             foreground=StyleConfig.COLOR_SECONDARY,
             **kwargs
         )
@@ -124,7 +125,7 @@ class UIHelper:
             frame,
             yscrollcommand=scrollbar.set,
             wrap=tk.WORD,
-            font=(StyleConfig.FONT_FAMILY, StyleConfig.FONT_SIZES["regular"]),
+            font=StyleConfig.get_font("regular"),
             **kwargs
         )
         text_widget.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
@@ -148,7 +149,7 @@ class UIHelper:
         """
         header = ttk.Label(
             parent,
-            text=text,
+            text=GlyphSupport.text(text),
             style="Header.TLabel",
             **kwargs
         )
@@ -188,32 +189,115 @@ class UIHelper:
     def create_tooltip(widget, text):
         """
         Create a tooltip for a widget.
+        All tooltips share one pooled window, so hovering creates no widgets.
+        Calling this again on the same widget just updates the text.
         
         Args:
             widget: Widget to add tooltip to
             text: Tooltip text
         """
-        def show_tooltip(event):
-            tooltip = tk.Toplevel()
-            tooltip.wm_overrideredirect(True)
-            tooltip.wm_geometry(f"+{event.x_root+10}+{event.y_root+10}")
-            
-            label = ttk.Label(
-                tooltip,
-                text=text,
-                justify=tk.LEFT,
-                background=StyleConfig.COLOR_SECONDARY,
-                foreground="white",
-                relief="solid",
-                borderwidth=1,
-                padding=(5, 2)
-            )
-            label.pack()
-            
-            def hide_tooltip():
-                tooltip.destroy()
-            
-            widget.tooltip = tooltip
-            widget.bind('<Leave>', lambda e: hide_tooltip())
-            
-        widget.bind('<Enter>', show_tooltip)
\ No newline at end of file
+        TooltipPool.attach(widget, text)
+
+
+class TooltipPool:
+    """
+    A single tooltip window shared by every widget in the application.
+    The window is created on first use and then only moved, re-labelled,
+    shown and withdrawn.
+    """
+
+    SHOW_DELAY_MS = 500   # Hover time before a tooltip appears
+    HIDE_DELAY_MS = 100   # Grace period so moving between widgets doesn't flicker
+
+    _window = None
+    _label = None
+    _owner = None         # Widget whose tooltip is showing
+    _pending = None       # (widget, after id) of the scheduled show/hide
+
+    @classmethod
+    def attach(cls, widget, text):
+        """
+        Register tooltip text for a widget, binding its events only once.
+        
+        Args:
+            widget: Widget to add tooltip to
+            text: Tooltip text
+        """
+        widget.tooltip_text = GlyphSupport.text(text)
+        if getattr(widget, 'tooltip_bound', False):
+            if cls._owner is widget:
+                cls._label.configure(text=widget.tooltip_text)
+            return
+
+        widget.bind('<Enter>', lambda e: cls._on_enter(widget), add='+')
+        widget.bind('<Leave>', lambda e: cls._on_leave(widget), add='+')
+        widget.bind('<ButtonPress>', lambda e: cls.hide(), add='+')
+        widget.tooltip_bound = True
+
+    @classmethod
+    def _on_enter(cls, widget):
+        cls._cancel_pending()
+        if cls._owner is not None:
+            # Already showing: move straight to the new widget
+            cls._show(widget)
+        else:
+            cls._schedule(widget, cls.SHOW_DELAY_MS, lambda: cls._show(widget))
+
+    @classmethod
+    def _on_leave(cls, widget):
+        cls._cancel_pending()
+        cls._schedule(widget, cls.HIDE_DELAY_MS, cls.hide)
+
+    @classmethod
+    def _schedule(cls, widget, delay, callback):
+        cls._pending = (widget, widget.after(delay, callback))
+
+    @classmethod
+    def _cancel_pending(cls):
+        if cls._pending is not None:
+            widget, after_id = cls._pending
+            cls._pending = None
+            try:
+                widget.after_cancel(after_id)
+            except tk.TclError:
+                pass  # Widget was destroyed in the meantime
+
+    @classmethod
+    def _ensure_window(cls, widget):
+        """Create the shared window the first time (or after the root died)."""
+        if cls._window is not None and cls._window.winfo_exists():
+            return
+        cls._window = tk.Toplevel(widget.winfo_toplevel())
+        cls._window.withdraw()
+        cls._window.wm_overrideredirect(True)
+        cls._label = ttk.Label(
+            cls._window,
+            justify=tk.LEFT,
+            background=StyleConfig.COLOR_SECONDARY,
+            foreground="white",
+            relief="solid",
+            borderwidth=1,
+            padding=(5, 2)
+        )
+        cls._label.pack()
+
+    @classmethod
+    def _show(cls, widget):
+        cls._pending = None
+        if not widget.winfo_exists():
+            return
+        cls._ensure_window(widget)
+        x, y = widget.winfo_pointerxy()
+        cls._label.configure(text=widget.tooltip_text)
+        cls._window.wm_geometry(f"+{x + 10}+{y + 10}")
+        cls._window.deiconify()
+        cls._window.lift()
+        cls._owner = widget
+
+    @classmethod
+    def hide(cls):
+        """Hide the tooltip if it is showing."""
+        cls._cancel_pending()
+        if cls._window is not None and cls._window.winfo_exists():
+            cls._window.withdraw()
+        cls._owner = None
@@ -3,7 +3,7 @@ import tkinter as tk
 from tkinter import ttk
 from core import PoopCalculatorApp
 from helpers.error_handlers import ErrorHandler
-from styles import StyleConfig
+from helpers.boot_timeline import BootTimeline
 
 def main():
     """
@@ -11,15 +11,16 @@ def main():
     Initializes the root window and starts the application.
     """
     try:
+        # Start the startup clock before anything touches Tk
+        timeline = BootTimeline()
+
         # Create the root window
         root = tk.Tk()
         root.title("Poop Calculator")
+        timeline.mark('root_created')
         
-        # Configure the style
-        StyleConfig.configure_styles()
-        
-        # Create and start the application
-        app = PoopCalculatorApp(root)
+        # Create the application shell; steps load once it is painted
+        app = PoopCalculatorApp(root, timeline=timeline)
         
         # Start the main event loop
         root.mainloop()
@@ -0,0 +1,86 @@
+# models/__init__.py
+from typing import Dict, Any, List, Optional, Tuple
+from helpers.validation import ValidationHelper
+
+class StepModel:
+    """
+    Tk-free half of a step: what can be answered, how an answer is validated
+    and the shape store_input() produces.
+    Views in steps/ render a model; batch, server and benchmark code can
+    import models alone without loading Tk.
+    """
+    STORE_KEY: str = ''
+    FIELD_NAME: str = ''
+    INFO_TEXT: Optional[str] = None  # Fixed help text shown with the step
+
+    @classmethod
+    def validate(cls, answer: Any) -> Tuple[bool, str]:
+        """
+        Validate an answer.
+
+        Returns:
+            Tuple[bool, str]: (is_valid, error_message)
+        """
+        return True, ""
+
+    @classmethod
+    def store(cls, answer: Any) -> Dict[str, Any]:
+        """
+        Return the stored form of an answer, keyed by STORE_KEY.
+        """
+        return {}
+
+
+class OptionStepModel(StepModel):
+    """
+    A step answered by picking one option from a fixed catalog.
+    """
+    OPTIONS: Dict[str, Dict[str, Any]] = {}
+    DEFAULT_OPTION: str = ''
+    STORE_SHAPE: str = 'data'              # 'data' or 'factor' (see store())
+    REQUIRED_MESSAGE: Optional[str] = None  # Custom message for an empty answer
+
+    @classmethod
+    def get_option_keys(cls) -> List[str]:
+        """Return the option keys in catalog order."""
+        return list(cls.OPTIONS.keys())
+
+    @classmethod
+    def validate(cls, answer: Any) -> Tuple[bool, str]:
+        """Validate that the answer is one of the catalog options."""
+        if not answer and cls.REQUIRED_MESSAGE:
+            return False, cls.REQUIRED_MESSAGE
+        return ValidationHelper.validate_selection(
+            answer,
+            cls.get_option_keys(),
+            cls.FIELD_NAME
+        )
+
+    @classmethod
+    def store(cls, answer: str) -> Dict[str, Any]:
+        """
+        Return the stored form of a selection.
+        'data' steps store the option under "data"; 'factor' steps store
+        its factor at the top level and the option under "details".
+        """
+        option = cls.OPTIONS[answer]
+        if cls.STORE_SHAPE == 'factor':
+            return {
+                cls.STORE_KEY: {
+                    "selection": answer,
+                    "factor": option["factor"],
+                    "details": option
+                }
+            }
+        return {
+            cls.STORE_KEY: {
+                "selection": answer,
+                "data": option
+            }
+        }
+
+    @classmethod
+    def get_stored_selection(cls, answers: Dict[str, Any]) -> Optional[str]:
+        """Return the selection stored in a set of answers, if valid."""
+        selection = answers.get(cls.STORE_KEY, {}).get("selection")
+        return selection if selection in cls.OPTIONS else None
@@ -0,0 +1,41 @@
+# models/activity_model.py
+from models import OptionStepModel
+
+class ActivityModel(OptionStepModel):
+    STORE_KEY = "activity_level"
+    FIELD_NAME = "activity level"
+    DEFAULT_OPTION = "🏃 Active"
+
+    INFO_TEXT = (
+        "🏃 Tips for maintaining activity:\n"
+        "• Incorporate daily exercise\n"
+        "• Take regular breaks during work\n"
+        "• Stay hydrated"
+    )
+
+    OPTIONS = {
+        "🧘 Sedentary": {
+            "factor": 0.8,
+            "desc": "Low physical activity",
+            "impact": "10% decrease in regularity",
+            "recommendation": "Consider light exercise",
+            "details": "Low activity may slow digestion",
+            "tips": "Take short walks throughout the day"
+        },
+        "🏃 Active": {
+            "factor": 1.0,
+            "desc": "Moderate physical activity",
+            "impact": "No significant impact",
+            "recommendation": "Maintain current activity level",
+            "details": "Regular exercise supports healthy digestion",
+            "tips": "Incorporate daily exercise routines"
+        },
+        "🏋️ Very Active": {
+            "factor": 1.2,
+            "desc": "High physical activity",
+            "impact": "15% increase in regularity",
+            "recommendation": "Stay hydrated",
+            "details": "High activity promotes efficient digestion",
+            "tips": "Ensure adequate hydration during workouts"
+        }
+    }
\ No newline at end of file
@@ -0,0 +1,283 @@
+# models/answer_journal.py
+import os
+import struct
+import zlib
+from array import array
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional
+from models.birth_date_model import BirthDateModel
+from models.factor_table import FactorTable
+from models.household import Household
+
+class AnswerJournal:
+    """
+    Append-only autosave of an in-progress session, so a crash or power
+    cut loses at most the last few answers.
+
+    Each record is a length and CRC32 followed by the payload: a kind, the
+    profile, the step to resume at and, for answers, the profile's option
+    codes and birth date (a few bytes). Records are flushed as they are
+    written and fsynced in batches (every FSYNC_EVERY records, or
+    FSYNC_INTERVAL_MS after the first unsynced one).
+
+    The journal mirrors the session it records by applying every record to
+    its own Household, which is what recovery rebuilds by replaying the file
+    in one pass. A torn or corrupt tail is cut off at the last good record.
+    Past COMPACT_BYTES the file is rewritten as one record per profile.
+    """
+
+    ADD_PROFILE = 1
+    REMOVE_PROFILE = 2
+    SWITCH_PROFILE = 3
+    ANSWERS = 4
+
+    FSYNC_EVERY = 16
+    FSYNC_INTERVAL_MS = 250
+    COMPACT_BYTES = 64 * 1024
+
+    MAGIC = b'SMJ1'
+    _HEADER = struct.Struct('<4sB')    # magic, number of option columns
+    _FRAME = struct.Struct('<HI')      # payload length, CRC32 of payload
+    _RECORD = struct.Struct('<BHH')    # kind, profile, step to resume at
+    _BIRTH_DAY = struct.Struct('<i')   # date ordinal
+
+    def __init__(self, path: Optional[Path] = None, table: Optional[FactorTable] = None,
+                 schedule: Optional[Callable[[int, Callable[[], None]], Any]] = None) -> None:
+        """
+        Open the journal, recovering whatever an earlier run left in it.
+
+        Args:
+            path: Journal file (defaults to get_data_path())
+            table: Option encoding (a new FactorTable by default)
+            schedule: Timer function like Tk's after(ms, callback), used to
+                fsync a partial batch; without it only full batches and
+                close() fsync
+
+        Raises:
+            OSError: If the file can't be opened
+        """
+        self.path = Path(path or self.get_data_path())
+        self.table = table or FactorTable()
+        self.schedule = schedule
+        self.unsynced = 0
+        self.sync_scheduled = False
+        self.reset_state()
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.file = open(self.path, 'a+b')
+        self.recover()
+
+    @staticmethod
+    def get_data_path() -> Path:
+        """Return the per-user journal file."""
+        data_root = os.environ.get('XDG_DATA_HOME') or Path.home() / '.local' / 'share'
+        return Path(data_root) / 'smithers' / 'session.journal'
+
+    def reset_state(self) -> None:
+        """Forget the mirrored session."""
+        self.household = Household(self.table)
+        self.active_profile: Optional[int] = None
+        self.step_index = 0
+
+    @property
+    def has_session(self) -> bool:
+        """Whether there is an unfinished session to resume."""
+        return len(self.household) > 0
+
+    def recover(self) -> None:
+        """
+        Rebuild the mirrored session from the file and cut off anything
+        after the last intact record.
+        """
+        self.file.seek(0)
+        data = self.file.read()
+        self.reset_state()
+
+        header = self._HEADER.pack(self.MAGIC, len(self.table.keys))
+        if data[:self._HEADER.size] != header:
+            # Empty, from another version, or garbage: start a fresh file
+            self.rewrite([])
+            return
+
+        offset = self._HEADER.size
+        while offset + self._FRAME.size <= len(data):
+            length, checksum = self._FRAME.unpack_from(data, offset)
+            start = offset + self._FRAME.size
+            payload = data[start:start + length]
+            if len(payload) != length or zlib.crc32(payload) != checksum:
+                break
+            try:
+                self.apply(payload)
+            except (ValueError, IndexError, struct.error):
+                break
+            offset = start + length
+
+        if offset != len(data):
+            self.file.truncate(offset)
+            self.sync()
+
+    def apply(self, payload: bytes) -> None:
+        """
+        Apply one record to the mirrored session.
+
+        Raises:
+            ValueError: If the record is not valid for the current state
+        """
+        kind, profile, step = self._RECORD.unpack_from(payload)
+        body = payload[self._RECORD.size:]
+        if kind == self.ADD_PROFILE:
+            self.household.add(body.decode('utf-8'))
+        elif not 0 <= profile < len(self.household):
+            raise ValueError(f"No profile {profile}")
+        elif kind == self.REMOVE_PROFILE:
+            self.household.remove(profile)
+        elif kind == self.ANSWERS:
+            columns = len(self.table.keys)
+            row = array(FactorTable.CODE_TYPE, body[:columns])
+            for key, code in zip(self.table.keys, row):
+                if code >= len(self.table.options[key]):
+                    raise ValueError(f"Bad {key} code {code}")
+                self.household.columns[key][profile] = code
+            self.household.birth_days[profile] = self._BIRTH_DAY.unpack_from(body, columns)[0]
+        elif kind != self.SWITCH_PROFILE:
+            raise ValueError(f"Unknown record kind {kind}")
+        self.active_profile = profile if kind != self.REMOVE_PROFILE else None
+        self.step_index = step
+
+    def start(self, household: Household, active_profile: int, step: int = 0) -> None:
+        """
+        Begin journaling a session from its current state.
+
+        Args:
+            household: Profiles so far (copied)
+            active_profile: Profile being edited
+            step: Step to resume at
+        """
+        self.household = household.copy()
+        self.active_profile = active_profile
+        self.step_index = step
+        self.compact()
+
+    def encode(self, kind: int, profile: int = 0, step: int = 0, body: bytes = b'') -> bytes:
+        """Frame one record."""
+        payload = self._RECORD.pack(kind, profile, step) + body
+        return self._FRAME.pack(len(payload), zlib.crc32(payload)) + payload
+
+    def append(self, kind: int, profile: int = 0, step: int = 0, body: bytes = b'') -> None:
+        """
+        Write one record, fsyncing when a batch is complete.
+
+        Raises:
+            OSError: If the record can't be written
+        """
+        record = self.encode(kind, profile, step, body)
+        self.apply(record[self._FRAME.size:])
+        self.file.write(record)
+        self.file.flush()
+        self.unsynced += 1
+
+        if self.file.tell() > self.COMPACT_BYTES:
+            self.compact()
+        elif self.unsynced >= self.FSYNC_EVERY:
+            self.sync()
+        elif self.schedule is not None and not self.sync_scheduled:
+            self.sync_scheduled = True
+            self.schedule(self.FSYNC_INTERVAL_MS, self.sync)
+
+    def add_profile(self, name: str, step: int = 0) -> None:
+        """Record a new profile (it becomes the active one)."""
+        self.append(self.ADD_PROFILE, len(self.household), step, name.encode('utf-8'))
+
+    def remove_profile(self, profile: int, step: int = 0) -> None:
+        """Record a removed profile."""
+        self.append(self.REMOVE_PROFILE, profile, step)
+
+    def switch_profile(self, profile: int, step: int = 0) -> None:
+        """Record a change of active profile."""
+        self.append(self.SWITCH_PROFILE, profile, step)
+
+    def record_answers(self, profile: int, answers: Dict[str, Any], step: int) -> None:
+        """
+        Record a store_input() result.
+
+        Args:
+            profile: Profile the answers belong to
+            answers: The step's answers (folded into the profile's codes)
+            step: Step to resume at
+        """
+        body = self.encode_profile(profile, answers)
+        self.append(self.ANSWERS, profile, step, body)
+
+    def encode_profile(self, profile: int, answers: Optional[Dict[str, Any]] = None) -> bytes:
+        """Return a profile's codes and birth date, with answers applied."""
+        household = self.household
+        row = household.get_row(profile)
+        birth_day = household.birth_days[profile]
+        if answers:
+            for column, key in enumerate(self.table.keys):
+                selection = self.table.models[key].get_stored_selection(answers)
+                if selection is not None:
+                    row[column] = self.table.codes[key][selection]
+            birth_date = BirthDateModel.get_stored_date(answers)
+            if birth_date is not None:
+                birth_day = birth_date.toordinal()
+        return row.tobytes() + self._BIRTH_DAY.pack(birth_day)
+
+    def finish(self) -> None:
+        """Record a completed session: there is nothing left to resume."""
+        self.reset_state()
+        self.rewrite([])
+
+    def compact(self) -> None:
+        """Rewrite the file as the shortest records that rebuild the session."""
+        records = []
+        for profile, name in enumerate(self.household.names):
+            records.append(self.encode(self.ADD_PROFILE, profile, 0, name.encode('utf-8')))
+            records.append(self.encode(self.ANSWERS, profile, 0, self.encode_profile(profile)))
+        if self.active_profile is not None:
+            records.append(self.encode(self.SWITCH_PROFILE, self.active_profile, self.step_index))
+        self.rewrite(records)
+
+    def rewrite(self, records) -> None:
+        """
+        Atomically replace the file with a header and the given records.
+
+        Raises:
+            OSError: If the file can't be written
+        """
+        tmp_path = self.path.with_suffix('.tmp')
+        with open(tmp_path, 'wb') as tmp_file:
+            tmp_file.write(self._HEADER.pack(self.MAGIC, len(self.table.keys)))
+            tmp_file.writelines(records)
+            tmp_file.flush()
+            os.fsync(tmp_file.fileno())
+        self.file.close()
+        os.replace(tmp_path, self.path)
+        self.file = open(self.path, 'a+b')
+        self.sync_directory()
+        self.unsynced = 0
+
+    def sync(self) -> None:
+        """Fsync everything written so far."""
+        self.sync_scheduled = False
+        if self.file.closed:
+            return
+        self.file.flush()
+        os.fsync(self.file.fileno())
+        self.unsynced = 0
+
+    def sync_directory(self) -> None:
+        """Make a rename durable (where the platform allows it)."""
+        if not hasattr(os, 'O_DIRECTORY'):
+            return
+        fd = os.open(self.path.parent, os.O_RDONLY | os.O_DIRECTORY)
+        try:
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+
+    def close(self) -> None:
+        """Fsync and close the file."""
+        if not self.file.closed:
+            self.sync()
+            self.file.close()
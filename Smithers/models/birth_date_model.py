@@ -0,0 +1,56 @@
+# models/birth_date_model.py
+from datetime import date, datetime
+from typing import Dict, Any, Optional, Tuple
+from models import StepModel
+
+class BirthDateModel(StepModel):
+    STORE_KEY = "birth_date"
+    FIELD_NAME = "birth date"
+    DEFAULT_YEAR = 2000
+    MAX_AGE_YEARS = 120
+    DATE_FORMAT = '%Y-%m-%d'
+
+    INFO_TEXT = (
+        "📅 Select your birth date using the calendar.\n"
+        "This helps us provide age-appropriate recommendations."
+    )
+
+    @staticmethod
+    def calculate_age(selected_date: date, today: Optional[date] = None) -> int:
+        """Return the age in whole years (365-day years, as stored)."""
+        today = today or datetime.now().date()
+        return (today - selected_date).days // 365
+
+    @classmethod
+    def validate(cls, answer: Any) -> Tuple[bool, str]:
+        """Validate that a birth date is a real, past date within a lifetime."""
+        if not isinstance(answer, date):
+            return False, "Please select a valid birth date"
+
+        # Check if date is not in the future
+        if answer > datetime.now().date():
+            return False, "Birth date cannot be in the future"
+
+        # Check if age is reasonable (e.g., less than 120 years)
+        if cls.calculate_age(answer) > cls.MAX_AGE_YEARS:
+            return False, "Please enter a valid birth date"
+
+        return True, ""
+
+    @classmethod
+    def store(cls, answer: date) -> Dict[str, Any]:
+        """Return the stored form of a birth date."""
+        return {
+            cls.STORE_KEY: {
+                "date": answer.strftime(cls.DATE_FORMAT),
+                "age": cls.calculate_age(answer)
+            }
+        }
+
+    @classmethod
+    def get_stored_date(cls, answers: Dict[str, Any]) -> Optional[date]:
+        """Return the birth date stored in a set of answers, if any."""
+        stored_date = answers.get(cls.STORE_KEY, {}).get("date")
+        if not stored_date:
+            return None
+        return datetime.strptime(stored_date, cls.DATE_FORMAT).date()
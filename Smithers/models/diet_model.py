@@ -0,0 +1,36 @@
+# models/diet_model.py
+from models import OptionStepModel
+
+class DietModel(OptionStepModel):
+    STORE_KEY = "diet"
+    FIELD_NAME = "diet type"
+    DEFAULT_OPTION = "Balanced diet"
+    STORE_SHAPE = 'factor'
+    REQUIRED_MESSAGE = "Please select a diet type"
+
+    OPTIONS = {
+        "Balanced diet": {
+            "factor": 1.0,
+            "desc": "Normal bowel movement frequency",
+            "icon": "🥗",
+            "details": "High in fiber, fruits, and vegetables",
+            "impact": "Supports regular bowel movements",
+            "tips": "Maintain a variety of whole foods"
+        },
+        "High fiber diet": {
+            "factor": 1.2,
+            "desc": "Increase due to high fiber content",
+            "icon": "🥕",
+            "details": "High in vegetables, fruits, and whole grains",
+            "impact": "May increase bowel movements",
+            "tips": "Gradually increase fiber intake"
+        },
+        "Low fiber diet": {
+            "factor": 0.8,
+            "desc": "Decrease due to low fiber content",
+            "icon": "🥩",
+            "details": "Low in fiber, high in processed foods",
+            "impact": "May cause irregular bowel movements",
+            "tips": "Try to incorporate more whole foods"
+        }
+    }
\ No newline at end of file
@@ -0,0 +1,175 @@
+# models/factor_distribution.py
+import json
+from array import array
+from bisect import bisect_left
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+from models.factor_table import FactorTable
+
+class FactorDistribution:
+    """
+    Exact distribution of the adjustment factor over the whole option
+    space for one region, weighting each combination by how common its
+    options are there (a prior per step, steps treated as independent).
+    Without priors every option counts the same, so a percentile ranks
+    answer combinations, not people (see describe_population()).
+
+    Because the factor is a product of per-step factors, the distribution
+    is built by folding steps in one at a time over the distinct factor
+    values seen so far, which gives the same result as weighting all
+    combinations without enumerating them. The result is a sorted array of
+    factors with the cumulative weight below each, so a percentile is one
+    binary search.
+    """
+
+    REGION_KEY = 'region'
+    DEFAULT_REGION = '*'   # Priors used for regions without their own
+    ROUND_DIGITS = 12      # Products that differ only by rounding are one value
+
+    # region -> step key -> option -> relative weight. Steps and regions not
+    # listed treat every option as equally common.
+    PRIORS: Dict[str, Dict[str, Dict[str, float]]] = {}
+
+    _cache: Dict[Tuple[tuple, str, str], 'FactorDistribution'] = {}
+
+    def __init__(self, table: FactorTable, region: str,
+                 priors: Optional[Dict[str, Dict[str, Dict[str, float]]]] = None) -> None:
+        """
+        Build the distribution (use for_region() to share cached ones).
+
+        Args:
+            table: Option encoding and per-step factors
+            region: Region option the distribution is conditioned on
+            priors: Option weights (defaults to PRIORS)
+        """
+        self.table = table
+        self.region = region
+        priors = self.PRIORS if priors is None else priors
+        region_priors = priors.get(region, priors.get(self.DEFAULT_REGION, {}))
+
+        masses = {1.0: 1.0}
+        for key in table.keys:
+            weights = self.get_weights(key, region, region_priors.get(key, {}))
+            lookup = table.factors[key]
+            folded: Dict[float, float] = {}
+            for factor, mass in masses.items():
+                for code, weight in enumerate(weights):
+                    if weight:
+                        value = round(factor * lookup[code], self.ROUND_DIGITS)
+                        folded[value] = folded.get(value, 0.0) + mass * weight
+            masses = folded
+
+        self.factors = array('d', sorted(masses))
+        self.masses = array('d', (masses[factor] for factor in self.factors))
+        self.below = array('d', [0.0]) * len(self.factors)
+        running = 0.0
+        for index, mass in enumerate(self.masses):
+            self.below[index] = running
+            running += mass
+
+    def get_weights(self, key: str, region: str, option_weights: Dict[str, float]) -> List[float]:
+        """
+        Normalized weight of each code of a step.
+        The region step is fixed to the region itself.
+        """
+        options = self.table.options[key]
+        if key == self.REGION_KEY:
+            weights = [1.0 if option == region else 0.0 for option in options]
+        elif option_weights:
+            unknown = set(option_weights) - set(options)
+            if unknown:
+                raise ValueError(f"Unknown {key} options in prior: {', '.join(sorted(unknown))}")
+            weights = [float(option_weights.get(option, 0.0)) for option in options]
+        else:
+            weights = [1.0] * len(options)
+        total = sum(weights)
+        if total <= 0:
+            raise ValueError(f"Prior for {key} in {region} gives no option any weight")
+        return [weight / total for weight in weights]
+
+    @classmethod
+    def for_region(cls, table: FactorTable, region: str,
+                   priors: Optional[Dict[str, Dict[str, Dict[str, float]]]] = None) -> 'FactorDistribution':
+        """Return the distribution for a region, building it on first use."""
+        priors = cls.PRIORS if priors is None else priors
+        key = (cls.get_table_key(table), region, json.dumps(priors, sort_keys=True))
+        if key not in cls._cache:
+            cls._cache[key] = cls(table, region, priors)
+        return cls._cache[key]
+
+    @staticmethod
+    def get_table_key(table: FactorTable) -> tuple:
+        """Identify a table by its contents, which is all a distribution depends on."""
+        return tuple(
+            (key, tuple(table.options[key]), tuple(table.factors[key])) for key in table.keys
+        )
+
+    @classmethod
+    def describe_population(cls, priors: Optional[Dict[str, Dict[str, Dict[str, float]]]] = None) -> str:
+        """What a percentile is taken among, for labels."""
+        priors = cls.PRIORS if priors is None else priors
+        if priors:
+            return "people in the same region"
+        return "possible answer combinations in the same region"
+
+    @classmethod
+    def load_priors(cls, path: str) -> Dict[str, Dict[str, Dict[str, float]]]:
+        """Read priors from a JSON file shaped like PRIORS."""
+        with open(path, encoding='utf-8') as priors_file:
+            return json.load(priors_file)
+
+    def percentile(self, factor: float) -> float:
+        """
+        Percentile of a factor: the share of the population below it plus
+        half of those with exactly the same factor, times 100.
+        """
+        factor = round(factor, self.ROUND_DIGITS)
+        index = bisect_left(self.factors, factor)
+        if index < len(self.factors) and self.factors[index] == factor:
+            return (self.below[index] + self.masses[index] / 2) * 100
+        if index == len(self.factors):
+            return 100.0
+        return self.below[index] * 100
+
+    def percentiles(self, factors: Iterable[float]) -> array:
+        """
+        Percentile of every factor in a batch. Batches repeat a handful of
+        distinct factors, so each is searched for only once.
+        """
+        known: Dict[float, float] = {}
+        def lookup(factor: float) -> float:
+            if factor not in known:
+                known[factor] = self.percentile(factor)
+            return known[factor]
+        return array('d', map(lookup, factors))
+
+    @classmethod
+    def rank_columns(cls, table: FactorTable, columns: Dict[str, Sequence[int]],
+                     size: Optional[int] = None,
+                     priors: Optional[Dict[str, Dict[str, Dict[str, float]]]] = None) -> array:
+        """
+        Percentile of every row within its region (see describe_population()).
+
+        Args:
+            table: Option encoding and per-step factors
+            columns: Code column per key (missing keys use the default option)
+            size: Number of rows (taken from the columns if omitted)
+            priors: Option weights (defaults to PRIORS)
+
+        Returns:
+            array: One float64 percentile (0-100) per row
+        """
+        factors = table.evaluate(columns, size)
+        region_column = columns.get(cls.REGION_KEY)
+        if region_column is None:
+            region = table.models[cls.REGION_KEY].DEFAULT_OPTION
+            return cls.for_region(table, region, priors).percentiles(factors)
+
+        distributions = [
+            cls.for_region(table, region, priors) for region in table.options[cls.REGION_KEY]
+        ]
+        known: Dict[Tuple[int, float], float] = {}
+        def lookup(code: int, factor: float) -> float:
+            if (code, factor) not in known:
+                known[code, factor] = distributions[code].percentile(factor)
+            return known[code, factor]
+        return array('d', map(lookup, region_column, factors))
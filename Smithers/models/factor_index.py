@@ -0,0 +1,116 @@
+# models/factor_index.py
+from array import array
+from bisect import bisect_left, bisect_right
+from typing import Dict, Any, Iterator, List, Optional, Tuple
+from helpers.data_processing import DataProcessor
+from models.factor_table import FactorTable
+
+class FactorIndex:
+    """
+    Every combination of options, sorted by adjustment factor.
+
+    A combination is stored as one integer id: its codes read as a
+    mixed-radix number (column 0 is the most significant digit). The index
+    is two parallel arrays, sorted factors and their ids, so range and
+    top/bottom queries are a bisect plus a slice: O(log n + k) per query.
+    """
+
+    ID_TYPE = 'I'  # uint32 combination ids
+
+    def __init__(self, table: Optional[FactorTable] = None) -> None:
+        """
+        Build the index over the whole option space.
+
+        Args:
+            table: Option encoding and per-step factors
+        """
+        self.table = table or FactorTable()
+        self.radices = [len(self.table.options[key]) for key in self.table.keys]
+        self.size = 1
+        for radix in self.radices:
+            self.size *= radix
+        if self.size >= 2 ** (8 * array(self.ID_TYPE).itemsize):
+            raise ValueError(f"Option space too large to index: {self.size} combinations")
+
+        # Factors of every id in id order: a product over columns, with the
+        # last column varying fastest (the same order as the ids)
+        factors = [1.0]
+        for key in self.table.keys:
+            lookup = self.table.factors[key]
+            factors = [factor * value for factor in factors for value in lookup]
+
+        order = sorted(range(self.size), key=factors.__getitem__)
+        self.ids = array(self.ID_TYPE, order)
+        self.factors = array(FactorTable.FACTOR_TYPE, map(factors.__getitem__, order))
+
+    def __len__(self) -> int:
+        return self.size
+
+    def decode_id(self, combination_id: int) -> array:
+        """Return the code row for a combination id."""
+        row = array(FactorTable.CODE_TYPE, [0]) * len(self.radices)
+        for column in range(len(self.radices) - 1, -1, -1):
+            combination_id, row[column] = divmod(combination_id, self.radices[column])
+        return row
+
+    def encode_row(self, row) -> int:
+        """Return the combination id of a code row."""
+        combination_id = 0
+        for code, radix in zip(row, self.radices):
+            combination_id = combination_id * radix + code
+        return combination_id
+
+    def count_between(self, low: float, high: float) -> int:
+        """Number of combinations with low <= factor <= high."""
+        return max(bisect_right(self.factors, high) - bisect_left(self.factors, low), 0)
+
+    def between(self, low: float, high: float, limit: Optional[int] = None) -> List[Tuple[float, array]]:
+        """
+        Combinations with low <= factor <= high, smallest factor first.
+
+        Args:
+            low: Smallest factor
+            high: Largest factor
+            limit: Return at most this many
+
+        Returns:
+            List[Tuple[float, array]]: (factor, code row) pairs
+        """
+        start = bisect_left(self.factors, low)
+        end = bisect_right(self.factors, high)
+        if limit is not None:
+            end = min(end, start + limit)
+        return list(self._entries(start, end))
+
+    def bottom(self, k: int) -> List[Tuple[float, array]]:
+        """The k combinations with the smallest factors."""
+        return list(self._entries(0, min(k, self.size)))
+
+    def top(self, k: int) -> List[Tuple[float, array]]:
+        """The k combinations with the largest factors, largest first."""
+        return list(self._entries(self.size - 1, max(self.size - k, 0) - 1, -1))
+
+    @staticmethod
+    def factor_for_kg(total_kg: float, days: float) -> float:
+        """Adjustment factor that produces a lifetime total over some days."""
+        kg_per_day = DataProcessor.BASE_POOPS_PER_DAY * DataProcessor.BASE_GRAMS_PER_POOP / 1000
+        return total_kg / (days * kg_per_day) if days else float('inf')
+
+    def between_kg(self, low_kg: float, high_kg: float, days: float,
+                   limit: Optional[int] = None) -> List[Tuple[float, array]]:
+        """Combinations whose total over `days` lies between two weights."""
+        return self.between(
+            self.factor_for_kg(low_kg, days),
+            self.factor_for_kg(high_kg, days),
+            limit
+        )
+
+    def describe(self, row) -> Dict[str, Any]:
+        """Return a code row as step key -> option."""
+        return {
+            key: self.table.options[key][code] for key, code in zip(self.table.keys, row)
+        }
+
+    def _entries(self, start: int, stop: int, step: int = 1) -> Iterator[Tuple[float, array]]:
+        for position in range(start, stop, step):
+            yield self.factors[position], self.decode_id(self.ids[position])
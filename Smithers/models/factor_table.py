@@ -0,0 +1,181 @@
+# models/factor_table.py
+from array import array
+from operator import mul
+from typing import Dict, Any, List, Optional, Sequence, Tuple, Type
+from helpers.data_processing import DataProcessor
+from models import OptionStepModel
+from models.poops_per_week_model import PoopsPerWeekModel
+from models.poop_size_model import PoopSizeModel
+from models.diet_model import DietModel
+from models.liquid_intake_model import LiquidIntakeModel
+from models.gender_model import GenderModel
+from models.medications_model import MedicationsModel
+from models.sleep_model import SleepModel
+from models.stress_model import StressModel
+from models.region_model import RegionModel
+from models.activity_model import ActivityModel
+
+# Option steps in wizard order
+OPTION_MODELS: Tuple[Type[OptionStepModel], ...] = (
+    PoopsPerWeekModel,
+    PoopSizeModel,
+    DietModel,
+    LiquidIntakeModel,
+    GenderModel,
+    MedicationsModel,
+    SleepModel,
+    StressModel,
+    RegionModel,
+    ActivityModel,
+)
+
+class FactorTable:
+    """
+    Every option of every option step as a small integer code, with the
+    factor each code contributes to DataProcessor.calculate_adjustment_factor.
+
+    Factors are measured by running the adjustment model on each option's
+    stored answer, so the table matches what the calculator actually reads
+    (an option whose field the model ignores contributes 1.0). Because the
+    adjustment factor is a product of per-step lookups, the factor of a
+    whole answer set is the product of its codes' factors, which lets many
+    answer sets be evaluated column by column.
+    """
+
+    CODE_TYPE = 'B'     # uint8 option codes
+    FACTOR_TYPE = 'd'   # float64 factors
+
+    def __init__(self, models: Sequence[Type[OptionStepModel]] = OPTION_MODELS) -> None:
+        """
+        Build the lookup tables.
+
+        Args:
+            models: Option step models to encode, in column order
+        """
+        self.models = {model.STORE_KEY: model for model in models}
+        self.keys: Tuple[str, ...] = tuple(self.models)
+        self.options: Dict[str, List[str]] = {}
+        self.factors: Dict[str, array] = {}
+        self.log_factors: Dict[str, array] = {}  # ln(factor), for attribution
+        self.codes: Dict[str, Dict[str, int]] = {}
+
+        for key, model in self.models.items():
+            option_keys = model.get_option_keys()
+            if len(option_keys) > 256:
+                raise ValueError(f"Too many options for a uint8 code: {key}")
+            self.options[key] = option_keys
+            self.codes[key] = {option: code for code, option in enumerate(option_keys)}
+            self.factors[key] = array(self.FACTOR_TYPE, (
+                DataProcessor.calculate_adjustment_factor(model.store(option))
+                for option in option_keys
+            ))
+            self.log_factors[key] = array(
+                self.FACTOR_TYPE,
+                map(DataProcessor.log_factor, self.factors[key])
+            )
+
+    @property
+    def active_keys(self) -> Tuple[str, ...]:
+        """Steps with at least one option whose factor isn't 1.0."""
+        return tuple(
+            key for key in self.keys
+            if any(factor != 1.0 for factor in self.factors[key])
+        )
+
+    def get_default_codes(self) -> array:
+        """Return the code row for every step's default option."""
+        return array(self.CODE_TYPE, (
+            self.codes[key][self.models[key].DEFAULT_OPTION] for key in self.keys
+        ))
+
+    def encode(self, answers: Dict[str, Any]) -> array:
+        """
+        Convert stored answers into a code row (defaults fill any gaps).
+
+        Args:
+            answers: Answers as produced by the steps' store_input()
+
+        Returns:
+            array: One uint8 code per key, in column order
+        """
+        row = self.get_default_codes()
+        for column, key in enumerate(self.keys):
+            selection = self.models[key].get_stored_selection(answers)
+            if selection is not None:
+                row[column] = self.codes[key][selection]
+        return row
+
+    def decode(self, row: Sequence[int]) -> Dict[str, Any]:
+        """
+        Convert a code row back into stored answers.
+
+        Args:
+            row: One code per key, in column order
+
+        Returns:
+            Dict[str, Any]: Answers shaped like store_input() results
+        """
+        answers = {}
+        for key, code in zip(self.keys, row):
+            answers.update(self.models[key].store(self.options[key][code]))
+        return answers
+
+    def factor_of(self, row: Sequence[int]) -> float:
+        """Return the adjustment factor of one code row."""
+        total_factor = 1.0
+        for key, code in zip(self.keys, row):
+            total_factor *= self.factors[key][code]
+        return total_factor
+
+    def evaluate(self, columns: Dict[str, Sequence[int]], size: Optional[int] = None) -> array:
+        """
+        Return the adjustment factor of every row in one pass per column.
+        Steps whose options all have factor 1.0 are skipped.
+
+        Args:
+            columns: Code column per key (missing keys use the default option)
+            size: Number of rows (taken from the columns if omitted)
+
+        Returns:
+            array: One float64 factor per row
+        """
+        if size is None:
+            size = len(next(iter(columns.values()), ()))
+        result = array(self.FACTOR_TYPE, [1.0]) * size
+        for key in self.active_keys:
+            lookup = self.factors[key]
+            column = columns.get(key)
+            if column is None:
+                default = lookup[self.codes[key][self.models[key].DEFAULT_OPTION]]
+                if default != 1.0:
+                    result = array(self.FACTOR_TYPE, (value * default for value in result))
+                continue
+            result = array(self.FACTOR_TYPE, map(mul, result, map(lookup.__getitem__, column)))
+        return result
+
+    def attribute(self, columns: Dict[str, Sequence[int]], size: Optional[int] = None) -> Dict[str, array]:
+        """
+        Log-space contribution of every step for every row, keyed and
+        ordered like DataProcessor.attribute_adjustment_factor's. Each row's
+        contributions add up to the log of its adjustment factor.
+
+        Args:
+            columns: Code column per key (missing keys use the default option)
+            size: Number of rows (taken from the columns if omitted)
+
+        Returns:
+            Dict[str, array]: One float64 contribution column per key, in
+            column order (the same for every call, so charts stay stable)
+        """
+        if size is None:
+            size = len(next(iter(columns.values()), ()))
+        contributions = {}
+        for key in self.keys:
+            lookup = self.log_factors[key]
+            column = columns.get(key)
+            if column is None:
+                default = lookup[self.codes[key][self.models[key].DEFAULT_OPTION]]
+                contributions[key] = array(self.FACTOR_TYPE, [default]) * size
+            else:
+                contributions[key] = array(self.FACTOR_TYPE, map(lookup.__getitem__, column))
+        return contributions
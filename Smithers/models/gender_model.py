@@ -0,0 +1,41 @@
+# models/gender_model.py
+from models import OptionStepModel
+
+class GenderModel(OptionStepModel):
+    STORE_KEY = "gender"
+    FIELD_NAME = "gender"
+    DEFAULT_OPTION = "♂ Male"
+
+    INFO_TEXT = (
+        "💡 General dietary tips:\n"
+        "• Stay hydrated\n"
+        "• Eat a balanced diet\n"
+        "• Incorporate fiber-rich foods"
+    )
+
+    OPTIONS = {
+        "♂ Male": {
+            "factor": 1.0,
+            "desc": "Male",
+            "impact": "No significant impact",
+            "recommendation": "Maintain a balanced diet",
+            "details": "Male digestion typically aligns with general guidelines",
+            "tips": "Stay hydrated and maintain a varied diet"
+        },
+        "♀ Female": {
+            "factor": 1.0,
+            "desc": "Female",
+            "impact": "No significant impact",
+            "recommendation": "Monitor hormonal changes",
+            "details": "Female digestion may vary with hormonal cycles",
+            "tips": "Consider dietary adjustments during different phases"
+        },
+        "⚧ Non-Binary/Other": {
+            "factor": 1.0,
+            "desc": "Non-Binary/Other",
+            "impact": "No significant impact",
+            "recommendation": "Focus on personal health needs",
+            "details": "Individual digestion varies regardless of gender",
+            "tips": "Personalize your diet based on your specific needs"
+        }
+    }
\ No newline at end of file
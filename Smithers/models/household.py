@@ -0,0 +1,173 @@
+# models/household.py
+from array import array
+from datetime import date, datetime
+from operator import mul
+from typing import Dict, Any, List, Optional
+from helpers.data_processing import DataProcessor
+from models.birth_date_model import BirthDateModel
+from models.factor_table import FactorTable
+
+class Household:
+    """
+    Several people's answers, each edited through the same steps.
+    Profiles are kept as option-code rows in columnar form: one uint8 array
+    per option step plus one int32 array of birth dates (date ordinals), so
+    totals for every profile are computed in a single pass per column
+    rather than once per profile.
+    """
+
+    DATE_TYPE = 'i'  # int32 day numbers
+
+    def __init__(self, table: Optional[FactorTable] = None) -> None:
+        """
+        Create an empty household.
+
+        Args:
+            table: Option encoding to use (a new FactorTable by default)
+        """
+        self.table = table or FactorTable()
+        self.names: List[str] = []
+        self.columns: Dict[str, array] = {
+            key: array(FactorTable.CODE_TYPE) for key in self.table.keys
+        }
+        self.birth_days = array(self.DATE_TYPE)
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def add(self, name: str, answers: Optional[Dict[str, Any]] = None) -> int:
+        """
+        Add a profile, starting from the default answers.
+
+        Args:
+            name: Display name
+            answers: Stored answers to start from
+
+        Returns:
+            int: Index of the new profile
+        """
+        self.names.append(name)
+        for column in self.columns.values():
+            column.append(0)
+        self.birth_days.append(date(BirthDateModel.DEFAULT_YEAR, 1, 1).toordinal())
+        index = len(self.names) - 1
+        self.update(index, answers or {})
+        return index
+
+    def add_record(self, record: Dict[str, str]) -> int:
+        """
+        Add a profile from flat text fields, e.g. a CSV row with a "name"
+        column, a "birth_date" column (YYYY-MM-DD) and one column per option
+        step holding either the option text or its code.
+
+        Args:
+            record: Field name -> text
+
+        Returns:
+            int: Index of the new profile
+
+        Raises:
+            ValueError: If a field holds an unknown option or bad date
+        """
+        answers = {}
+        for key in self.table.keys:
+            value = (record.get(key) or '').strip()
+            if not value:
+                continue
+            options = self.table.options[key]
+            if value.isdigit() and int(value) < len(options):
+                value = options[int(value)]
+            elif value not in self.table.codes[key]:
+                raise ValueError(f"Unknown {key} option: {value}")
+            answers.update(self.table.models[key].store(value))
+
+        birth_date = (record.get(BirthDateModel.STORE_KEY) or '').strip()
+        if birth_date:
+            parsed = datetime.strptime(birth_date, BirthDateModel.DATE_FORMAT).date()
+            answers.update(BirthDateModel.store(parsed))
+
+        return self.add(record.get('name') or f"Profile {len(self) + 1}", answers)
+
+    def copy(self) -> 'Household':
+        """Return a snapshot that can be read on another thread."""
+        household = Household(self.table)
+        household.names = list(self.names)
+        household.columns = {key: column[:] for key, column in self.columns.items()}
+        household.birth_days = self.birth_days[:]
+        return household
+
+    def get_state(self) -> tuple:
+        """Return every profile's name, codes and birth date, for comparing snapshots."""
+        return (
+            tuple(self.names),
+            tuple(tuple(column) for column in self.columns.values()),
+            tuple(self.birth_days),
+        )
+
+    def remove(self, index: int) -> None:
+        """Remove a profile."""
+        del self.names[index]
+        for column in self.columns.values():
+            del column[index]
+        del self.birth_days[index]
+
+    def update(self, index: int, answers: Dict[str, Any]) -> None:
+        """
+        Store a profile's answers as codes.
+
+        Args:
+            index: Profile to update
+            answers: Answers shaped like store_input() results
+        """
+        row = self.table.encode(answers)
+        for key, code in zip(self.table.keys, row):
+            self.columns[key][index] = code
+        birth_date = BirthDateModel.get_stored_date(answers)
+        if birth_date is not None:
+            self.birth_days[index] = birth_date.toordinal()
+
+    def get_row(self, index: int) -> array:
+        """Return a profile's option codes in column order."""
+        return array(FactorTable.CODE_TYPE, (self.columns[key][index] for key in self.table.keys))
+
+    def get_answers(self, index: int) -> Dict[str, Any]:
+        """Return a profile's answers shaped like store_input() results."""
+        answers = self.table.decode(self.get_row(index))
+        answers.update(BirthDateModel.store(date.fromordinal(self.birth_days[index])))
+        return answers
+
+    def aggregate(self, today: Optional[date] = None) -> Dict[str, Any]:
+        """
+        Compute lifetime totals for every profile and the household.
+
+        Args:
+            today: Date to total up to (defaults to today)
+
+        Returns:
+            Dict[str, Any]: Per-profile arrays ('factors', 'days', 'total_kg'),
+            each step's factor per profile ('step_factors') and household
+            'sum_kg', 'mean_kg' and 'max_index'
+        """
+        today = today or datetime.now().date()
+        size = len(self.names)
+        factors = self.table.evaluate(self.columns, size)
+        today_ordinal = today.toordinal()
+        days = array(self.DATE_TYPE, (max(today_ordinal - born, 0) for born in self.birth_days))
+
+        kg_per_day = DataProcessor.BASE_POOPS_PER_DAY * DataProcessor.BASE_GRAMS_PER_POOP / 1000
+        total_kg = array('d', (value * kg_per_day for value in map(mul, days, factors)))
+
+        sum_kg = sum(total_kg)
+        return {
+            'names': list(self.names),
+            'factors': factors,
+            'step_factors': {
+                key: array('d', map(self.table.factors[key].__getitem__, column))
+                for key, column in self.columns.items()
+            },
+            'days': days,
+            'total_kg': total_kg,
+            'sum_kg': sum_kg,
+            'mean_kg': sum_kg / size if size else 0.0,
+            'max_index': max(range(size), key=total_kg.__getitem__) if size else None,
+        }
@@ -0,0 +1,36 @@
+# models/liquid_intake_model.py
+from models import OptionStepModel
+
+class LiquidIntakeModel(OptionStepModel):
+    STORE_KEY = "liquid_intake"
+    FIELD_NAME = "daily liquid intake"
+    DEFAULT_OPTION = "Adequate hydration (8+ cups/day)"
+    STORE_SHAPE = 'factor'
+    REQUIRED_MESSAGE = "Please select your daily liquid intake"
+
+    OPTIONS = {
+        "Adequate hydration (8+ cups/day)": {
+            "factor": 1.0,
+            "desc": "Normal bowel movement support",
+            "icon": "💧",
+            "details": "Ensures proper stool consistency",
+            "impact": "Supports regular bowel movements",
+            "tips": "Drink at least 8 glasses of water daily"
+        },
+        "High hydration (12+ cups/day)": {
+            "factor": 1.2,
+            "desc": "Improved bowel movement frequency",
+            "icon": "💧💧",
+            "details": "Optimal hydration for digestion",
+            "impact": "May increase bowel movements",
+            "tips": "Stay hydrated throughout the day"
+        },
+        "Low hydration (4-6 cups/day)": {
+            "factor": 0.8,
+            "desc": "May lead to constipation",
+            "icon": "💧",
+            "details": "Insufficient hydration for digestion",
+            "impact": "May decrease bowel movements",
+            "tips": "Increase water intake gradually"
+        }
+    }
\ No newline at end of file
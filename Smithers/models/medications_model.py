@@ -0,0 +1,36 @@
+# models/medications_model.py
+from models import OptionStepModel
+
+class MedicationsModel(OptionStepModel):
+    STORE_KEY = "medication"
+    FIELD_NAME = "medication status"
+    DEFAULT_OPTION = "No medications"
+    STORE_SHAPE = 'factor'
+    REQUIRED_MESSAGE = "Please select your medication status"
+
+    OPTIONS = {
+        "No medications": {
+            "factor": 1.0,
+            "desc": "No impact on bowel movements",
+            "icon": "💊",
+            "details": "No medications that affect digestion",
+            "impact": "No significant impact",
+            "tips": "Maintain a balanced diet"
+        },
+        "Fiber supplements": {
+            "factor": 1.2,
+            "desc": "Increase in bowel movements",
+            "icon": "💊",
+            "details": "Commonly used to relieve constipation",
+            "impact": "May increase bowel movements",
+            "tips": "Follow recommended dosage"
+        },
+        "Diarrhea medications": {
+            "factor": 0.8,
+            "desc": "Decrease in bowel movements",
+            "icon": "💊",
+            "details": "May slow down digestion",
+            "impact": "May decrease bowel movements",
+            "tips": "Consult a healthcare professional"
+        }
+    }
\ No newline at end of file
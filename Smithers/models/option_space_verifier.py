@@ -0,0 +1,217 @@
+# models/option_space_verifier.py
+import difflib
+import itertools
+import math
+import time
+from typing import Dict, Any, List, Optional, Sequence, Type
+from helpers.data_processing import DataProcessor
+from models import OptionStepModel
+from models.factor_table import FactorTable, OPTION_MODELS
+
+class OptionSpaceVerifier:
+    """
+    Runs every combination of option answers through the same path the
+    app uses (each model's store(), as store_input() does, then
+    calculate_adjustment_factor and calculate_total_poop) and checks it.
+
+    Checks per combination:
+    - the factor equals the product of the factors the options declare
+      (a difference means the model silently ignores some answer);
+    - FactorTable.factor_of gives the same factor, and the batch path
+      (FactorTable.evaluate) the same again;
+    - the total is finite and not negative.
+
+    Steps whose declared factors never reach the result are reported with
+    the field the model reads instead, found by probing the calculator
+    around each step's STORE_KEY.
+    Timing both paths makes it a benchmark as well.
+    """
+
+    PROBE_FACTOR = 2.0
+    # Where a stored answer may hold its factor: STORE_SHAPE 'factor',
+    # STORE_SHAPE 'data', and the older combined total
+    FACTOR_PATHS = (('factor',), ('data', 'factor'), ('total_factor',))
+    TOLERANCE = 1e-9
+    MAX_EXAMPLES = 5   # Mismatching combinations kept per check
+
+    def __init__(self, models: Sequence[Type[OptionStepModel]] = OPTION_MODELS) -> None:
+        """
+        Set up the option space.
+
+        Args:
+            models: Option step models to enumerate
+        """
+        self.models = list(models)
+        self.table = FactorTable(self.models)
+
+    @classmethod
+    def get_read_field(cls, model: Type[OptionStepModel]) -> Optional[str]:
+        """
+        Find where the adjustment model reads a step's factor from, if not
+        where the step stores it: a probe factor is stored under the step's
+        STORE_KEY (and the answer keys get_factors names that look like it)
+        in each shape a factor is stored in, until one reaches the result.
+
+        Returns:
+            Optional[str]: e.g. "activity['factor']", or None if no probe
+            reaches the result
+        """
+        keys = [model.STORE_KEY] + difflib.get_close_matches(
+            model.STORE_KEY, list(DataProcessor.get_factors({})), n=3, cutoff=0.5
+        )
+        for key in dict.fromkeys(keys):
+            for path in cls.FACTOR_PATHS:
+                probe: Dict[str, Any] = {path[-1]: cls.PROBE_FACTOR}
+                for field in reversed(path[:-1]):
+                    probe = {field: probe}
+                if DataProcessor.calculate_adjustment_factor({key: probe}) == cls.PROBE_FACTOR:
+                    return key + ''.join(f"['{field}']" for field in path)
+        return None
+
+    def check_steps(self) -> List[Dict[str, Any]]:
+        """
+        Compare each step's declared factors with what the model makes of
+        them, one option at a time.
+
+        Returns:
+            List[Dict[str, Any]]: Per step: 'key', 'declared' and
+            'effective' factors per option, 'ignored' (True if some
+            declared factor never reaches the result), and 'reads' (the
+            field the model most likely meant, if ignored)
+        """
+        steps = []
+        for key in self.table.keys:
+            model = self.table.models[key]
+            declared = [float(model.OPTIONS[option].get('factor', 1.0)) for option in self.table.options[key]]
+            effective = list(self.table.factors[key])
+            ignored = any(
+                abs(wanted - got) > self.TOLERANCE for wanted, got in zip(declared, effective)
+            )
+            reads = self.get_read_field(model) if ignored else None
+            steps.append({
+                'key': key,
+                'stores': self.get_stored_field(model),
+                'declared': declared,
+                'effective': effective,
+                'ignored': ignored,
+                'reads': reads,
+            })
+        return steps
+
+    @staticmethod
+    def get_stored_field(model: Type[OptionStepModel]) -> str:
+        """Where a step keeps the factor it declares."""
+        if model.STORE_SHAPE == 'factor':
+            return f"{model.STORE_KEY}['factor']"
+        return f"{model.STORE_KEY}['data']['factor']"
+
+    def run(self, age_years: float = 40.0) -> Dict[str, Any]:
+        """
+        Enumerate and check every combination.
+
+        Args:
+            age_years: Age used for the totals
+
+        Returns:
+            Dict[str, Any]: 'combinations', 'steps' (check_steps()),
+            'mismatches' (check name -> count), 'examples' (check name ->
+            up to MAX_EXAMPLES answer dicts), 'seconds' and
+            'evaluations_per_second' for the full path and for the
+            batch path ('batch_seconds', 'batch_evaluations_per_second'),
+            and 'passed'
+        """
+        keys = self.table.keys
+        stored = [
+            [self.table.models[key].store(option) for option in self.table.options[key]]
+            for key in keys
+        ]
+        declared = [
+            [float(self.table.models[key].OPTIONS[option].get('factor', 1.0))
+             for option in self.table.options[key]]
+            for key in keys
+        ]
+        radices = [range(len(self.table.options[key])) for key in keys]
+        mismatches = {'ignored_answers': 0, 'factor_table': 0, 'batch': 0, 'invalid_total': 0}
+        examples: Dict[str, List[Dict[str, str]]] = {name: [] for name in mismatches}
+        factors = []
+
+        def flag(check: str, row: Sequence[int]) -> None:
+            mismatches[check] += 1
+            if len(examples[check]) < self.MAX_EXAMPLES:
+                examples[check].append({
+                    key: self.table.options[key][code] for key, code in zip(keys, row)
+                })
+
+        started = time.perf_counter()
+        for row in itertools.product(*radices):
+            answers = {}
+            expected = 1.0
+            for column, code in enumerate(row):
+                answers.update(stored[column][code])
+                expected *= declared[column][code]
+            factor = DataProcessor.calculate_adjustment_factor(answers)
+            totals = DataProcessor.calculate_total_poop(
+                age_years,
+                DataProcessor.BASE_POOPS_PER_DAY,
+                DataProcessor.BASE_GRAMS_PER_POOP,
+                factor
+            )
+            factors.append(factor)
+
+            if abs(factor - expected) > self.TOLERANCE:
+                flag('ignored_answers', row)
+            if abs(factor - self.table.factor_of(row)) > self.TOLERANCE:
+                flag('factor_table', row)
+            if not math.isfinite(totals['total_kg']) or totals['total_kg'] < 0:
+                flag('invalid_total', row)
+        seconds = time.perf_counter() - started
+
+        # The same combinations as code columns, through the batch path
+        columns = {
+            key: [row[column] for row in itertools.product(*radices)]
+            for column, key in enumerate(keys)
+        }
+        started = time.perf_counter()
+        batch_factors = self.table.evaluate(columns, len(factors))
+        batch_seconds = time.perf_counter() - started
+        for index, (factor, batch_factor) in enumerate(zip(factors, batch_factors)):
+            if abs(factor - batch_factor) > self.TOLERANCE:
+                flag('batch', [columns[key][index] for key in keys])
+
+        steps = self.check_steps()
+        return {
+            'combinations': len(factors),
+            'steps': steps,
+            'mismatches': mismatches,
+            'examples': examples,
+            'seconds': seconds,
+            'evaluations_per_second': len(factors) / seconds if seconds else math.inf,
+            'batch_seconds': batch_seconds,
+            'batch_evaluations_per_second': len(factors) / batch_seconds if batch_seconds else math.inf,
+            'passed': not any(mismatches.values()) and not any(step['ignored'] for step in steps),
+        }
+
+    @staticmethod
+    def format_report(report: Dict[str, Any]) -> str:
+        """Render run() output as text."""
+        lines = [f"Checked {report['combinations']:,} combinations"]
+        for step in report['steps']:
+            if step['ignored']:
+                hint = f"; the model reads {step['reads']}" if step['reads'] else ""
+                lines.append(
+                    f"  IGNORED {step['key']}: factors {step['declared']} stored in "
+                    f"{step['stores']} never reach the result{hint}"
+                )
+        for check, count in report['mismatches'].items():
+            if count:
+                lines.append(f"  {check}: {count:,} combinations, e.g. {report['examples'][check][0]}")
+        lines.append(
+            f"Full path: {report['seconds']:.3f} s "
+            f"({report['evaluations_per_second']:,.0f} evaluations/s)"
+        )
+        lines.append(
+            f"Batch path: {report['batch_seconds']:.3f} s "
+            f"({report['batch_evaluations_per_second']:,.0f} evaluations/s)"
+        )
+        lines.append("PASSED" if report['passed'] else "FAILED")
+        return '\n'.join(lines)
@@ -0,0 +1,41 @@
+# models/poop_size_model.py
+from models import OptionStepModel
+
+class PoopSizeModel(OptionStepModel):
+    STORE_KEY = "poop_size"
+    FIELD_NAME = "poop size"
+    DEFAULT_OPTION = "💩 Average"
+
+    INFO_TEXT = (
+        "💩 Tips for maintaining healthy poop size:\n"
+        "• Eat a fiber-rich diet\n"
+        "• Stay hydrated\n"
+        "• Exercise regularly"
+    )
+
+    OPTIONS = {
+        "💩 Small": {
+            "factor": 0.8,
+            "desc": "Small poop size",
+            "impact": "10% decrease in regularity",
+            "recommendation": "Increase fiber intake",
+            "details": "Small poop may indicate insufficient fiber",
+            "tips": "Add more fruits, vegetables, and whole grains to your diet"
+        },
+        "💩 Average": {
+            "factor": 1.0,
+            "desc": "Average poop size",
+            "impact": "No significant impact",
+            "recommendation": "Maintain current diet",
+            "details": "Average poop size is typical for a balanced diet",
+            "tips": "Continue with a varied and fiber-rich diet"
+        },
+        "💩 Large": {
+            "factor": 1.2,
+            "desc": "Large poop size",
+            "impact": "15% increase in regularity",
+            "recommendation": "Stay hydrated",
+            "details": "Large poop may indicate efficient digestion",
+            "tips": "Ensure adequate hydration and monitor bowel movements"
+        }
+    }
\ No newline at end of file
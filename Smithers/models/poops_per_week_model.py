@@ -0,0 +1,41 @@
+# models/poops_per_week_model.py
+from models import OptionStepModel
+
+class PoopsPerWeekModel(OptionStepModel):
+    STORE_KEY = "poops_per_week"
+    FIELD_NAME = "poops per week"
+    DEFAULT_OPTION = "💩 3-5 times"
+
+    INFO_TEXT = (
+        "💩 Tips for maintaining healthy bowel movements:\n"
+        "• Stay hydrated\n"
+        "• Eat a fiber-rich diet\n"
+        "• Exercise regularly"
+    )
+
+    OPTIONS = {
+        "💩 1-2 times": {
+            "factor": 0.8,
+            "desc": "Infrequent bowel movements",
+            "impact": "10% decrease in regularity",
+            "recommendation": "Increase fiber intake",
+            "details": "Infrequent poops may indicate constipation",
+            "tips": "Add more fruits, vegetables, and whole grains to your diet"
+        },
+        "💩 3-5 times": {
+            "factor": 1.0,
+            "desc": "Average bowel movements",
+            "impact": "No significant impact",
+            "recommendation": "Maintain current diet",
+            "details": "Average poops align with healthy digestion",
+            "tips": "Continue with a varied and fiber-rich diet"
+        },
+        "💩 6+ times": {
+            "factor": 1.2,
+            "desc": "Frequent bowel movements",
+            "impact": "15% increase in regularity",
+            "recommendation": "Stay hydrated",
+            "details": "Frequent poops may indicate efficient digestion",
+            "tips": "Ensure adequate hydration and monitor bowel movements"
+        }
+    }
\ No newline at end of file
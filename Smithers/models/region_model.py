@@ -0,0 +1,36 @@
+# models/region_model.py
+from models import OptionStepModel
+
+class RegionModel(OptionStepModel):
+    STORE_KEY = "region"
+    FIELD_NAME = "region"
+    DEFAULT_OPTION = "North America"
+    STORE_SHAPE = 'factor'
+    REQUIRED_MESSAGE = "Please select your region"
+
+    OPTIONS = {
+        "North America": {
+            "factor": 1.0,
+            "desc": "Average bowel habits in North America",
+            "icon": "🌎",
+            "details": "Typical diet and lifestyle",
+            "impact": "No significant impact",
+            "tips": "Maintain a balanced diet"
+        },
+        "Europe": {
+            "factor": 1.1,
+            "desc": "Slightly higher regularity in Europe",
+            "icon": "🌍",
+            "details": "Higher fiber intake in typical diet",
+            "impact": "May increase regularity",
+            "tips": "Continue with a fiber-rich diet"
+        },
+        "Asia": {
+            "factor": 0.9,
+            "desc": "Slightly lower regularity in Asia",
+            "icon": "🌏",
+            "details": "Different dietary habits",
+            "impact": "May decrease regularity",
+            "tips": "Consider adding more fiber"
+        }
+    }
\ No newline at end of file
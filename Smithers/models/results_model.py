@@ -0,0 +1,56 @@
+# models/results_model.py
+from typing import Dict, Any
+from models import StepModel
+
+class ResultsModel(StepModel):
+    """
+    Text shown on the results screen: tab headers and the comparison
+    objects the lifetime total is measured against.
+    """
+
+    HEADERS: Dict[str, str] = {
+        'summary': "✨ Summary:",
+        'details': "🔍 Details:",
+        'comparisons': "🔄 Comparisons:",
+        'what_if': "🔮 What If:",
+        'household': "🏠 Household:",
+    }
+
+    COMPARISONS: Dict[str, Dict[str, Any]] = {
+        'elephant': {
+            'weight': 6000,  # kg
+            'name': '🐘 African Elephants',
+            'text': 'Equal to {:.2f} elephants',
+            'description': 'Adult African elephants weigh about 6,000 kg'
+        },
+        'beetle': {
+            'weight': 1200,  # kg
+            'name': '🚗 VW Beetles',
+            'text': 'Weighs as much as {:.2f} Volkswagen Beetles',
+            'description': 'Classic VW Beetles weigh about 1,200 kg'
+        },
+        'whale': {
+            'weight': 150000,  # kg
+            'name': '🐋 Blue Whales',
+            'text': 'Equal to {:.2f} blue whales',
+            'description': 'Blue whales weigh about 150,000 kg'
+        },
+        'car': {
+            'weight': 1500,  # kg
+            'name': '🚙 Cars',
+            'text': 'Weighs as much as {:.2f} average cars',
+            'description': 'Average car weighs about 1,500 kg'
+        },
+        'pool': {
+            'volume': 2500000,  # liters
+            'name': '🏊 Olympic Swimming Pools',
+            'text': 'Would fill {:.2f}% of an Olympic swimming pool',
+            'description': 'Olympic swimming pool holds 2,500,000 liters'
+        },
+        'bathtub': {
+            'volume': 150,  # liters
+            'name': '🛁 Bathtubs',
+            'text': 'Would fill {:.2f} bathtubs',
+            'description': 'Average bathtub holds 150 liters'
+        }
+    }
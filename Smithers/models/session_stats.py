@@ -0,0 +1,192 @@
+# models/session_stats.py
+import os
+import struct
+from bisect import bisect_right
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Iterator, Optional, Tuple
+from helpers.quantile_sketch import QuantileSketch
+
+class SessionStats:
+    """
+    Distribution of lifetime totals from completed sessions, kept as one
+    QuantileSketch per region and age band so a result can be placed
+    ("you're in the 80th percentile") without storing every session.
+
+    Stats from separate runs or batch workers combine with merge(), and the
+    whole set is saved in a small binary file.
+    """
+
+    AGE_BANDS = (
+        (0, "0-17"),
+        (18, "18-29"),
+        (30, "30-44"),
+        (45, "45-59"),
+        (60, "60-74"),
+        (75, "75+"),
+    )
+    MIN_SESSIONS = 20  # Fewer than this and a percentile means little
+
+    MAGIC = b'SMSS'
+    VERSION = 1
+    _HEADER = struct.Struct('<4sHI')   # magic, version, number of sketches
+    _ENTRY = struct.Struct('<HI')      # key length, sketch length
+
+    def __init__(self) -> None:
+        self.sketches: Dict[str, QuantileSketch] = {}
+
+    @staticmethod
+    def get_data_path() -> Path:
+        """Return the per-user file the stats are kept in."""
+        data_root = os.environ.get('XDG_DATA_HOME') or Path.home() / '.local' / 'share'
+        return Path(data_root) / 'smithers' / 'session_stats.bin'
+
+    @classmethod
+    def get_age_band(cls, age_years: float) -> str:
+        """Return the label of the age band an age falls in."""
+        lower_bounds = [lower for lower, _ in cls.AGE_BANDS]
+        return cls.AGE_BANDS[max(bisect_right(lower_bounds, age_years) - 1, 0)][1]
+
+    @classmethod
+    def get_key(cls, region: str, age_years: float) -> str:
+        """Return the sketch key for a region and age."""
+        return f"{region}|{cls.get_age_band(age_years)}"
+
+    def record(self, region: str, age_years: float, total_kg: float) -> None:
+        """
+        Add one completed session.
+
+        Args:
+            region: Region option the user chose
+            age_years: Age at the time of the session
+            total_kg: Lifetime total the session produced
+        """
+        key = self.get_key(region, age_years)
+        if key not in self.sketches:
+            self.sketches[key] = QuantileSketch()
+        self.sketches[key].update(total_kg)
+
+    def percentile(self, region: str, age_years: float, total_kg: float) -> Optional[Tuple[float, int]]:
+        """
+        Place a total among earlier sessions in the same region and age band.
+
+        Returns:
+            Optional[Tuple[float, int]]: (percentile 0-100, number of sessions
+            compared against), or None if there are fewer than MIN_SESSIONS
+        """
+        sketch = self.sketches.get(self.get_key(region, age_years))
+        if sketch is None or sketch.count < self.MIN_SESSIONS:
+            return None
+        return sketch.rank(total_kg) * 100, sketch.count
+
+    def merge(self, other: 'SessionStats') -> None:
+        """
+        Fold another set of stats into this one.
+
+        Raises:
+            ValueError: If a sketch uses a different k than the one it joins
+                (nothing is merged then)
+        """
+        for key, sketch in other.sketches.items():
+            if key in self.sketches and self.sketches[key].k != sketch.k:
+                raise ValueError(
+                    f"{key}: can't merge a sketch with k={sketch.k} into one with k={self.sketches[key].k}"
+                )
+        for key, sketch in other.sketches.items():
+            if key in self.sketches:
+                self.sketches[key].merge(sketch)
+            else:
+                self.sketches[key] = QuantileSketch.from_bytes(sketch.to_bytes())
+
+    def items(self) -> Iterator[Tuple[str, QuantileSketch]]:
+        """Sketches sorted by key."""
+        return iter(sorted(self.sketches.items()))
+
+    def to_bytes(self) -> bytes:
+        """Serialize every sketch."""
+        parts = [self._HEADER.pack(self.MAGIC, self.VERSION, len(self.sketches))]
+        for key, sketch in self.items():
+            encoded_key = key.encode('utf-8')
+            encoded_sketch = sketch.to_bytes()
+            parts.append(self._ENTRY.pack(len(encoded_key), len(encoded_sketch)))
+            parts.append(encoded_key)
+            parts.append(encoded_sketch)
+        return b''.join(parts)
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> 'SessionStats':
+        """
+        Rebuild stats from to_bytes() output.
+
+        Raises:
+            ValueError: If the data isn't a stats file
+        """
+        if len(data) < cls._HEADER.size:
+            raise ValueError("Truncated session stats")
+        magic, version, count = cls._HEADER.unpack_from(data)
+        if magic != cls.MAGIC or version != cls.VERSION:
+            raise ValueError("Not a session stats file")
+
+        stats = cls()
+        offset = cls._HEADER.size
+        try:
+            for _ in range(count):
+                key_length, sketch_length = cls._ENTRY.unpack_from(data, offset)
+                offset += cls._ENTRY.size
+                key = data[offset:offset + key_length].decode('utf-8')
+                offset += key_length
+                stats.sketches[key] = QuantileSketch.from_bytes(data[offset:offset + sketch_length])
+                offset += sketch_length
+        except (struct.error, UnicodeDecodeError) as e:
+            raise ValueError(f"Corrupt session stats: {e}")
+        if offset != len(data):
+            raise ValueError("Corrupt session stats")
+        return stats
+
+    @classmethod
+    def load(cls, path: Optional[Path] = None) -> 'SessionStats':
+        """
+        Read saved stats, starting empty if there are none yet.
+
+        Raises:
+            ValueError: If the file exists but isn't valid stats (it is left
+                alone; see set_aside())
+            OSError: If the file exists but can't be read
+        """
+        try:
+            with open(path or cls.get_data_path(), 'rb') as stats_file:
+                data = stats_file.read()
+        except FileNotFoundError:
+            return cls()
+        return cls.from_bytes(data)
+
+    @classmethod
+    def set_aside(cls, path: Optional[Path] = None) -> Path:
+        """
+        Rename an unreadable stats file so new stats don't overwrite it.
+
+        Returns:
+            Path: Where the file was moved
+
+        Raises:
+            OSError: If the file can't be renamed
+        """
+        path = Path(path or cls.get_data_path())
+        stamp = datetime.now().strftime('%Y%m%d-%H%M%S')
+        bad_path = path.with_name(f"{path.name}.{stamp}.bad")
+        os.replace(path, bad_path)
+        return bad_path
+
+    def save(self, path: Optional[Path] = None) -> None:
+        """
+        Write the stats atomically.
+
+        Raises:
+            OSError: If the file can't be written
+        """
+        path = Path(path or self.get_data_path())
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix('.tmp')
+        with open(tmp_path, 'wb') as stats_file:
+            stats_file.write(self.to_bytes())
+        os.replace(tmp_path, path)
@@ -0,0 +1,41 @@
+# models/sleep_model.py
+from models import OptionStepModel
+
+class SleepModel(OptionStepModel):
+    STORE_KEY = "sleep_pattern"
+    FIELD_NAME = "sleep pattern"
+    DEFAULT_OPTION = "🌙 6-8 hours"
+
+    INFO_TEXT = (
+        "🌟 Tips for better sleep:\n"
+        "• Maintain a consistent schedule\n"
+        "• Avoid screens before bedtime\n"
+        "• Create a relaxing bedtime routine"
+    )
+
+    OPTIONS = {
+        "🌙 Less than 6 hours": {
+            "factor": 0.8,
+            "desc": "Short sleep duration",
+            "impact": "10% decrease in regularity",
+            "recommendation": "Consider improving sleep hygiene",
+            "details": "Short sleep may affect digestion",
+            "tips": "Aim for 7-9 hours of sleep per night"
+        },
+        "🌙 6-8 hours": {
+            "factor": 1.0,
+            "desc": "Average sleep duration",
+            "impact": "No significant impact",
+            "recommendation": "Maintain consistent sleep schedule",
+            "details": "Average sleep aligns with health guidelines",
+            "tips": "Stick to a regular bedtime routine"
+        },
+        "🌙 More than 8 hours": {
+            "factor": 1.2,
+            "desc": "Extended sleep duration",
+            "impact": "5% increase in regularity",
+            "recommendation": "Monitor energy levels",
+            "details": "Longer sleep may improve digestion",
+            "tips": "Ensure sleep quality remains good"
+        }
+    }
\ No newline at end of file
@@ -0,0 +1,49 @@
+# models/stress_model.py
+from models import OptionStepModel
+
+class StressModel(OptionStepModel):
+    STORE_KEY = "stress_level"
+    FIELD_NAME = "stress level"
+    DEFAULT_OPTION = "🙂 Moderate"
+
+    INFO_TEXT = (
+        "🧘 Tips for managing stress:\n"
+        "• Practice mindfulness or meditation\n"
+        "• Engage in regular physical activity\n"
+        "• Maintain a healthy work-life balance"
+    )
+
+    OPTIONS = {
+        "😐 Low": {
+            "factor": 0.9,
+            "desc": "Low stress levels",
+            "impact": "5% increase in regularity",
+            "recommendation": "Maintain current stress management",
+            "details": "Low stress promotes healthy digestion",
+            "tips": "Continue with stress-reducing activities"
+        },
+        "🙂 Moderate": {
+            "factor": 1.0,
+            "desc": "Average stress levels",
+            "impact": "No significant impact",
+            "recommendation": "Monitor stress levels",
+            "details": "Moderate stress is common and manageable",
+            "tips": "Practice relaxation techniques as needed"
+        },
+        "😰 High": {
+            "factor": 1.1,
+            "desc": "High stress levels",
+            "impact": "10% decrease in regularity",
+            "recommendation": "Implement stress management techniques",
+            "details": "High stress can negatively affect digestion",
+            "tips": "Consider mindfulness, exercise, or professional support"
+        },
+        "😱 Very High": {
+            "factor": 1.2,
+            "desc": "Constant stress",
+            "impact": "15% decrease in regularity",
+            "recommendation": "Seek professional support",
+            "details": "Chronic stress significantly impacts health",
+            "tips": "Prioritize stress management and consult experts"
+        }
+    }
\ No newline at end of file
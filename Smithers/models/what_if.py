@@ -0,0 +1,111 @@
+# models/what_if.py
+from array import array
+from itertools import combinations
+from typing import Dict, Any, List, Optional, Sequence, Tuple
+from helpers.data_processing import DataProcessor
+from models.factor_table import FactorTable
+
+class WhatIf:
+    """
+    Lifetime totals for every way one answer set could have been answered
+    differently: each single-step alternative and, optionally, each pair of
+    alternatives on two different steps.
+
+    All alternatives are laid out as code columns and scored with one
+    FactorTable.evaluate() call, so a full sweep costs a few milliseconds.
+    """
+
+    def __init__(self, table: FactorTable) -> None:
+        """
+        Args:
+            table: Option encoding and per-step factors
+        """
+        self.table = table
+
+    def alternatives(self, row: Sequence[int], pairs: bool = False) -> List[Tuple[Tuple[int, int], ...]]:
+        """
+        List every alternative as (column, code) changes to a code row.
+
+        Args:
+            row: Current codes in column order
+            pairs: Also include every pair of changes on two different steps
+                (skipping changes that don't affect the factor)
+
+        Returns:
+            List[Tuple[Tuple[int, int], ...]]: One tuple of changes per alternative
+        """
+        singles = [
+            ((column, code),)
+            for column, key in enumerate(self.table.keys)
+            for code in range(len(self.table.options[key]))
+            if code != row[column]
+        ]
+        if not pairs:
+            return singles
+
+        # A change that doesn't move the factor on its own can't in a pair
+        # either (steps multiply independently), so only effective ones pair up
+        effective = []
+        for single in singles:
+            column, code = single[0]
+            factors = self.table.factors[self.table.keys[column]]
+            if factors[code] != factors[row[column]]:
+                effective.append(single)
+        return singles + [
+            first + second
+            for first, second in combinations(effective, 2)
+            if first[0][0] != second[0][0]
+        ]
+
+    def sweep(self, row: Sequence[int], days: int, pairs: bool = False,
+              include_unchanged: bool = False) -> List[Dict[str, Any]]:
+        """
+        Score every alternative and rank them by how much they change the total.
+
+        Args:
+            row: Current codes in column order
+            days: Days the total covers (e.g. days alive)
+            pairs: Also score pairs of changes
+            include_unchanged: Keep alternatives that don't change the total
+
+        Returns:
+            List[Dict[str, Any]]: 'changes' ((step key, option) pairs),
+            'factor', 'total_kg' and 'delta_kg', largest |delta_kg| first
+        """
+        alternatives = self.alternatives(row, pairs)
+        columns = {
+            key: array(FactorTable.CODE_TYPE, [row[column]]) * len(alternatives)
+            for column, key in enumerate(self.table.keys)
+        }
+        for index, changes in enumerate(alternatives):
+            for column, code in changes:
+                columns[self.table.keys[column]][index] = code
+
+        kg_per_factor = days * DataProcessor.BASE_POOPS_PER_DAY * DataProcessor.BASE_GRAMS_PER_POOP / 1000
+        current_kg = self.table.factor_of(row) * kg_per_factor
+        factors = self.table.evaluate(columns, len(alternatives))
+
+        results = []
+        for changes, factor in zip(alternatives, factors):
+            total_kg = factor * kg_per_factor
+            delta_kg = total_kg - current_kg
+            if abs(delta_kg) < 1e-9 and not include_unchanged:
+                continue
+            results.append({
+                'changes': tuple(
+                    (self.table.keys[column], self.table.options[self.table.keys[column]][code])
+                    for column, code in changes
+                ),
+                'factor': factor,
+                'total_kg': total_kg,
+                'delta_kg': delta_kg,
+            })
+        results.sort(key=lambda result: -abs(result['delta_kg']))
+        return results
+
+    @staticmethod
+    def describe(result: Dict[str, Any]) -> str:
+        """Return a one-line description like 'diet → High fiber diet'."""
+        return " + ".join(
+            f"{key.replace('_', ' ')} → {option}" for key, option in result['changes']
+        )
@@ -0,0 +1,146 @@
+# step_graph.py
+from typing import Any, Dict, List, NamedTuple, Optional, Sequence, Tuple
+from helpers.error_handlers import ErrorHandler
+from models.factor_table import FactorTable
+from step_registry import StepSpec
+
+class StepNode(NamedTuple):
+    """One step in the graph, with what the analysis found out about it."""
+    spec: StepSpec
+    option_keys: Tuple[str, ...]   # Factor keys that are FactorTable columns
+    affects_outcome: bool          # Some answer here can change the result
+    conditions: Tuple[Tuple[str, frozenset], ...]  # SHOW_WHEN conditions in force
+    needed: bool                   # Can reach the outcome, directly or by branching
+
+
+class StepGraph:
+    """
+    The wizard as a graph: steps in order, each optionally guarded by its
+    SHOW_WHEN conditions on earlier answers, and annotated once at load
+    time with whether it can change the outcome under the active model.
+
+    A step affects the outcome if it stores something the model can't
+    reason about (the birth date, a plugin's keys), has no keys at all (the
+    results screen), or has options with different factors in FactorTable.
+    A step that only chooses whether others are shown is kept if any step
+    it controls is kept, so a step is needed exactly when the outcome is
+    reachable from its answers.
+
+    At run time next_index() and previous_index() walk only the steps that
+    are needed and whose conditions hold for the answers so far.
+    """
+
+    def __init__(self, specs: Sequence[StepSpec], table: Optional[FactorTable] = None,
+                 prune: bool = True) -> None:
+        """
+        Analyse the steps.
+
+        Args:
+            specs: Steps in wizard order
+            table: Option encoding and per-step factors
+            prune: Skip steps that can't change the outcome; with False
+                only SHOW_WHEN conditions are applied
+        """
+        self.table = table or FactorTable()
+        self.prune = prune
+        position = {}
+        for index, spec in enumerate(specs):
+            for key in spec.factor_keys:
+                position.setdefault(key, index)
+        self.positions: Dict[str, int] = position  # Answer key -> step that stores it
+
+        # What each step can do on its own
+        affects = []
+        option_keys = []
+        for spec in specs:
+            keys = tuple(key for key in spec.factor_keys if key in self.table.models)
+            option_keys.append(keys)
+            affects.append(
+                not spec.factor_keys
+                or len(keys) < len(spec.factor_keys)
+                or any(len(set(self.table.factors[key])) > 1 for key in keys)
+            )
+
+        # Conditions must be on an option step asked earlier
+        conditions = []
+        for index, spec in enumerate(specs):
+            live = []
+            for key, options in spec.show_when:
+                if key not in self.table.models or position.get(key, index) >= index:
+                    ErrorHandler.log_error(
+                        f"Step '{spec.name}' has a condition on '{key}', "
+                        f"which no earlier option step stores; ignoring it"
+                    )
+                    continue
+                live.append((key, frozenset(options), position[key]))
+            conditions.append(live)
+
+        # Keep every step that a kept step's conditions depend on
+        needed = [not prune or affect for affect in affects]
+        changed = True
+        while changed:
+            changed = False
+            for index, live in enumerate(conditions):
+                if not needed[index]:
+                    continue
+                for _, _, controller in live:
+                    if not needed[controller]:
+                        needed[controller] = True
+                        changed = True
+
+        self.nodes: List[StepNode] = [
+            StepNode(
+                spec=spec,
+                option_keys=option_keys[index],
+                affects_outcome=affects[index],
+                conditions=tuple((key, options) for key, options, _ in conditions[index]),
+                needed=needed[index],
+            )
+            for index, spec in enumerate(specs)
+        ]
+
+    def __len__(self) -> int:
+        return len(self.nodes)
+
+    def is_shown(self, index: int, answers: Dict[str, Any]) -> bool:
+        """
+        Whether a step is asked, given the answers so far. A condition only
+        holds while the step it reads is shown too, so an answer left over
+        from a step that was since hidden doesn't open its branch.
+        """
+        node = self.nodes[index]
+        if not node.needed:
+            return False
+        for key, options in node.conditions:
+            if not self.is_shown(self.positions[key], answers):
+                return False
+            selection = self.table.models[key].get_stored_selection(answers)
+            if (selection or self.table.models[key].DEFAULT_OPTION) not in options:
+                return False
+        return True
+
+    def next_index(self, index: int, answers: Dict[str, Any]) -> Optional[int]:
+        """The next step to show after index, or None at the end."""
+        for candidate in range(index + 1, len(self.nodes)):
+            if self.is_shown(candidate, answers):
+                return candidate
+        return None
+
+    def previous_index(self, index: int, answers: Dict[str, Any]) -> Optional[int]:
+        """The step to go back to from index, or None at the start."""
+        for candidate in range(index - 1, -1, -1):
+            if self.is_shown(candidate, answers):
+                return candidate
+        return None
+
+    def first_index(self, answers: Dict[str, Any]) -> Optional[int]:
+        """The first step to show."""
+        return self.next_index(-1, answers)
+
+    def path(self, answers: Dict[str, Any]) -> List[int]:
+        """Every step that would be shown for these answers, in order."""
+        return [index for index in range(len(self.nodes)) if self.is_shown(index, answers)]
+
+    def get_skipped(self) -> List[str]:
+        """Names of the steps that are never shown."""
+        return [node.spec.name for node in self.nodes if not node.needed]
@@ -0,0 +1,264 @@
+# step_registry.py
+import ast
+import importlib
+import importlib.machinery
+import sys
+import re
+from importlib import metadata
+from pathlib import Path
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple
+from helpers.error_handlers import ErrorHandler
+
+class StepSpec(NamedTuple):
+    """Everything known about a step before its module is imported."""
+    name: str
+    target: str                   # "module:ClassName"
+    order: int
+    title: str
+    factor_keys: Tuple[str, ...]  # Answer keys the step stores
+    source: str                   # "builtin" or the providing distribution
+    show_when: Tuple[Tuple[str, Tuple[str, ...]], ...] = ()  # (answer key, options) conditions
+    error: Optional[str] = None   # Why the step can't be used (shown as UnavailableStep)
+
+    @property
+    def module_name(self) -> str:
+        return self.target.partition(':')[0]
+
+    @property
+    def class_name(self) -> str:
+        return self.target.partition(':')[2]
+
+
+class StepRegistry:
+    """
+    Collects step specs from the built-in steps directory and from installed
+    packages that advertise steps under the ENTRY_POINT_GROUP entry point
+    group, e.g. in a plugin's pyproject.toml:
+
+        [project.entry-points."smithers.steps"]
+        hydration_details = "smithers_pack.hydration:HydrationDetailsStep"
+
+    Metadata is read from the step class source with ast, so no step module
+    is imported until its class is actually needed. Each step is isolated:
+    one whose source can't be found or read is still registered, with an
+    error, and like one that fails to import is recorded in `errors` and
+    shown as unavailable without affecting the others.
+    Importing this module does not load Tk.
+    """
+
+    ENTRY_POINT_GROUP = 'smithers.steps'
+    STEPS_DIR = Path(__file__).parent / 'steps'
+    METADATA_FIELDS = ('_order', 'TITLE', 'FACTOR_KEYS', 'SHOW_WHEN')
+    DEFAULT_ORDER = 999
+
+    def __init__(self, include_entry_points: bool = True) -> None:
+        """
+        Initialize the registry.
+
+        Args:
+            include_entry_points: Also look for steps in installed packages
+        """
+        self.include_entry_points = include_entry_points
+        self.specs: Dict[str, StepSpec] = {}
+        self.errors: Dict[str, str] = {}
+        self._classes: Dict[str, Any] = {}
+
+    def discover(self) -> List[StepSpec]:
+        """
+        Find every available step without importing any of them.
+
+        Returns:
+            List[StepSpec]: Specs sorted by order
+        """
+        for path in sorted(self.STEPS_DIR.glob('*.py')):
+            if path.name != '__init__.py':
+                self._register_from_source(
+                    path.stem.replace('_step', ''),
+                    f"steps.{path.stem}",
+                    path,
+                    'builtin'
+                )
+
+        if self.include_entry_points:
+            for entry_point in self._iter_entry_points():
+                source = getattr(entry_point.dist, 'name', None) or 'plugin'
+                try:
+                    module_name, _, class_name = entry_point.value.partition(':')
+                    path = self.find_module_source(module_name)
+                    self._register_from_source(
+                        entry_point.name,
+                        f"{module_name}:{class_name}" if class_name else module_name,
+                        path,
+                        source
+                    )
+                except Exception as e:
+                    self.register_unavailable(entry_point.name, entry_point.value, source, e)
+
+        return self.get_specs()
+
+    def get_specs(self) -> List[StepSpec]:
+        """Return the registered specs sorted by order, then name."""
+        return sorted(self.specs.values(), key=lambda spec: (spec.order, spec.name))
+
+    def register(self, spec: StepSpec) -> None:
+        """
+        Add or replace a spec. Later registrations win, so a plugin can
+        override a built-in step by using the same name.
+        """
+        if spec.name in self.specs:
+            ErrorHandler.log_info(
+                f"Step '{spec.name}' from {spec.source} replaces {self.specs[spec.name].source}"
+            )
+        self.specs[spec.name] = spec
+
+    def load_class(self, spec: StepSpec):
+        """
+        Import a step's module and return its class (cached).
+
+        Args:
+            spec: The step to load
+
+        Returns:
+            The step class
+
+        Raises:
+            Exception: Whatever the import raised; it is also recorded in errors
+        """
+        if spec.name not in self._classes:
+            try:
+                module = importlib.import_module(spec.module_name)
+                self._classes[spec.name] = getattr(module, spec.class_name)
+            except Exception as e:
+                self.record_error(spec.name, e)
+                raise
+        return self._classes[spec.name]
+
+    def register_unavailable(self, name: str, target: str, source: str, error: Exception) -> None:
+        """Record a step whose metadata couldn't be read and register it as unavailable."""
+        self.record_error(name, error)
+        class_name = target.partition(':')[2]
+        self.register(StepSpec(
+            name=name,
+            target=target,
+            order=self.DEFAULT_ORDER,
+            title=self.title_from_class_name(class_name) if class_name else name.replace('_', ' ').title(),
+            factor_keys=(),
+            source=source,
+            error=str(error),
+        ))
+
+    def record_error(self, name: str, error: Exception) -> None:
+        """Remember and log why a step could not be registered or loaded."""
+        self.errors[name] = str(error)
+        ErrorHandler.log_error(f"Step '{name}' failed to load", error)
+
+    def _register_from_source(self, name: str, target: str, path: Optional[Path], source: str) -> None:
+        try:
+            class_name = target.partition(':')[2] or None
+            found_class, fields = self.read_metadata(path, class_name)
+            if found_class is None:
+                return  # Not a step module (e.g. a shared base)
+            if ':' not in target:
+                target = f"{target}:{found_class}"
+            self.register(StepSpec(
+                name=name,
+                target=target,
+                order=int(fields.get('_order', self.DEFAULT_ORDER)),
+                title=fields.get('TITLE') or self.title_from_class_name(found_class),
+                factor_keys=tuple(fields.get('FACTOR_KEYS', ())),
+                source=source,
+                show_when=tuple(
+                    (key, tuple(options)) for key, options in fields.get('SHOW_WHEN', {}).items()
+                )
+            ))
+        except Exception as e:
+            self.register_unavailable(name, target, source, e)
+
+    @staticmethod
+    def find_module_source(module_name: str) -> Optional[Path]:
+        """
+        Locate a module's source file without importing it or its parents.
+
+        importlib.util.find_spec imports every parent package of a dotted
+        name, running their __init__ code; here each level is looked up
+        with PathFinder inside the previous level's search locations.
+
+        Args:
+            module_name: Dotted module name, e.g. "smithers_pack.hydration"
+
+        Returns:
+            Optional[Path]: The module's file, or None if it has no file
+
+        Raises:
+            ModuleNotFoundError: If the module or a parent can't be found
+        """
+        search_path = None  # sys.path for the top-level package
+        prefix = ''
+        for part in module_name.split('.'):
+            prefix = f"{prefix}.{part}" if prefix else part
+            loaded = sys.modules.get(prefix)
+            module_spec = getattr(loaded, '__spec__', None)
+            if module_spec is None:
+                module_spec = importlib.machinery.PathFinder.find_spec(prefix, search_path)
+            if module_spec is None:
+                raise ModuleNotFoundError(f"No module named '{prefix}'", name=prefix)
+            search_path = module_spec.submodule_search_locations
+            if search_path is None and prefix != module_name:
+                raise ModuleNotFoundError(f"'{prefix}' is not a package", name=prefix)
+        return Path(module_spec.origin) if module_spec.origin and module_spec.has_location else None
+
+    @classmethod
+    def read_metadata(cls, path: Optional[Path], class_name: Optional[str] = None) -> Tuple[Optional[str], Dict[str, Any]]:
+        """
+        Read literal metadata from a step class without importing its module.
+
+        Args:
+            path: Source file of the module
+            class_name: Class to read (defaults to the first class whose
+                name ends in "Step")
+
+        Returns:
+            Tuple[Optional[str], Dict[str, Any]]: (class name, metadata fields)
+        """
+        if path is None or path.suffix != '.py':
+            raise ValueError(f"No Python source to read step metadata from: {path}")
+
+        tree = ast.parse(path.read_text(encoding='utf-8'), filename=str(path))
+        for node in tree.body:
+            if not isinstance(node, ast.ClassDef):
+                continue
+            if class_name is not None and node.name != class_name:
+                continue
+            if class_name is None and not node.name.endswith('Step'):
+                continue
+
+            fields = {}
+            for statement in node.body:
+                if isinstance(statement, ast.Assign):
+                    targets, value = statement.targets, statement.value
+                elif isinstance(statement, ast.AnnAssign) and statement.value is not None:
+                    targets, value = [statement.target], statement.value
+                else:
+                    continue
+                for target in targets:
+                    if isinstance(target, ast.Name) and target.id in cls.METADATA_FIELDS:
+                        fields[target.id] = ast.literal_eval(value)
+            return node.name, fields
+
+        return None, {}
+
+    @staticmethod
+    def title_from_class_name(class_name: str) -> str:
+        """Turn "PoopsPerWeekStep" into "Poops Per Week"."""
+        words = re.findall(r'[A-Z][a-z0-9]*|[a-z0-9]+', re.sub(r'Step$', '', class_name))
+        return ' '.join(words)
+
+    def _iter_entry_points(self):
+        try:
+            entry_points = metadata.entry_points()
+            if hasattr(entry_points, 'select'):
+                return list(entry_points.select(group=self.ENTRY_POINT_GROUP))
+            return list(entry_points.get(self.ENTRY_POINT_GROUP, []))
+        except Exception as e:
+            self.record_error(self.ENTRY_POINT_GROUP, e)
+            return []
@@ -2,10 +2,22 @@
 import tkinter as tk
 from tkinter import ttk
 from abc import ABC, abstractmethod
-from typing import Dict, Any
+from typing import Dict, Any, Optional, Type
+from helpers.error_handlers import ErrorHandler
+from models import OptionStepModel
+from helpers.glyph_support import GlyphSupport
+from components.option_step_renderer import OptionStepRenderer
 
 class Step(ABC):
+    # Read from source by StepRegistry without importing the module,
+    # so subclasses must assign these as literals
     _order: int = 999  # Default order
+    TITLE: str = ''    # Empty derives the title from the class name
+    FACTOR_KEYS: tuple = ()  # Answer keys stored by store_input()
+    SHOW_WHEN: dict = {}     # {answer key: (options,)}: ask only after one of those answers
+
+    widgets_created = False  # Set by StepNavigator while the widgets exist
+    shares_widgets = False   # True if the widgets belong to a shared tree, so evicting frees nothing
 
     def __init__(self, frame: ttk.Frame, title: str) -> None:
         self.frame = frame
@@ -32,6 +44,12 @@ class Step(ABC):
         """
         return True
 
+    def on_show(self) -> None:
+        """
+        Called every time the step becomes the visible one.
+        """
+        pass
+
     def get_order(self) -> int:
         """
         Returns the order of the step.
@@ -41,5 +59,143 @@ class Step(ABC):
     def destroy_widgets(self) -> None:
         """
         Destroys all widgets created by the step.
+        The step's frame is kept so it can be rebuilt in place, and every
+        other widget attribute is reset to None so that nothing can call
+        into a destroyed widget.
+        """
+        for widget in self.frame.winfo_children():
+            widget.destroy()
+        for name, value in list(vars(self).items()):
+            if isinstance(value, tk.Misc) and value is not self.frame:
+                setattr(self, name, None)
+
+    def restore_input(self, answers: Dict[str, Any]) -> None:
+        """
+        Optional hook to put a stored answer back into rebuilt widgets.
+
+        Args:
+            answers: Stored answers keyed like store_input() results
         """
-        pass
\ No newline at end of file
+        pass
+
+class UnavailableStep(Step):
+    """
+    Placeholder shown in place of a step whose module failed to import,
+    so one broken step (or step pack) doesn't take the wizard down.
+    """
+
+    def __init__(self, frame: ttk.Frame, title: str, reason: str = '') -> None:
+        super().__init__(frame, title)
+        self.reason = reason
+
+    def create_widgets(self) -> ttk.Frame:
+        message = f"The {self.title} step could not be loaded and will be skipped."
+        if self.reason:
+            message += f"\n\n{self.reason}"
+        label = ttk.Label(self.frame, text=message, wraplength=300, justify=tk.CENTER)
+        label.pack(expand=True)
+        return label
+
+    def store_input(self) -> dict:
+        return {}
+
+class OptionStep(Step):
+    """
+    View for an OptionStepModel.
+    Subclasses only describe their presentation; the widgets come from a
+    shared OptionStepRenderer so every step with the same layout reuses one
+    tree. Selections are kept as catalog keys, while the renderer shows
+    display labels (plain text when emoji can't be drawn).
+    """
+    MODEL: Type[OptionStepModel] = OptionStepModel
+    LAYOUT: str = 'combobox'             # 'combobox' or 'radio'
+    shares_widgets = True                # The layout's OptionStepRenderer
+    HEADER: str = ''
+    TIP_FIELD: str = 'recommendation'   # Option field shown as "Tip:"
+
+    def __init__(self, frame: ttk.Frame, title: str) -> None:
+        super().__init__(frame, title)
+        self.renderer = None
+        self.options = self.MODEL.OPTIONS
+        self.display_labels = {
+            GlyphSupport.text(key): key for key in self.MODEL.get_option_keys()
+        }
+        self.selected = self.MODEL.DEFAULT_OPTION
+        # Without fixed help text the selected option's details are shown
+        if self.MODEL.INFO_TEXT is None:
+            self.info_text = self.format_info(self.selected)
+        else:
+            self.info_text = GlyphSupport.text(self.MODEL.INFO_TEXT)
+
+    @ErrorHandler.handle_exception_decorator
+    def create_widgets(self) -> ttk.Frame:
+        """
+        Attach the shared widget tree for this step's layout.
+        Required implementation of abstract method from Step base class.
+        """
+        # The tree is filled in on_show, which runs every time the step is shown
+        self.renderer = OptionStepRenderer.for_layout(self.frame.master, self.LAYOUT)
+        return self.renderer
+
+    def on_show(self) -> None:
+        """Re-fill the shared tree, which another step may have used since."""
+        if self.renderer is not None:
+            self.renderer.show(self)
+
+    def destroy_widgets(self) -> None:
+        """Give the shared tree back without destroying it."""
+        if self.renderer is not None:
+            self.renderer.release(self)
+            self.renderer = None
+
+    def restore_input(self, answers: Dict[str, Any]) -> None:
+        """Select the stored option again, if there is one."""
+        selection = self.MODEL.get_stored_selection(answers)
+        if selection is not None:
+            self.select(selection)
+
+    def get_display_label(self, key: str) -> str:
+        """Return the label shown for a catalog key."""
+        return GlyphSupport.text(key)
+
+    def option_label(self, label: str) -> str:
+        """Return the radio button text for a display label."""
+        icon = self.options[self.display_labels[label]].get('icon')
+        return GlyphSupport.text(f"{icon} {label}") if icon else label
+
+    def format_info(self, key: str) -> str:
+        """Return the info label text for a catalog key."""
+        details = self.options.get(key, {})
+        if not details:
+            return ""
+        return (
+            f"{self.option_label(self.get_display_label(key))}\n"
+            f"{details['desc']}\n"
+            f"Impact: {details['impact']}\n"
+            f"Tip: {details[self.TIP_FIELD]}"
+        )
+
+    def select(self, key: str) -> None:
+        """Make a catalog key the current selection."""
+        self.selected = key
+        self.info_text = self.format_info(key)
+
+    @ErrorHandler.handle_exception_decorator
+    def on_option_change(self, label: str) -> None:
+        """Handle selection changes (display labels) coming from the renderer."""
+        key = self.display_labels.get(label)
+        if key is not None:
+            self.select(key)
+
+    @ErrorHandler.handle_exception_decorator
+    def store_input(self) -> dict:
+        """Store and return the step's input data."""
+        return self.MODEL.store(self.selected)
+
+    def validate(self) -> bool:
+        """Validate the selection."""
+        is_valid, message = self.MODEL.validate(self.selected)
+        if not is_valid:
+            ErrorHandler.show_error(message)
+            return False
+        return True
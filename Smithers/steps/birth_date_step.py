@@ -1,16 +1,17 @@
 # steps/birth_date_step.py
 import tkinter as tk
 from tkinter import ttk
-from tkcalendar import DateEntry
 from steps import Step
+from components.lazy_date_entry import LazyDateEntry
+from models.birth_date_model import BirthDateModel
 from helpers.error_handlers import ErrorHandler
-from helpers.validation import ValidationHelper
 from helpers.ui_helpers import UIHelper
 from styles import StyleConfig
 from datetime import datetime
 
 class BirthDateStep(Step):
     _order = 1
+    FACTOR_KEYS = ("birth_date",)
 
     def __init__(self, frame, title):
         super().__init__(frame, title)
@@ -45,24 +46,24 @@ class BirthDateStep(Step):
         self.birth_date_label.pack(pady=(0, 3))
 
         # Create calendar widget with specific size and styling
-        self.birth_date_entry = DateEntry(
+        # (tkcalendar is imported here unless it was prefetched while idle)
+        self.birth_date_entry = LazyDateEntry.create(
             content_frame,
             width=15,  # Slightly wider for better visibility
             background=StyleConfig.COLOR_PRIMARY,
             foreground='white',
             borderwidth=1,  # Reduced border
-            year=2000,  # Default year
+            year=BirthDateModel.DEFAULT_YEAR,  # Default year
             date_pattern='yyyy-mm-dd',
             maxdate=datetime.now(),  # Can't select future dates
-            font=('Arial', 10)  # Specific font size
+            font=StyleConfig.get_font("regular")  # Shared named font
         )
         self.birth_date_entry.pack(pady=3)
 
         # Create birth date info label with reduced padding and specific width
         self.birth_date_info_label = UIHelper.create_info_label(
             content_frame,
-            "📅 Select your birth date using the calendar.\n"
-            "This helps us provide age-appropriate recommendations.",
+            BirthDateModel.INFO_TEXT,
             wraplength=300  # Set specific wrap length
         )
         self.birth_date_info_label.pack(pady=5)
@@ -79,45 +80,38 @@ class BirthDateStep(Step):
     def on_birth_date_change(self, event):
         """Handle birth date selection changes."""
         selected_date = self.birth_date_entry.get_date()
-        age = (datetime.now() - datetime.combine(selected_date, datetime.min.time())).days // 365
+        age = BirthDateModel.calculate_age(selected_date)
 
         # Update info label with more concise formatting
         self.birth_date_info_label.configure(
             text=f"Age: {age} years\n"
-            f"Date: {selected_date.strftime('%Y-%m-%d')}"
+            f"Date: {selected_date.strftime(BirthDateModel.DATE_FORMAT)}"
         )
 
     @ErrorHandler.handle_exception_decorator
     def store_input(self) -> dict:
         """Store and return the step's input data."""
-        selected_date = self.birth_date_entry.get_date()
-        age = (datetime.now() - datetime.combine(selected_date, datetime.min.time())).days // 365
+        if self.birth_date_entry is None:
+            return {}  # Not built (or evicted): nothing new was entered
+        return BirthDateModel.store(self.birth_date_entry.get_date())
 
-        return {
-            "birth_date": {
-                "date": selected_date.strftime('%Y-%m-%d'),
-                "age": age
-            }
-        }
+    @ErrorHandler.handle_exception_decorator
+    def restore_input(self, answers: dict) -> None:
+        """Put a stored birth date back into a rebuilt calendar."""
+        stored_date = BirthDateModel.get_stored_date(answers)
+        if stored_date and self.birth_date_entry is not None:
+            self.birth_date_entry.set_date(stored_date)
+            self.on_birth_date_change(None)
 
     def validate(self) -> bool:
         """Validate the birth date input."""
         try:
             selected_date = self.birth_date_entry.get_date()
-            
-            # Check if date is not in the future
-            if selected_date > datetime.now().date():
-                ErrorHandler.show_error("Birth date cannot be in the future")
-                return False
-                
-            # Check if age is reasonable (e.g., less than 120 years)
-            age = (datetime.now().date() - selected_date).days // 365
-            if age > 120:
-                ErrorHandler.show_error("Please enter a valid birth date")
-                return False
-                
-            return True
-            
         except Exception:
-            ErrorHandler.show_error("Please select a valid birth date")
-            return False
\ No newline at end of file
+            selected_date = None
+
+        is_valid, message = BirthDateModel.validate(selected_date)
+        if not is_valid:
+            ErrorHandler.show_error(message)
+            return False
+        return True
\ No newline at end of file
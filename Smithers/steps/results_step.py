@@ -3,10 +3,22 @@ import tkinter as tk
 from tkinter import ttk
 from steps import Step
 from helpers.error_handlers import ErrorHandler
+from helpers.glyph_support import GlyphSupport
+from helpers.data_processing import DataProcessor
+from helpers.time_series import TimeSeries
+from components.lifetime_chart import LifetimeChart
+from components.factor_chart import FactorChart
+from models.birth_date_model import BirthDateModel
+from models.factor_distribution import FactorDistribution
+from models.results_model import ResultsModel
+from models.what_if import WhatIf
 from styles import StyleConfig
 
 class ResultsStep(Step):
     _order = 12
+    FACTOR_KEYS = ()
+
+    WHAT_IF_LIMIT = 15  # Alternatives listed in the What If tab
 
     def __init__(self, frame, title):
         super().__init__(frame, title)
@@ -16,10 +28,14 @@ class ResultsStep(Step):
         self.details_tab = None
         self.comparisons_tab = None
         self.factors_tab = None
+        self.lifetime_tab = None
+        self.lifetime_chart = None
+        self.what_if_tab = None
+        self.what_if_text = None
         self.summary_text = None
         self.details_text = None
         self.comparisons_text = None
-        self.factors_frame = None
+        self.factors_chart = None
         self.comparison_data = {}
         self.init_comparison_data()
 
@@ -42,20 +58,29 @@ class ResultsStep(Step):
         self.details_tab = ttk.Frame(self.notebook, padding=5)
         self.comparisons_tab = ttk.Frame(self.notebook, padding=5)
         self.factors_tab = ttk.Frame(self.notebook, padding=5)
+        self.lifetime_tab = ttk.Frame(self.notebook, padding=5)
+        self.what_if_tab = ttk.Frame(self.notebook, padding=5)
 
         self.notebook.add(self.summary_tab, text="Summary")
         self.notebook.add(self.details_tab, text="Details")
         self.notebook.add(self.comparisons_tab, text="Fun Facts")
         self.notebook.add(self.factors_tab, text="Impact Factors")
+        self.notebook.add(self.lifetime_tab, text="Lifetime")
+        self.notebook.add(self.what_if_tab, text="What If")
 
         # Create scrolled text widgets for each tab
         self.summary_text = self.create_text_widget(self.summary_tab)
         self.details_text = self.create_text_widget(self.details_tab)
         self.comparisons_text = self.create_text_widget(self.comparisons_tab)
+        self.what_if_text = self.create_text_widget(self.what_if_tab)
+
+        # Create chart for the factors tab
+        self.factors_chart = FactorChart(self.factors_tab)
+        self.factors_chart.pack(fill=tk.BOTH, expand=True)
 
-        # Create frame for charts in factors tab
-        self.factors_frame = ttk.Frame(self.factors_tab)
-        self.factors_frame.pack(fill=tk.BOTH, expand=True)
+        # Cumulative curve, redrawn to fit whenever the tab is resized
+        self.lifetime_chart = LifetimeChart(self.lifetime_tab)
+        self.lifetime_chart.pack(fill=tk.BOTH, expand=True)
 
         # Configure text tags
         self.configure_text_tags()
@@ -70,7 +95,7 @@ class ResultsStep(Step):
         text = tk.Text(
             container,
             wrap=tk.WORD,
-            font=(StyleConfig.FONT_FAMILY, StyleConfig.FONT_SIZES["regular"]),
+            font=StyleConfig.get_font("regular"),
             bg=StyleConfig.COLOR_BACKGROUND,
             fg=StyleConfig.COLOR_TEXT,
             padx=5,  # Add internal padding
@@ -88,58 +113,21 @@ class ResultsStep(Step):
 
     def init_comparison_data(self):
         self.comparison_data = {
-            'elephant': {
-                'weight': 6000,  # kg
-                'name': '🐘 African Elephants',
-                'text': 'Equal to {:.2f} elephants',
-                'description': 'Adult African elephants weigh about 6,000 kg'
-            },
-            'beetle': {
-                'weight': 1200,  # kg
-                'name': '🚗 VW Beetles',
-                'text': 'Weighs as much as {:.2f} Volkswagen Beetles',
-                'description': 'Classic VW Beetles weigh about 1,200 kg'
-            },
-            'whale': {
-                'weight': 150000,  # kg
-                'name': '🐋 Blue Whales',
-                'text': 'Equal to {:.2f} blue whales',
-                'description': 'Blue whales weigh about 150,000 kg'
-            },
-            'car': {
-                'weight': 1500,  # kg
-                'name': '🚙 Cars',
-                'text': 'Weighs as much as {:.2f} average cars',
-                'description': 'Average car weighs about 1,500 kg'
-            },
-            'pool': {
-                'volume': 2500000,  # liters
-                'name': '🏊 Olympic Swimming Pools',
-                'text': 'Would fill {:.2f}% of an Olympic swimming pool',
-                'description': 'Olympic swimming pool holds 2,500,000 liters'
-            },
-            'bathtub': {
-                'volume': 150,  # liters
-                'name': '🛁 Bathtubs',
-                'text': 'Would fill {:.2f} bathtubs',
-                'description': 'Average bathtub holds 150 liters'
-            }
+            key: dict(comparison) for key, comparison in ResultsModel.COMPARISONS.items()
         }
 
     def configure_text_tags(self):
         """Configure text tags for styling"""
-        for text_widget in [self.summary_text, self.details_text, self.comparisons_text]:
-            text_widget.tag_config(
-                'bold',
-                font=(StyleConfig.FONT_FAMILY, StyleConfig.FONT_SIZES["large"], 'bold')
-            )
-            text_widget.tag_config(
-                'italic',
-                font=(StyleConfig.FONT_FAMILY, StyleConfig.FONT_SIZES["regular"], 'italic')
-            )
+        # Tags reference the shared named fonts, so no per-widget font lookup
+        bold_font = StyleConfig.get_font("header")
+        italic_font = StyleConfig.get_font("italic")
+        header_font = StyleConfig.get_font("title_bold")
+        for text_widget in [self.summary_text, self.details_text, self.comparisons_text, self.what_if_text]:
+            text_widget.tag_config('bold', font=bold_font)
+            text_widget.tag_config('italic', font=italic_font)
             text_widget.tag_config(
                 'header',
-                font=(StyleConfig.FONT_FAMILY, StyleConfig.FONT_SIZES["title"], 'bold'),
+                font=header_font,
                 foreground=StyleConfig.COLOR_PRIMARY
             )
 
@@ -148,11 +136,76 @@ class ResultsStep(Step):
         total_kg = (age_years * 365 * poop_per_day * grams_per_poop) / 1000  # Convert grams to kg
         return total_kg
 
+    def get_chart_size(self):
+        """
+        Current chart sizes, for prepare_results() (Tk thread only).
+
+        Returns:
+            dict: 'lifetime' and 'factors' (width, height), or None before
+            the charts exist
+        """
+        if self.lifetime_chart is None or self.factors_chart is None:
+            return None
+        return {
+            'lifetime': (self.lifetime_chart.winfo_width(), self.lifetime_chart.winfo_height()),
+            'factors': (self.factors_chart.winfo_width(), self.factors_chart.winfo_height()),
+        }
+
+    def prepare_results(self, all_inputs, chart_size=None, household=None):
+        """
+        Do the heavy part of display_results() without touching widgets, so
+        it can run on a worker thread.
+
+        Args:
+            all_inputs: Answers and calculated values of the active profile
+            chart_size: get_chart_size() result, to lay the charts out
+            household: Household.aggregate() result, if any
+
+        Returns:
+            dict: 'lifetime_curve', 'lifetime_layout' and 'factors_layout'
+            (any of them may be None)
+        """
+        prepared = {'lifetime_curve': None, 'lifetime_layout': None, 'factors_layout': None}
+        if chart_size is not None:
+            labels, series = self.get_factor_series(all_inputs.get('factors', {}), household)
+            prepared['factors_layout'] = FactorChart.layout(labels, series, *chart_size['factors'])
+
+        birth_date = BirthDateModel.get_stored_date(all_inputs)
+        if birth_date is None:
+            return prepared
+        kg_per_day = all_inputs.get('poop_per_day', 0) * all_inputs.get('grams_per_poop', 0) / 1000
+        prepared['lifetime_curve'] = TimeSeries.build_lifetime_curve(birth_date, kg_per_day)
+        if chart_size is not None:
+            prepared['lifetime_layout'] = LifetimeChart.layout(
+                prepared['lifetime_curve'], *chart_size['lifetime']
+            )
+        return prepared
+
+    def show_calculating(self):
+        """Show a placeholder while results are computed in the background."""
+        if self.summary_text is None:
+            return
+        self.summary_text.delete('1.0', tk.END)
+        self.summary_text.insert('1.0', GlyphSupport.text(ResultsModel.HEADERS['summary']) + "\n\n", 'header')
+        self.summary_text.insert('end', "Calculating your results...\n", 'italic')
+
     @ErrorHandler.handle_exception_decorator
-    def display_results(self, all_inputs):
-        """Display results based on collected data from previous steps"""
+    def display_results(self, all_inputs, household=None, what_if=None, prepared=None):
+        """
+        Display results based on collected data from previous steps.
+
+        Args:
+            all_inputs: Answers and calculated values of the active profile
+            household: Household.aggregate() result, shown when it has
+                more than one profile
+            what_if: WhatIf.sweep() result for the active profile
+            prepared: prepare_results() output, if it was computed ahead
+        """
+        if self.summary_text is None:
+            return  # Evicted while the results were being computed
         if not all_inputs:
-            self.results_text.insert('end', "No data available to display.")
+            self.summary_text.delete('1.0', tk.END)
+            self.summary_text.insert('end', "No data available to display.")
             return
 
         # Calculate totals
@@ -163,7 +216,13 @@ class ResultsStep(Step):
         )
 
         # Display summary
-        self.display_summary(total_kg, all_inputs.get('total_poops', 0), all_inputs.get('adjustment_factor', 1.0))
+        self.display_summary(
+            total_kg,
+            all_inputs.get('total_poops', 0),
+            all_inputs.get('adjustment_factor', 1.0),
+            all_inputs.get('percentile'),
+            all_inputs.get('model_percentile')
+        )
 
         # Display details
         self.display_details(all_inputs, total_kg, all_inputs.get('adjustment_factor', 1.0))
@@ -171,19 +230,53 @@ class ResultsStep(Step):
         # Display comparisons
         self.display_comparisons(total_kg)
 
+        # Display lifetime curve
+        self.display_lifetime(all_inputs, prepared)
+
         # Display factors
-        self.display_factors(all_inputs.get('factors', []))
+        self.display_factors(
+            all_inputs.get('factors', {}),
+            household,
+            prepared['factors_layout'] if prepared else None
+        )
+
+        # Display alternatives
+        if what_if is not None:
+            self.display_what_if(what_if)
 
-    def display_summary(self, total_kg, total_poops, adjustment_factor):
+        # Display household totals
+        if household and len(household['names']) > 1:
+            self.display_household(household)
+
+    def display_summary(self, total_kg, total_poops, adjustment_factor, percentile=None,
+                        model_percentile=None):
         self.summary_text.delete('1.0', tk.END)
-        self.summary_text.insert('1.0', f"✨ Summary:\n\n", 'header')
+        self.summary_text.insert('1.0', GlyphSupport.text(ResultsModel.HEADERS['summary']) + "\n\n", 'header')
         self.summary_text.insert('end', f"Total Poop Weight: {total_kg:.2f} kg\n")
         self.summary_text.insert('end', f"Total Poops: {total_poops}\n")
         self.summary_text.insert('end', f"Adjustment Factor: {adjustment_factor:.2f}x\n")
+        if percentile is not None or model_percentile is not None:
+            self.summary_text.insert('end', "\n")
+        if percentile is not None:
+            rank, sessions = percentile
+            self.summary_text.insert(
+                'end',
+                f"You're in the {DataProcessor.format_ordinal(round(rank))} percentile "
+                f"of {sessions:,} sessions "
+                f"from your region and age group\n",
+                'bold'
+            )
+        if model_percentile is not None:
+            self.summary_text.insert(
+                'end',
+                f"Your answers put you in the "
+                f"{DataProcessor.format_ordinal(round(model_percentile))} percentile "
+                f"of {FactorDistribution.describe_population()}\n"
+            )
 
     def display_details(self, all_inputs, total_kg, adjustment_factor):
         self.details_text.delete('1.0', tk.END)
-        self.details_text.insert('1.0', f"🔍 Details:\n\n", 'header')
+        self.details_text.insert('1.0', GlyphSupport.text(ResultsModel.HEADERS['details']) + "\n\n", 'header')
         
         for key, value in all_inputs.items():
             self.details_text.insert('end', f"{key.capitalize()}: {value}\n")
@@ -194,7 +287,7 @@ class ResultsStep(Step):
 
     def display_comparisons(self, total_kg):
         self.comparisons_text.delete('1.0', tk.END)
-        self.comparisons_text.insert('1.0', f"🔄 Comparisons:\n\n", 'header')
+        self.comparisons_text.insert('1.0', GlyphSupport.text(ResultsModel.HEADERS['comparisons']) + "\n\n", 'header')
         
         for comparison_key, comparison_data in self.comparison_data.items():
             if 'weight' in comparison_data:
@@ -206,12 +299,83 @@ class ResultsStep(Step):
                 self.comparisons_text.insert('end', comparison_data['text'].format(comparison_value), 'bold\n')
                 self.comparisons_text.insert('end', f"  {comparison_data['description']}\n\n")
 
-    def display_factors(self, factors):
-        self.factors_frame.delete('1.0', tk.END)
-        self.factors_frame.insert('1.0', f"📊 Impact Factors:\n\n", 'header')
-        
-        for factor, value in factors.items():
-            self.factors_frame.insert('end', f"{factor}: {value}\n")
+    def display_lifetime(self, all_inputs, prepared=None):
+        """Plot cumulative output from birth to the projected end of life."""
+        prepared = prepared or self.prepare_results(all_inputs)
+        if prepared['lifetime_curve'] is None:
+            return
+        self.lifetime_chart.set_curve(prepared['lifetime_curve'], prepared['lifetime_layout'])
+
+    def display_factors(self, factors, household=None, layout=None):
+        """
+        Chart each step's factor, for every profile when there are several.
+
+        Args:
+            factors: Step key -> factor for the active profile
+            household: Household.aggregate() result, if any
+            layout: FactorChart.layout() result computed ahead, if any
+        """
+        labels, series = self.get_factor_series(factors, household)
+        self.factors_chart.set_data(labels, series, layout)
+
+    @staticmethod
+    def get_factor_series(factors, household=None):
+        """
+        Row labels and per-profile factor series for the factors chart.
+
+        Returns:
+            tuple: (labels, series) as FactorChart.set_data() takes them
+        """
+        keys = list(factors)
+        labels = [key.replace('_', ' ').capitalize() for key in keys]
+        if household and len(household['names']) > 1:
+            step_factors = household['step_factors']
+            series = [
+                (name, [step_factors[key][index] for key in keys])
+                for index, name in enumerate(household['names'])
+            ]
+        else:
+            series = [("", [factors[key] for key in keys])]
+        return labels, series
+
+    def display_what_if(self, what_if):
+        """List the answer changes that would move the total the most."""
+        self.what_if_text.delete('1.0', tk.END)
+        self.what_if_text.insert('1.0', GlyphSupport.text(ResultsModel.HEADERS['what_if']) + "\n\n", 'header')
+        if not what_if:
+            self.what_if_text.insert('end', "No other answer would change your total.\n")
+            return
+
+        for result in what_if[:self.WHAT_IF_LIMIT]:
+            self.what_if_text.insert('end', f"{result['delta_kg']:+,.1f} kg", 'bold')
+            self.what_if_text.insert('end', f"  {GlyphSupport.text(WhatIf.describe(result))}\n")
+        if len(what_if) > self.WHAT_IF_LIMIT:
+            self.what_if_text.insert(
+                'end',
+                f"\n...and {len(what_if) - self.WHAT_IF_LIMIT} smaller changes\n",
+                'italic'
+            )
+
+    def display_household(self, household):
+        """Append household totals and each profile's share to the summary."""
+        total_kg = household['total_kg']
+        sum_kg = household['sum_kg']
+        largest = household['max_index']
+
+        self.summary_text.insert('end', "\n")
+        self.summary_text.insert('end', GlyphSupport.text(ResultsModel.HEADERS['household']) + "\n\n", 'header')
+        self.summary_text.insert('end', f"Profiles: {len(household['names'])}\n")
+        self.summary_text.insert('end', f"Combined Weight: {sum_kg:.2f} kg\n")
+        self.summary_text.insert('end', f"Average per Profile: {household['mean_kg']:.2f} kg\n")
+        self.summary_text.insert(
+            'end',
+            f"Biggest Contributor: {household['names'][largest]} "
+            f"({total_kg[largest]:.2f} kg)\n\n",
+            'bold'
+        )
+        for name, kg, factor in zip(household['names'], total_kg, household['factors']):
+            share = kg / sum_kg * 100 if sum_kg else 0.0
+            self.summary_text.insert('end', f"  {name}: {kg:.2f} kg ({share:.0f}%, {factor:.2f}x)\n")
 
     @ErrorHandler.handle_exception_decorator
     def store_input(self) -> dict:
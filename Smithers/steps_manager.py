@@ -1,90 +1,107 @@
 # steps_manager.py
-import os
-import importlib
-import inspect
-from pathlib import Path
-from typing import List, Type
-from steps import Step
+from typing import Any, Iterator, List, Optional
+from steps import Step, UnavailableStep
+from step_registry import StepRegistry, StepSpec
 import tkinter as tk
 from tkinter import ttk
 from helpers.error_handlers import ErrorHandler
 
+class LazyStep:
+    """
+    Stands in for a step until something needs more than its frame or title.
+    The step's module is imported on first use; if that fails, or the
+    registry couldn't read the step at all, the step is replaced by an
+    UnavailableStep instead of disappearing.
+    """
+
+    _OWN_ATTRIBUTES = ('spec', 'registry', 'frame', 'title', '_step')
+
+    def __init__(self, spec: StepSpec, registry: StepRegistry, frame: ttk.Frame) -> None:
+        self.spec = spec
+        self.registry = registry
+        self.frame = frame
+        self.title = spec.title
+        self._step: Optional[Step] = None
+
+    @property
+    def is_loaded(self) -> bool:
+        return self._step is not None
+
+    def resolve(self) -> Step:
+        """Import and instantiate the real step (once)."""
+        if self._step is None and self.spec.error is not None:
+            self._step = UnavailableStep(self.frame, self.title, self.spec.error)
+        elif self._step is None:
+            try:
+                step_class = self.registry.load_class(self.spec)
+                self._step = step_class(self.frame, self.title)
+            except Exception as e:
+                # load_class has already recorded and logged the failure
+                self._step = UnavailableStep(self.frame, self.title, str(e))
+        return self._step
+
+    def get_order(self) -> int:
+        return self.spec.order
+
+    def __getattr__(self, name: str) -> Any:
+        if name == 'inputs' and self._step is None:
+            return {}  # Never shown, nothing stored
+        return getattr(self.resolve(), name)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        if name in self._OWN_ATTRIBUTES:
+            object.__setattr__(self, name, value)
+        else:
+            setattr(self.resolve(), name, value)
+
 class StepsManager:
     """
     Manages the loading and organization of all steps in the application.
     """
     
-    def __init__(self, root: tk.Tk) -> None:
+    def __init__(self, root: tk.Tk, autoload: bool = True, registry: Optional[StepRegistry] = None) -> None:
         """
         Initialize the StepsManager.
         
         Args:
             root: The root Tkinter window
+            autoload: Load every step now; pass False to drive
+                iter_load_steps() in chunks instead
+            registry: Where steps come from (defaults to built-in steps
+                plus installed step packs)
         """
         self.root = root
+        self.registry = registry if registry is not None else StepRegistry()
         self.steps: List[Step] = []
         print("\n=== Starting StepsManager Initialization ===")
-        self.load_steps()
+        if autoload:
+            self.load_steps()
 
     @ErrorHandler.handle_exception_decorator
     def load_steps(self) -> None:
-        """Dynamically load all step classes from the steps directory"""
+        """Register a placeholder for every available step"""
+        for _ in self.iter_load_steps():
+            pass
+
+    def iter_load_steps(self) -> Iterator[str]:
+        """
+        Register steps one at a time.
+        Step modules are not imported here: each step gets a frame and a
+        LazyStep that imports it the first time it is shown. Yields the step
+        name after each one so callers can spread the work over several
+        event-loop iterations.
+        """
         print("\nStarting to load steps...")
-        steps_dir = Path(__file__).parent / 'steps'
-        print(f"Looking for steps in: {steps_dir}")
-        
-        step_classes: List[Type[Step]] = []
-        
-        # Import all python files in the steps directory
-        print("\nScanning for step files...")
-        for file in steps_dir.glob('*.py'):
-            if file.name != '__init__.py':
-                module_name = f"steps.{file.stem}"
-                print(f"\nAttempting to load: {module_name}")
-                try:
-                    module = importlib.import_module(module_name)
-                    print(f"Successfully imported {module_name}")
-                    
-                    # Find all Step subclasses in the module
-                    for name, obj in inspect.getmembers(module):
-                        if (inspect.isclass(obj) and
-                            issubclass(obj, Step) and
-                            obj != Step):
-                            print(f"Found step class: {name}")
-                            step_classes.append(obj)
-                except Exception as e:
-                    print(f"Error loading {module_name}: {str(e)}")
-                    continue  # Continue loading other steps even if one fails
-
-        if not step_classes:
-            print("\nWarning: No step classes were loaded!")
+        specs = self.registry.discover()
+        if not specs:
+            print("\nWarning: No steps were found!")
             return
 
-        print(f"\nFound {len(step_classes)} step classes")
-        
-        # Sort step classes by their _order attribute
-        print("\nSorting step classes...")
-        step_classes.sort(key=lambda x: getattr(x, '_order', 999))
-        
-        # Create instances of each step
-        print("\nCreating step instances...")
-        for step_class in step_classes:
-            try:
-                print(f"Creating instance of: {step_class.__name__}")
-                frame = ttk.Frame(self.root, padding="20")
-                
-                # Generate a title from the class name
-                title = ' '.join(
-                    word.capitalize() 
-                    for word in step_class.__name__.replace('Step', '').split('_')
-                )
-                
-                # Create step instance with frame and title
-                step = step_class(frame, title)
-                self.steps.append(step)
-                print(f"Successfully created: {step_class.__name__}")
-            except Exception as e:
-                print(f"Error creating instance of {step_class.__name__}: {str(e)}")
+        print(f"\nFound {len(specs)} steps")
+        for spec in specs:
+            frame = ttk.Frame(self.root, padding="20")
+            self.steps.append(LazyStep(spec, self.registry, frame))
+            yield spec.name
 
         print(f"\nFinished loading steps. Total steps loaded: {len(self.steps)}")
         print("=== StepsManager Initialization Complete ===\n")
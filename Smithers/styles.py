@@ -1,5 +1,5 @@
-# styles.py
 from tkinter import ttk
+import tkinter.font as tkfont
 
 class StyleConfig:
     # Color scheme
@@ -9,6 +9,35 @@ class StyleConfig:
     COLOR_BACKGROUND = "#f8fafc"  # Clean white
     COLOR_TEXT = "#1e293b"       # Dark gray
 
+    # Named color palettes that can be switched at runtime
+    THEMES = {
+        "light": {
+            "primary": "#2563eb",
+            "secondary": "#1e40af",
+            "accent": "#3b82f6",
+            "background": "#f8fafc",
+            "text": "#1e293b",
+            "button_text": "white"
+        },
+        "dark": {
+            "primary": "#3b82f6",
+            "secondary": "#60a5fa",
+            "accent": "#93c5fd",
+            "background": "#0f172a",
+            "text": "#e2e8f0",
+            "button_text": "white"
+        },
+        "high-contrast": {
+            "primary": "#000000",
+            "secondary": "#0000cc",
+            "accent": "#ffff00",
+            "background": "#ffffff",
+            "text": "#000000",
+            "button_text": "#ffffff"
+        }
+    }
+    DEFAULT_THEME = "light"
+
     # Font configurations
     FONT_FAMILY = "Helvetica"
     FONT_SIZES = {
@@ -18,136 +47,321 @@ class StyleConfig:
         "title": 14,
         "xlarge": 16  # Added this for consistency with other code
     }
-    
+
     # Add these for direct access (to match existing code references)
     FONT_SIZE_SMALL = FONT_SIZES["small"]
     FONT_SIZE_NORMAL = FONT_SIZES["regular"]
     FONT_SIZE_LARGE = FONT_SIZES["large"]
     FONT_SIZE_XLARGE = FONT_SIZES["xlarge"]
 
+    # Named fonts shared by every widget: name -> (size key, weight, slant)
+    FONT_SPECS = {
+        "small": ("small", "normal", "roman"),
+        "regular": ("regular", "normal", "roman"),
+        "italic": ("regular", "normal", "italic"),
+        "large": ("large", "normal", "roman"),
+        "header": ("large", "bold", "roman"),
+        "title": ("title", "normal", "roman"),
+        "title_bold": ("title", "bold", "roman"),
+        "xlarge": ("xlarge", "normal", "roman")
+    }
+
+    # Theme state
+    current_theme = None
+    _configured_for = None   # Tcl interpreter the base theme was applied to
+    _compiled_themes = {}    # Theme name -> precompiled Tcl script
+
+    # Font registry state
+    font_size_offset = 0
+    _fonts = {}              # Font name -> tkfont.Font
+    _fonts_for = None        # Tcl interpreter the fonts were created in
+
     @classmethod
-    def configure_styles(cls):
-        style = ttk.Style()
-        
+    def configure_styles(cls, root=None):
+        """
+        Apply the base theme and the default palette.
+        Safe to call repeatedly: the work is only done once per Tk interpreter.
+
+        Args:
+            root: Optional Tk root (defaults to the default root)
+
+        Returns:
+            ttk.Style: The configured style object
+        """
+        style = ttk.Style(root)
+        if cls._configured_for is style.tk:
+            return style
+
+        # Named fonts must exist before the styles reference them
+        cls.create_fonts(root)
+
         # Use the built-in 'clam' theme as base
         style.theme_use('clam')
+        cls._configured_for = style.tk
+
+        # A fresh interpreter starts unstyled, so re-apply the active palette
+        theme = cls.current_theme or cls.DEFAULT_THEME
+        cls.current_theme = None
+        cls.apply_theme(theme, style)
+        return style
+
+    @classmethod
+    def apply_theme(cls, name, style=None):
+        """
+        Switch to a named palette with a single Tcl batch.
+        ttk widgets pick up the new style options on their own, so nothing
+        has to be restyled widget by widget.
+
+        Args:
+            name: Key into THEMES
+            style: Optional ttk.Style bound to the target interpreter
+        """
+        if name not in cls.THEMES:
+            raise ValueError(f"Unknown theme: {name}")
+        if name == cls.current_theme and style is None:
+            return
+
+        style = style or ttk.Style()
+        style.tk.eval(cls.compile_theme(name))
+
+        # Keep the class colors in sync for non-ttk widgets built later
+        palette = cls.THEMES[name]
+        cls.COLOR_PRIMARY = palette["primary"]
+        cls.COLOR_SECONDARY = palette["secondary"]
+        cls.COLOR_ACCENT = palette["accent"]
+        cls.COLOR_BACKGROUND = palette["background"]
+        cls.COLOR_TEXT = palette["text"]
+        cls.current_theme = name
+
+    @classmethod
+    def create_fonts(cls, root=None):
+        """
+        Create the named fonts once per Tk interpreter.
+
+        Args:
+            root: Optional Tk root (defaults to the default root)
+        """
+        interp = root.tk if root is not None else ttk.Style().tk
+        if cls._fonts_for is interp:
+            return
+
+        cls._fonts = {}
+        for name, (size_key, weight, slant) in cls.FONT_SPECS.items():
+            cls._fonts[name] = tkfont.Font(
+                root=root,
+                name=cls.get_font_name(name),
+                family=cls.FONT_FAMILY,
+                size=cls.FONT_SIZES[size_key] + cls.font_size_offset,
+                weight=weight,
+                slant=slant
+            )
+        cls._fonts_for = interp
+
+    @classmethod
+    def get_font(cls, name="regular"):
+        """
+        Return a shared named font, creating the registry on first use.
+
+        Args:
+            name: Key into FONT_SPECS
+
+        Returns:
+            tkfont.Font: The named font
+        """
+        if not cls._fonts:
+            cls.create_fonts()
+        return cls._fonts[name]
+
+    @staticmethod
+    def get_font_name(name):
+        """Return the Tk name of a registry font (usable before it exists)."""
+        return "Smithers" + ''.join(part.capitalize() for part in name.split('_'))
+
+    @classmethod
+    def set_font_size_offset(cls, offset):
+        """
+        Grow or shrink every registry font; widgets using them update in place.
+
+        Args:
+            offset: Points added to each base size in FONT_SIZES
+        """
+        cls.font_size_offset = offset
+        for name, font in cls._fonts.items():
+            size_key = cls.FONT_SPECS[name][0]
+            font.configure(size=cls.FONT_SIZES[size_key] + offset)
+
+    @classmethod
+    def set_font_family(cls, family):
+        """
+        Switch the family of every registry font.
+
+        Args:
+            family: Font family name
+        """
+        cls.FONT_FAMILY = family
+        for font in cls._fonts.values():
+            font.configure(family=family)
+
+    @classmethod
+    def compile_theme(cls, name):
+        """
+        Return the Tcl script for a theme, building it on first use.
+
+        Args:
+            name: Key into THEMES
+
+        Returns:
+            str: Newline-separated ttk::style commands
+        """
+        script = cls._compiled_themes.get(name)
+        if script is None:
+            lines = []
+            for command, style_name, options in cls.get_style_spec(cls.THEMES[name]):
+                args = ' '.join(
+                    f"-{option} {cls._tcl_value(value)}"
+                    for option, value in options.items()
+                )
+                lines.append(f"ttk::style {command} {style_name} {args}")
+            script = '\n'.join(lines)
+            cls._compiled_themes[name] = script
+        return script
+
+    @staticmethod
+    def _tcl_value(value):
+        """Quote a Python option value as a Tcl word."""
+        if isinstance(value, (list, tuple)):
+            value = ' '.join(
+                StyleConfig._tcl_value(item) for item in value
+            )
+            return '{' + value + '}'
+        value = str(value)
+        if not value or any(char in value for char in ' {}"\\[]$;'):
+            return '{' + value + '}'
+        return value
+
+    @classmethod
+    def get_style_spec(cls, palette):
+        """
+        Describe every ttk style for a palette.
+
+        Args:
+            palette: One of the THEMES dictionaries
+
+        Returns:
+            list: (command, style name, options) tuples
+        """
+        return [
+            # Configure main styles
+            ('configure', 'TFrame', {
+                'background': palette["background"]
+            }),
 
-        # Configure main styles
-        style.configure('TFrame',
-            background=cls.COLOR_BACKGROUND
-        )
-
-        # Basic label style
-        style.configure('TLabel',
-            background=cls.COLOR_BACKGROUND,
-            foreground=cls.COLOR_TEXT,
-            font=(cls.FONT_FAMILY, cls.FONT_SIZES["regular"])
-        )
-
-        # Header label style
-        style.configure('Header.TLabel',
-            font=(cls.FONT_FAMILY, cls.FONT_SIZES["large"], 'bold')
-        )
-
-        # Title label style
-        style.configure('Title.TLabel',
-            font=(cls.FONT_FAMILY, cls.FONT_SIZES["title"], 'bold')
-        )
-
-        # Description label style
-        style.configure('Description.TLabel',
-            font=(cls.FONT_FAMILY, cls.FONT_SIZES["regular"]),
-            wraplength=300,
-            justify='left'
-        )
-
-        # Button styles
-        style.configure('TButton',
-            background=cls.COLOR_PRIMARY,
-            foreground='white',
-            padding=10,
-            font=(cls.FONT_FAMILY, cls.FONT_SIZES["regular"]),
-            borderwidth=0
-        )
-
-        style.map('TButton',
-            background=[('active', cls.COLOR_SECONDARY)],
-            foreground=[('active', 'white')]
-        )
-
-        # Radio button style
-        style.configure('TRadiobutton',
-            background=cls.COLOR_BACKGROUND,
-            foreground=cls.COLOR_TEXT,
-            font=(cls.FONT_FAMILY, cls.FONT_SIZES["regular"])
-        )
-
-        # Checkbox style
-        style.configure('TCheckbutton',
-            background=cls.COLOR_BACKGROUND,
-            foreground=cls.COLOR_TEXT,
-            font=(cls.FONT_FAMILY, cls.FONT_SIZES["regular"])
-        )
-
-        # Combobox style
-        style.configure('TCombobox',
-            background=cls.COLOR_BACKGROUND,
-            foreground=cls.COLOR_TEXT,
-            fieldbackground=cls.COLOR_BACKGROUND,
-            font=(cls.FONT_FAMILY, cls.FONT_SIZES["regular"])
-        )
-
-        # Scale (slider) style
-        style.configure('TScale',
-            background=cls.COLOR_BACKGROUND,
-            troughcolor=cls.COLOR_PRIMARY,
-            sliderrelief='flat',
-            sliderlength=15,
-            sliderthickness=15,
-            troughheight=10
-        )
-
-        # Progress style
-        style.configure('Progress.TLabel',
-            font=(cls.FONT_FAMILY, cls.FONT_SIZES["small"]),
-            foreground=cls.COLOR_SECONDARY
-        )
-
-        # Results frame style
-        style.configure('Results.TFrame',
-            background=cls.COLOR_BACKGROUND,
-            relief='solid',
-            borderwidth=1
-        )
-
-        # Text widget style (for results)
-        style.configure('Results.TText',
-            background=cls.COLOR_BACKGROUND,
-            foreground=cls.COLOR_TEXT,
-            font=(cls.FONT_FAMILY, cls.FONT_SIZES["regular"]),
-            padx=10,
-            pady=10
-        )
-
-        # Progress indicator styles
-        style.configure('Progress.TLabel',
-            font=(cls.FONT_FAMILY, cls.FONT_SIZES["small"]),
-            foreground=cls.COLOR_SECONDARY,
-            background=cls.COLOR_BACKGROUND
-        )
-
-        style.configure('TProgressbar',
-            background=cls.COLOR_PRIMARY,
-            troughcolor=cls.COLOR_BACKGROUND,
-            borderwidth=0,
-            thickness=6
-        )
+            # Basic label style
+            ('configure', 'TLabel', {
+                'background': palette["background"],
+                'foreground': palette["text"],
+                'font': cls.get_font_name("regular")
+            }),
+
+            # Header label style
+            ('configure', 'Header.TLabel', {
+                'font': cls.get_font_name("header")
+            }),
+
+            # Title label style
+            ('configure', 'Title.TLabel', {
+                'font': cls.get_font_name("title_bold")
+            }),
+
+            # Description label style
+            ('configure', 'Description.TLabel', {
+                'font': cls.get_font_name("regular"),
+                'wraplength': 300,
+                'justify': 'left'
+            }),
+
+            # Button styles
+            ('configure', 'TButton', {
+                'background': palette["primary"],
+                'foreground': palette["button_text"],
+                'padding': 10,
+                'font': cls.get_font_name("regular"),
+                'borderwidth': 0
+            }),
+
+            ('map', 'TButton', {
+                'background': ('active', palette["secondary"]),
+                'foreground': ('active', palette["button_text"])
+            }),
+
+            # Radio button style
+            ('configure', 'TRadiobutton', {
+                'background': palette["background"],
+                'foreground': palette["text"],
+                'font': cls.get_font_name("regular")
+            }),
+
+            # Checkbox style
+            ('configure', 'TCheckbutton', {
+                'background': palette["background"],
+                'foreground': palette["text"],
+                'font': cls.get_font_name("regular")
+            }),
+
+            # Combobox style
+            ('configure', 'TCombobox', {
+                'background': palette["background"],
+                'foreground': palette["text"],
+                'fieldbackground': palette["background"],
+                'font': cls.get_font_name("regular")
+            }),
+
+            # Scale (slider) style
+            ('configure', 'TScale', {
+                'background': palette["background"],
+                'troughcolor': palette["primary"],
+                'sliderrelief': 'flat',
+                'sliderlength': 15,
+                'sliderthickness': 15,
+                'troughheight': 10
+            }),
+
+            # Progress indicator styles
+            ('configure', 'Progress.TLabel', {
+                'font': cls.get_font_name("small"),
+                'foreground': palette["secondary"],
+                'background': palette["background"]
+            }),
+
+            # Results frame style
+            ('configure', 'Results.TFrame', {
+                'background': palette["background"],
+                'relief': 'solid',
+                'borderwidth': 1
+            }),
+
+            # Text widget style (for results)
+            ('configure', 'Results.TText', {
+                'background': palette["background"],
+                'foreground': palette["text"],
+                'font': cls.get_font_name("regular"),
+                'padx': 10,
+                'pady': 10
+            }),
+
+            ('configure', 'TProgressbar', {
+                'background': palette["primary"],
+                'troughcolor': palette["background"],
+                'borderwidth': 0,
+                'thickness': 6
+            })
+        ]
 
     @classmethod
     def get_text_widget_config(cls):
         """Return configuration for Text widgets (which can't use ttk styles)"""
         return {
-            'font': (cls.FONT_FAMILY, cls.FONT_SIZES["regular"]),
+            'font': cls.get_font("regular"),
             'bg': cls.COLOR_BACKGROUND,
             'fg': cls.COLOR_TEXT,
             'padx': 10,
@@ -159,7 +373,7 @@ class StyleConfig:
     def get_label_config(cls, style_type="regular"):
         """Return configuration for labels"""
         return {
-            'font': (cls.FONT_FAMILY, cls.FONT_SIZES[style_type]),
+            'font': cls.get_font(style_type),
             'background': cls.COLOR_BACKGROUND,
             'foreground': cls.COLOR_TEXT
-        }
\ No newline at end of file
+        }
@@ -0,0 +1,164 @@
+# tests/test_answer_journal.py
+import os
+import tempfile
+import unittest
+from datetime import date
+from models.answer_journal import AnswerJournal
+from models.birth_date_model import BirthDateModel
+from models.diet_model import DietModel
+from models.factor_table import FactorTable
+from models.household import Household
+from models.region_model import RegionModel
+
+class AnswerJournalTest(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.table = FactorTable()
+        cls.diets = DietModel.get_option_keys()
+        cls.regions = RegionModel.get_option_keys()
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, 'session.journal')
+        self.journals = []
+
+    def tearDown(self):
+        for journal in self.journals:
+            journal.close()
+        self.tmp.cleanup()
+
+    def open(self):
+        journal = AnswerJournal(self.path, self.table)
+        self.journals.append(journal)
+        return journal
+
+    def reopen(self, journal):
+        """Simulate a crash: drop the handle without compacting and replay the file."""
+        journal.file.close()
+        return self.open()
+
+    def write_session(self, journal):
+        journal.add_profile("Ann", step=0)
+        journal.record_answers(0, DietModel.store(self.diets[1]), step=3)
+        journal.add_profile("Bo", step=0)
+        journal.record_answers(1, {**RegionModel.store(self.regions[2]),
+                                   **BirthDateModel.store(date(1990, 5, 17))}, step=9)
+        journal.switch_profile(0, step=4)
+
+    def assert_session(self, journal):
+        self.assertTrue(journal.has_session)
+        self.assertEqual(journal.household.names, ["Ann", "Bo"])
+        self.assertEqual(DietModel.get_stored_selection(journal.household.get_answers(0)), self.diets[1])
+        answers = journal.household.get_answers(1)
+        self.assertEqual(RegionModel.get_stored_selection(answers), self.regions[2])
+        self.assertEqual(BirthDateModel.get_stored_date(answers), date(1990, 5, 17))
+        self.assertEqual(journal.active_profile, 0)
+        self.assertEqual(journal.step_index, 4)
+
+    def test_replays_session(self):
+        journal = self.open()
+        self.assertFalse(journal.has_session)
+        self.write_session(journal)
+        self.assert_session(self.reopen(journal))
+
+    def test_torn_tail_is_cut_at_last_good_record(self):
+        journal = self.open()
+        self.write_session(journal)
+        intact = os.path.getsize(self.path)
+        journal.record_answers(0, DietModel.store(self.diets[2]), step=5)
+        full = os.path.getsize(self.path)
+        journal.file.close()
+
+        # Every partial write of the last record recovers the state before it
+        for cut in range(intact + 1, full):
+            with self.subTest(cut=cut):
+                with open(self.path, 'r+b') as file:
+                    file.truncate(cut)
+                recovered = self.open()
+                self.assert_session(recovered)
+                self.assertEqual(os.path.getsize(self.path), intact)
+                recovered.file.close()
+                with open(self.path, 'ab') as file:
+                    file.write(journal.encode(AnswerJournal.ANSWERS, 0, 5,
+                                              journal.encode_profile(0, DietModel.store(self.diets[2]))))
+
+    def test_corrupt_record_is_cut(self):
+        journal = self.open()
+        self.write_session(journal)
+        intact = os.path.getsize(self.path)
+        journal.switch_profile(1, step=7)
+        journal.file.close()
+        with open(self.path, 'r+b') as file:
+            file.seek(-1, os.SEEK_END)
+            last = file.read(1)
+            file.seek(-1, os.SEEK_END)
+            file.write(bytes([last[0] ^ 0xFF]))
+
+        recovered = self.open()
+        self.assert_session(recovered)
+        self.assertEqual(os.path.getsize(self.path), intact)
+
+        # New records follow the cut and survive the next recovery
+        recovered.switch_profile(1, step=2)
+        again = self.reopen(recovered)
+        self.assertEqual((again.active_profile, again.step_index), (1, 2))
+
+    def test_foreign_file_starts_fresh(self):
+        with open(self.path, 'wb') as file:
+            file.write(b'not a journal')
+        journal = self.open()
+        self.assertFalse(journal.has_session)
+        journal.add_profile("Ann")
+        self.assertEqual(self.reopen(journal).household.names, ["Ann"])
+
+    def test_compaction_keeps_session(self):
+        journal = self.open()
+        journal.add_profile("Ann", step=0)
+        for diet in self.diets:
+            journal.record_answers(0, DietModel.store(diet), step=2)
+        journal.add_profile("Bo", step=0)
+        journal.remove_profile(1)
+        journal.add_profile("Bo", step=0)
+        journal.record_answers(1, {**RegionModel.store(self.regions[2]),
+                                   **BirthDateModel.store(date(1990, 5, 17))}, step=9)
+        journal.record_answers(0, DietModel.store(self.diets[1]), step=3)
+        journal.switch_profile(0, step=4)
+        before = os.path.getsize(self.path)
+        journal.compact()
+        self.assertLess(os.path.getsize(self.path), before)
+        self.assert_session(self.reopen(journal))
+
+    def test_compacts_past_threshold(self):
+        journal = self.open()
+        self.write_session(journal)
+        for index in range(AnswerJournal.COMPACT_BYTES // 20):
+            journal.record_answers(0, DietModel.store(self.diets[index % len(self.diets)]), step=3)
+            self.assertLessEqual(os.path.getsize(self.path), AnswerJournal.COMPACT_BYTES + 64)
+        journal.record_answers(0, DietModel.store(self.diets[1]), step=3)
+        journal.switch_profile(0, step=4)
+        self.assertFalse(os.path.exists(self.path[:-len('.journal')] + '.tmp'))
+        self.assert_session(self.reopen(journal))
+
+    def test_start_and_finish(self):
+        household = Household(self.table)
+        household.add("Ann", DietModel.store(self.diets[2]))
+        journal = self.open()
+        journal.start(household, 0, step=6)
+        household.add("Not journaled")
+        recovered = self.reopen(journal)
+        self.assertEqual(recovered.household.names, ["Ann"])
+        self.assertEqual(recovered.step_index, 6)
+
+        recovered.finish()
+        self.assertFalse(self.reopen(recovered).has_session)
+
+    def test_rejects_records_for_missing_profiles(self):
+        journal = self.open()
+        with self.assertRaises(ValueError):
+            journal.switch_profile(3)
+        self.assertFalse(self.reopen(journal).has_session)
+
+
+if __name__ == '__main__':
+    unittest.main()
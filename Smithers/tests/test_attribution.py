@@ -0,0 +1,75 @@
+# tests/test_attribution.py
+import math
+import random
+import unittest
+from array import array
+from helpers.data_processing import DataProcessor
+from models.factor_table import FactorTable
+
+class AttributionTest(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.table = FactorTable()
+        generator = random.Random(3)
+        cls.rows = [
+            [generator.randrange(len(cls.table.options[key])) for key in cls.table.keys]
+            for _ in range(200)
+        ]
+
+    def answers_for(self, row):
+        answers = {}
+        for key, code in zip(self.table.keys, row):
+            answers.update(self.table.models[key].store(self.table.options[key][code]))
+        return answers
+
+    def test_contributions_add_up_to_log_total(self):
+        for row in self.rows[:50]:
+            result = DataProcessor.attribute_adjustment_factor(self.answers_for(row))
+            answers = self.answers_for(row)
+            self.assertAlmostEqual(result['total_factor'], DataProcessor.calculate_adjustment_factor(answers))
+            self.assertAlmostEqual(sum(result['contributions'].values()), math.log(result['total_factor']))
+            self.assertAlmostEqual(result['log_total'], math.log(result['total_factor']))
+
+    def test_table_matches_per_answer_attribution(self):
+        columns = {
+            key: array(FactorTable.CODE_TYPE, (row[column] for row in self.rows))
+            for column, key in enumerate(self.table.keys)
+        }
+        contributions = self.table.attribute(columns)
+        self.assertEqual(tuple(contributions), self.table.keys)
+        for index, row in enumerate(self.rows):
+            total = sum(contributions[key][index] for key in self.table.keys)
+            self.assertAlmostEqual(total, math.log(self.table.factor_of(row)))
+            result = DataProcessor.attribute_adjustment_factor(self.answers_for(row))
+            self.assertAlmostEqual(total, result['log_total'])
+
+    def test_same_keys_and_order_for_both(self):
+        row = self.rows[0]
+        per_answer = DataProcessor.attribute_adjustment_factor(self.answers_for(row))['contributions']
+        columns = {key: array(FactorTable.CODE_TYPE, [code]) for key, code in zip(self.table.keys, row)}
+        batch = self.table.attribute(columns)
+        self.assertEqual(list(per_answer), list(batch))
+        self.assertEqual(tuple(per_answer), self.table.keys)
+        for key in self.table.keys:
+            self.assertAlmostEqual(per_answer[key], batch[key][0])
+        self.assertEqual(
+            list(DataProcessor.attribute_adjustment_factor({})['contributions']), list(self.table.keys)
+        )
+
+    def test_missing_columns_use_default_option(self):
+        contributions = self.table.attribute({'diet': array(FactorTable.CODE_TYPE, [1, 2])})
+        self.assertEqual(len(contributions['region']), 2)
+        for key in self.table.keys:
+            if key != 'diet':
+                default = self.table.codes[key][self.table.models[key].DEFAULT_OPTION]
+                self.assertEqual(list(contributions[key]), [self.table.log_factors[key][default]] * 2)
+        self.assertAlmostEqual(contributions['diet'][0], math.log(1.2))
+
+    def test_log_factor_of_zero(self):
+        self.assertEqual(DataProcessor.log_factor(0), float('-inf'))
+        self.assertEqual(DataProcessor.log_factor(1), 0.0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,103 @@
+# tests/test_cli.py
+import contextlib
+import io
+import os
+import tempfile
+import unittest
+import cli
+
+PROFILES = "name,birth_date,region,diet\nAnn,1990-01-01,Europe,High fiber diet\nBo,1960-06-15,Asia,\n"
+
+class CliTest(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.profiles = self.path('profiles.csv')
+        with open(self.profiles, 'w', encoding='utf-8') as file:
+            file.write(PROFILES)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def path(self, name):
+        return os.path.join(self.tmp.name, name)
+
+    def run_cli(self, *argv):
+        """Run a command and return its standard output."""
+        output = io.StringIO()
+        with contextlib.redirect_stdout(output), contextlib.redirect_stderr(io.StringIO()):
+            cli.main(list(argv))
+        return output.getvalue()
+
+    def test_sketch_build_requires_output(self):
+        with self.assertRaises(SystemExit):
+            self.run_cli('sketch', 'build', self.profiles)
+        with open(self.profiles, encoding='utf-8') as file:
+            self.assertEqual(file.read(), PROFILES)
+
+    def test_sketch_refuses_to_overwrite_input(self):
+        with self.assertRaises(SystemExit):
+            self.run_cli('sketch', 'build', '-o', self.profiles, self.profiles)
+        with open(self.profiles, encoding='utf-8') as file:
+            self.assertEqual(file.read(), PROFILES)
+
+        stats = self.path('stats.bin')
+        self.run_cli('sketch', 'build', '-o', stats, self.profiles)
+        with open(stats, 'rb') as file:
+            saved = file.read()
+        with self.assertRaises(SystemExit):
+            self.run_cli('sketch', 'merge', '-o', stats, stats)
+        with open(stats, 'rb') as file:
+            self.assertEqual(file.read(), saved)
+
+    def test_sketch_build_merge_show(self):
+        stats = self.path('stats.bin')
+        merged = self.path('merged.bin')
+        self.run_cli('sketch', 'build', '-o', stats, '--today', '2026-01-01', self.profiles)
+        self.run_cli('sketch', 'merge', '-o', merged, stats, stats)
+        rows = self.run_cli('sketch', 'show', merged).splitlines()
+        self.assertEqual(rows[0], 'region,age_band,sessions,p10_kg,p50_kg,p90_kg')
+        self.assertEqual(sorted(row.split(',')[:3] for row in rows[1:]),
+                         [['Asia', '60-74', '2'], ['Europe', '30-44', '2']])
+
+    def test_sketch_show_rejects_other_files(self):
+        with self.assertRaises(SystemExit) as raised:
+            self.run_cli('sketch', 'show', self.profiles)
+        self.assertIn('Not a session stats file', str(raised.exception))
+
+    def test_lookup_top_and_bottom(self):
+        self.assertEqual(self.run_cli('lookup', '--top', '0').count('\n'), 1)
+        rows = self.run_cli('lookup', '--bottom', '3').splitlines()
+        self.assertEqual(len(rows), 4)
+        self.assertTrue(rows[0].startswith('adjustment_factor,'))
+
+    def test_lookup_requires_one_selector(self):
+        with self.assertRaises(SystemExit):
+            self.run_cli('lookup')
+        with self.assertRaises(SystemExit):
+            self.run_cli('lookup', '--top', '1', '--bottom', '1')
+
+    def test_percentile(self):
+        rows = self.run_cli('percentile', self.profiles).splitlines()
+        self.assertEqual(rows[0], 'name,adjustment_factor,model_percentile')
+        self.assertEqual([row.split(',')[0] for row in rows[1:]], ['Ann', 'Bo'])
+
+    def test_percentile_blames_the_right_file(self):
+        priors = self.path('priors.json')
+        with open(priors, 'w', encoding='utf-8') as file:
+            file.write('{"*": {"diet": {"Raw diet": 1.0}}}')
+        with self.assertRaises(SystemExit) as raised:
+            self.run_cli('percentile', '--priors', priors, self.profiles)
+        self.assertTrue(str(raised.exception).startswith(f"{priors}: Unknown diet options"))
+
+        export = self.path('export')
+        self.run_cli('export', self.profiles, export)
+        os.truncate(os.path.join(export, 'diet.npy'), 129)
+        with self.assertRaises(SystemExit) as raised:
+            self.run_cli('percentile', export)
+        self.assertTrue(str(raised.exception).startswith(f"{export}: "))
+        self.assertIn('truncated', str(raised.exception))
+
+
+if __name__ == '__main__':
+    unittest.main()
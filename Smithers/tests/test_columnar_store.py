@@ -0,0 +1,82 @@
+# tests/test_columnar_store.py
+import json
+import os
+import tempfile
+import unittest
+from array import array
+from helpers.columnar_store import ColumnarStore, ColumnarReader
+
+class ColumnarStoreTest(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.directory = os.path.join(self.tmp.name, 'export')
+        self.columns = {
+            'name': ["Ann", "Bo", "Çelik 💩"],
+            'diet': array('B', [0, 2, 1]),
+            'birth_date': array('i', [-365, 0, 19000]),
+            'factor': array('f', [0.5, 1.0, 1.25]),
+            'total_kg': array('d', [12.5, 0.0, 4321.125]),
+        }
+        ColumnarStore.write(self.directory, self.columns, {'diet': {'options': ['a', 'b', 'c']}})
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_round_trip(self):
+        with ColumnarReader(self.directory) as reader:
+            self.assertEqual(reader.rows, 3)
+            self.assertEqual(reader.names, list(self.columns))
+            self.assertEqual(reader.options('diet'), ['a', 'b', 'c'])
+            for name, values in self.columns.items():
+                with self.subTest(column=name):
+                    self.assertEqual(list(reader[name]), list(values))
+            self.assertEqual(reader['name'][-1], "Çelik 💩")
+            self.assertEqual(reader['name'][1:], ["Bo", "Çelik 💩"])
+
+    def test_empty_export(self):
+        ColumnarStore.write(self.directory, {'name': [], 'diet': array('B')})
+        with ColumnarReader(self.directory) as reader:
+            self.assertEqual(reader.rows, 0)
+            self.assertEqual(list(reader['name']), [])
+            self.assertEqual(list(reader['diet']), [])
+
+    def test_npy_header_is_numpy_compatible(self):
+        with open(os.path.join(self.directory, 'total_kg.npy'), 'rb') as file:
+            data = file.read()
+        header = ColumnarStore.read_npy_header(data)
+        self.assertEqual(header['descr'], '<f8')
+        self.assertEqual(header['shape'], (3,))
+        self.assertEqual(header['offset'] % ColumnarStore.NPY_ALIGNMENT, 0)
+
+    def test_truncated_column_raises(self):
+        path = os.path.join(self.directory, 'total_kg.npy')
+        with open(path, 'r+b') as file:
+            file.truncate(os.path.getsize(path) - 1)
+        with ColumnarReader(self.directory) as reader:
+            with self.assertRaises(ValueError):
+                reader['total_kg']
+            self.assertEqual(list(reader['diet']), [0, 2, 1])
+
+    def test_row_count_mismatch_raises(self):
+        header_path = os.path.join(self.directory, ColumnarStore.HEADER_FILE)
+        with open(header_path, encoding='utf-8') as file:
+            header = json.load(file)
+        header['rows'] = 2
+        with open(header_path, 'w', encoding='utf-8') as file:
+            json.dump(header, file)
+        with ColumnarReader(self.directory) as reader:
+            with self.assertRaises(ValueError):
+                reader['diet']
+            with self.assertRaises(ValueError):
+                reader['name']
+
+    def test_rejects_unequal_columns(self):
+        with self.assertRaises(ValueError):
+            ColumnarStore.write(self.directory, {'a': array('B', [1]), 'b': array('B', [1, 2])})
+        with self.assertRaises(ValueError):
+            ColumnarStore.write(self.directory, {'a': array('q', [1])})
+
+
+if __name__ == '__main__':
+    unittest.main()
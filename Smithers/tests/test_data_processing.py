@@ -0,0 +1,49 @@
+# tests/test_data_processing.py
+import unittest
+from helpers.data_processing import DataProcessor
+from models.factor_table import FactorTable, OPTION_MODELS
+
+class AdjustmentModelTest(unittest.TestCase):
+    """Pins the totals of the adjustment model as shipped."""
+
+    def answers(self, **selections):
+        answers = {}
+        for model in OPTION_MODELS:
+            option = selections.get(model.STORE_KEY, model.DEFAULT_OPTION)
+            answers.update(model.store(option))
+        return answers
+
+    def test_default_answers(self):
+        self.assertEqual(DataProcessor.calculate_adjustment_factor(self.answers()), 1.0)
+        self.assertEqual(DataProcessor.calculate_adjustment_factor({}), 1.0)
+
+    def test_diet_and_region_factors_apply(self):
+        answers = self.answers(diet='High fiber diet', region='Europe')
+        self.assertAlmostEqual(DataProcessor.calculate_adjustment_factor(answers), 1.2 * 1.1)
+        answers = self.answers(diet='Low fiber diet', region='Asia')
+        self.assertAlmostEqual(DataProcessor.calculate_adjustment_factor(answers), 0.8 * 0.9)
+
+    def test_other_steps_leave_the_total_unchanged(self):
+        table = FactorTable()
+        for key in table.keys:
+            if key in ('diet', 'region'):
+                continue
+            for option in table.options[key]:
+                with self.subTest(key=key, option=option):
+                    answers = self.answers(**{key: option})
+                    self.assertEqual(DataProcessor.calculate_adjustment_factor(answers), 1.0)
+
+    def test_totals(self):
+        answers = self.answers(diet='High fiber diet', region='Europe')
+        factor = DataProcessor.calculate_adjustment_factor(answers)
+        totals = DataProcessor.calculate_total_poop(
+            40, DataProcessor.BASE_POOPS_PER_DAY, DataProcessor.BASE_GRAMS_PER_POOP, factor
+        )
+        self.assertEqual(totals['total_poops'], 19272)
+        self.assertAlmostEqual(totals['total_kg'], 40 * 365 * 1.32 * 128 / 1000)
+        self.assertAlmostEqual(totals['average_per_day'], 1.32)
+        self.assertEqual(totals['adjusted_grams_per_poop'], 128.0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,56 @@
+# tests/test_factor_distribution.py
+import itertools
+import unittest
+from models.factor_distribution import FactorDistribution
+from models.factor_table import FactorTable
+
+class FactorDistributionTest(unittest.TestCase):
+
+    def setUp(self):
+        self.table = FactorTable()
+
+    def brute_force_percentile(self, region, factor):
+        """Mid-rank percentile over every combination in a region, equally weighted."""
+        region_column = self.table.keys.index('region')
+        below = equal = total = 0
+        for row in itertools.product(*(range(len(self.table.options[key])) for key in self.table.keys)):
+            if self.table.options['region'][row[region_column]] != region:
+                continue
+            value = round(self.table.factor_of(row), FactorDistribution.ROUND_DIGITS)
+            total += 1
+            below += value < factor
+            equal += value == factor
+        return (below + equal / 2) / total * 100
+
+    def test_matches_brute_force(self):
+        distribution = FactorDistribution(self.table, 'Europe', {})
+        for factor in (0.5, 1.0, 1.1, 1.32, 2.0):
+            with self.subTest(factor=factor):
+                self.assertAlmostEqual(
+                    distribution.percentile(factor),
+                    self.brute_force_percentile('Europe', factor)
+                )
+
+    def test_priors_weight_options(self):
+        priors = {'*': {'diet': {'High fiber diet': 1.0}}}
+        uniform = FactorDistribution(self.table, 'Asia', {})
+        weighted = FactorDistribution(self.table, 'Asia', priors)
+        # Only high-fiber (1.2x) diets remain, so the same factor ranks lower
+        self.assertLess(weighted.percentile(1.0), uniform.percentile(1.0))
+        with self.assertRaises(ValueError):
+            FactorDistribution(self.table, 'Asia', {'*': {'diet': {'Pizza': 1.0}}})
+
+    def test_cache_is_keyed_on_table_contents(self):
+        first = FactorDistribution.for_region(self.table, 'Asia')
+        self.assertIs(FactorDistribution.for_region(FactorTable(), 'Asia'), first)
+
+        other = FactorTable(self.table.models[key] for key in ('diet', 'region'))
+        self.assertIsNot(FactorDistribution.for_region(other, 'Asia'), first)
+
+    def test_describe_population(self):
+        self.assertIn("answer combinations", FactorDistribution.describe_population({}))
+        self.assertIn("people", FactorDistribution.describe_population({'*': {}}))
+
+
+if __name__ == '__main__':
+    unittest.main()
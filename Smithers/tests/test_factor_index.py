@@ -0,0 +1,80 @@
+# tests/test_factor_index.py
+import itertools
+import random
+import unittest
+from helpers.data_processing import DataProcessor
+from models.factor_index import FactorIndex
+
+class FactorIndexTest(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.index = FactorIndex()
+        cls.table = cls.index.table
+        # Every combination in id order (itertools.product varies the last column fastest)
+        cls.rows = list(itertools.product(*(range(radix) for radix in cls.index.radices)))
+        cls.brute_factors = [cls.table.factor_of(row) for row in cls.rows]
+
+    def brute_count(self, low, high):
+        return sum(low <= factor <= high for factor in self.brute_factors)
+
+    def test_indexes_every_combination_once(self):
+        self.assertEqual(len(self.index), len(self.rows))
+        self.assertEqual(sorted(self.index.ids), list(range(len(self.rows))))
+        self.assertEqual(list(self.index.factors), sorted(self.index.factors))
+
+    def test_range_counts_match_brute_force(self):
+        values = sorted(set(self.brute_factors))
+        bounds = [
+            (0.0, float('inf')),
+            (1.0, 1.0),
+            (values[0], values[0]),
+            (values[-1], values[-1]),
+            (0.8, 1.2),
+            (2.0, 1.0),  # Empty: low above high
+        ]
+        generator = random.Random(42)
+        for _ in range(20):
+            low, high = sorted(generator.choice(values) for _ in range(2))
+            bounds.append((low, high))
+        for low, high in bounds:
+            with self.subTest(low=low, high=high):
+                self.assertEqual(self.index.count_between(low, high), self.brute_count(low, high))
+                self.assertEqual(len(self.index.between(low, high)), self.brute_count(low, high))
+
+    def test_between_returns_matching_rows(self):
+        for factor, row in self.index.between(0.9, 1.1, limit=50):
+            self.assertTrue(0.9 <= factor <= 1.1)
+            self.assertEqual(factor, self.brute_factors[self.index.encode_row(row)])
+
+    def test_ids_round_trip(self):
+        for combination_id in (0, 1, len(self.rows) // 2, len(self.rows) - 1):
+            row = self.index.decode_id(combination_id)
+            self.assertEqual(tuple(row), self.rows[combination_id])
+            self.assertEqual(self.index.encode_row(row), combination_id)
+
+    def test_top_and_bottom(self):
+        ordered = sorted(self.brute_factors)
+        self.assertEqual([factor for factor, _ in self.index.bottom(5)], ordered[:5])
+        self.assertEqual([factor for factor, _ in self.index.top(5)], ordered[::-1][:5])
+        self.assertEqual(len(self.index.top(len(self.rows) + 10)), len(self.rows))
+
+    def test_factors_match_calculator(self):
+        positions = {combination_id: position for position, combination_id in enumerate(self.index.ids)}
+        generator = random.Random(7)
+        for combination_id in generator.sample(range(len(self.rows)), 25):
+            factor = self.index.factors[positions[combination_id]]
+            answers = {}
+            for key, option in self.index.describe(self.index.decode_id(combination_id)).items():
+                answers.update(self.table.models[key].store(option))
+            self.assertAlmostEqual(factor, DataProcessor.calculate_adjustment_factor(answers))
+
+    def test_factor_for_kg_inverts_daily_total(self):
+        days = 365
+        kg_per_day = DataProcessor.BASE_POOPS_PER_DAY * DataProcessor.BASE_GRAMS_PER_POOP / 1000
+        self.assertAlmostEqual(FactorIndex.factor_for_kg(1.5 * days * kg_per_day, days), 1.5)
+        self.assertEqual(FactorIndex.factor_for_kg(10, 0), float('inf'))
+
+
+if __name__ == '__main__':
+    unittest.main()
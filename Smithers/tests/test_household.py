@@ -0,0 +1,69 @@
+# tests/test_household.py
+import unittest
+from datetime import date
+from helpers.data_processing import DataProcessor
+from models.birth_date_model import BirthDateModel
+from models.diet_model import DietModel
+from models.household import Household
+from models.region_model import RegionModel
+
+class HouseholdTest(unittest.TestCase):
+
+    TODAY = date(2026, 1, 1)
+
+    def setUp(self):
+        self.household = Household()
+        self.household.add("Ann", {
+            **DietModel.store('High fiber diet'),
+            **RegionModel.store('Europe'),
+            **BirthDateModel.store(date(1990, 1, 1)),
+        })
+        self.household.add("Bo", {
+            **DietModel.store('Low fiber diet'),
+            **BirthDateModel.store(date(1950, 6, 1)),
+        })
+        self.household.add("Cy", BirthDateModel.store(date(2030, 1, 1)))  # Not born yet
+
+    def expected_kg(self, index):
+        answers = self.household.get_answers(index)
+        days = max((self.TODAY - BirthDateModel.get_stored_date(answers)).days, 0)
+        factor = DataProcessor.calculate_adjustment_factor(answers)
+        return days * DataProcessor.BASE_POOPS_PER_DAY * DataProcessor.BASE_GRAMS_PER_POOP / 1000 * factor
+
+    def test_aggregate_matches_each_profile(self):
+        summary = self.household.aggregate(self.TODAY)
+        self.assertEqual(summary['names'], ["Ann", "Bo", "Cy"])
+        self.assertEqual(list(summary['days']), [(self.TODAY - date(1990, 1, 1)).days,
+                                                 (self.TODAY - date(1950, 6, 1)).days, 0])
+        for index in range(3):
+            self.assertAlmostEqual(summary['total_kg'][index], self.expected_kg(index))
+        self.assertAlmostEqual(summary['factors'][0], 1.2 * 1.1)
+        self.assertAlmostEqual(summary['step_factors']['diet'][1], 0.8)
+
+    def test_sum_mean_and_max(self):
+        summary = self.household.aggregate(self.TODAY)
+        expected = [self.expected_kg(index) for index in range(3)]
+        self.assertAlmostEqual(summary['sum_kg'], sum(expected))
+        self.assertAlmostEqual(summary['mean_kg'], sum(expected) / 3)
+        self.assertEqual(summary['max_index'], expected.index(max(expected)))
+        self.assertEqual(summary['max_index'], 1)
+
+    def test_empty_household(self):
+        summary = Household().aggregate(self.TODAY)
+        self.assertEqual(summary['sum_kg'], 0)
+        self.assertEqual(summary['mean_kg'], 0.0)
+        self.assertIsNone(summary['max_index'])
+
+    def test_update_remove_and_state(self):
+        state = self.household.get_state()
+        self.assertEqual(self.household.copy().get_state(), state)
+        self.household.update(2, DietModel.store('High fiber diet'))
+        self.assertNotEqual(self.household.get_state(), state)
+        self.household.remove(0)
+        self.assertEqual(self.household.names, ["Bo", "Cy"])
+        self.assertEqual(DietModel.get_stored_selection(self.household.get_answers(1)), 'High fiber diet')
+        self.assertEqual(len(self.household.aggregate(self.TODAY)['total_kg']), 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,102 @@
+# tests/test_option_space_verifier.py
+import unittest
+from models import OptionStepModel
+from models.activity_model import ActivityModel
+from models.diet_model import DietModel
+from models.medications_model import MedicationsModel
+from models.poop_size_model import PoopSizeModel
+from models.region_model import RegionModel
+from models.option_space_verifier import OptionSpaceVerifier
+
+class UnreadModel(OptionStepModel):
+    """An option step whose factors the adjustment model never reads."""
+    STORE_KEY = "unread"
+    FIELD_NAME = "unread"
+    DEFAULT_OPTION = "Same"
+    STORE_SHAPE = 'factor'
+
+    OPTIONS = {
+        "Same": {"factor": 1.0},
+        "Double": {"factor": 2.0},
+    }
+
+
+class OptionSpaceVerifierTest(unittest.TestCase):
+
+    def test_shipped_models(self):
+        report = OptionSpaceVerifier().run()
+        # The adjustment model reads only the diet and region factors
+        ignored = {step['key'] for step in report['steps'] if step['ignored']}
+        self.assertEqual(ignored, {
+            'poops_per_week', 'poop_size', 'liquid_intake', 'medication',
+            'sleep_pattern', 'stress_level', 'activity_level',
+        })
+        self.assertFalse(report['passed'])
+        # The table and batch paths agree with the model all the same
+        self.assertEqual(report['mismatches']['factor_table'], 0)
+        self.assertEqual(report['mismatches']['batch'], 0)
+        self.assertEqual(report['mismatches']['invalid_total'], 0)
+
+    def test_hints_where_real_models_are_read(self):
+        verifier = OptionSpaceVerifier([DietModel, ActivityModel, MedicationsModel, PoopSizeModel])
+        report = verifier.run()
+        steps = {step['key']: step for step in report['steps']}
+        self.assertEqual(steps['activity_level']['stores'], "activity_level['data']['factor']")
+        self.assertEqual(steps['activity_level']['reads'], "activity['factor']")
+        self.assertEqual(steps['medication']['reads'], "medications['total_factor']")
+        self.assertIsNone(steps['poop_size']['reads'])   # Not read from anywhere
+        self.assertIsNone(steps['diet']['reads'])        # Not ignored
+
+        text = OptionSpaceVerifier.format_report(report)
+        self.assertIn(
+            "IGNORED activity_level: factors [0.8, 1.0, 1.2] stored in "
+            "activity_level['data']['factor'] never reach the result; "
+            "the model reads activity['factor']",
+            text
+        )
+        self.assertIn("stored in poop_size['data']['factor'] never reach the result\n", text)
+
+    def test_read_field_of_a_read_step(self):
+        self.assertEqual(OptionSpaceVerifier.get_read_field(DietModel), "diet['factor']")
+        self.assertIsNone(OptionSpaceVerifier.get_read_field(UnreadModel))
+
+    def test_enumerates_every_combination(self):
+        report = OptionSpaceVerifier([DietModel, RegionModel]).run()
+        self.assertEqual(
+            report['combinations'],
+            len(DietModel.OPTIONS) * len(RegionModel.OPTIONS)
+        )
+        self.assertTrue(report['passed'])
+
+    def test_reports_ignored_step(self):
+        report = OptionSpaceVerifier([DietModel, UnreadModel]).run()
+        self.assertFalse(report['passed'])
+
+        steps = {step['key']: step for step in report['steps']}
+        self.assertFalse(steps['diet']['ignored'])
+        self.assertTrue(steps['unread']['ignored'])
+        self.assertEqual(steps['unread']['declared'], [1.0, 2.0])
+        self.assertEqual(steps['unread']['effective'], [1.0, 1.0])
+        self.assertEqual(steps['unread']['stores'], "unread['factor']")
+
+        # Every diet combined with "Double" loses its declared factor
+        self.assertEqual(report['mismatches']['ignored_answers'], len(DietModel.OPTIONS))
+        self.assertEqual(report['examples']['ignored_answers'][0]['unread'], "Double")
+        # The table and batch paths still agree with the model
+        self.assertEqual(report['mismatches']['factor_table'], 0)
+        self.assertEqual(report['mismatches']['batch'], 0)
+
+    def test_format_report(self):
+        verifier = OptionSpaceVerifier([DietModel, UnreadModel])
+        text = OptionSpaceVerifier.format_report(verifier.run())
+        self.assertIn("IGNORED unread", text)
+        self.assertIn("ignored_answers: 3 combinations", text)
+        self.assertTrue(text.endswith("FAILED"))
+
+        text = OptionSpaceVerifier.format_report(OptionSpaceVerifier([DietModel]).run())
+        self.assertNotIn("IGNORED", text)
+        self.assertTrue(text.endswith("PASSED"))
+
+
+if __name__ == '__main__':
+    unittest.main()
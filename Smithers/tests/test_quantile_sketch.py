@@ -0,0 +1,95 @@
+# tests/test_quantile_sketch.py
+import math
+import random
+import unittest
+from bisect import bisect_right
+from helpers.quantile_sketch import QuantileSketch
+
+class QuantileSketchTest(unittest.TestCase):
+
+    COUNT = 50000
+    # The sketch promises roughly 1.7 / k; allow twice that so fixed seeds
+    # don't sit on the edge of the bound
+    TOLERANCE = 2 * 1.7 / QuantileSketch.DEFAULT_K
+
+    def setUp(self):
+        generator = random.Random(1234)
+        self.values = [generator.lognormvariate(0, 1) for _ in range(self.COUNT)]
+        self.sorted_values = sorted(self.values)
+
+    def build(self, values, seed=0):
+        sketch = QuantileSketch(seed=seed)
+        for value in values:
+            sketch.update(value)
+        return sketch
+
+    def max_rank_error(self, sketch):
+        return max(
+            abs(sketch.rank(value) - bisect_right(self.sorted_values, value) / self.COUNT)
+            for value in self.sorted_values[::250]
+        )
+
+    def test_rank_error_is_bounded(self):
+        for seed in range(3):
+            with self.subTest(seed=seed):
+                sketch = self.build(self.values, seed)
+                self.assertEqual(sketch.count, self.COUNT)
+                self.assertLessEqual(self.max_rank_error(sketch), self.TOLERANCE)
+                self.assertLess(sum(map(len, sketch.compactors)), 3 * sketch.k + 10 * len(sketch.compactors))
+
+    def test_quantiles_are_close_in_rank(self):
+        sketch = self.build(self.values)
+        self.assertEqual(sketch.quantile(0), self.sorted_values[0])
+        self.assertEqual(sketch.quantile(1), self.sorted_values[-1])
+        for fraction in (0.01, 0.25, 0.5, 0.75, 0.99):
+            with self.subTest(fraction=fraction):
+                true_rank = bisect_right(self.sorted_values, sketch.quantile(fraction)) / self.COUNT
+                self.assertLessEqual(abs(true_rank - fraction), self.TOLERANCE)
+
+    def test_merge_keeps_the_bound(self):
+        parts = [self.values[start::4] for start in range(4)]
+        merged = self.build(parts[0], seed=10)
+        for seed, part in enumerate(parts[1:], 11):
+            merged.merge(self.build(part, seed))
+        self.assertEqual(merged.count, self.COUNT)
+        self.assertEqual(merged.min_value, self.sorted_values[0])
+        self.assertEqual(merged.max_value, self.sorted_values[-1])
+        self.assertLessEqual(self.max_rank_error(merged), self.TOLERANCE)
+
+    def test_merge_into_empty_sketch(self):
+        sketch = self.build(self.values[:1000])
+        empty = QuantileSketch()
+        empty.merge(sketch)
+        self.assertEqual(empty.count, 1000)
+        self.assertEqual(empty.quantile(0.5), sketch.quantile(0.5))
+
+    def test_serialization_round_trip(self):
+        sketch = self.build(self.values)
+        restored = QuantileSketch.from_bytes(sketch.to_bytes())
+        self.assertEqual(restored.k, sketch.k)
+        self.assertEqual(restored.count, sketch.count)
+        self.assertEqual(restored.compactors, sketch.compactors)
+        for fraction in (0.1, 0.5, 0.9):
+            self.assertEqual(restored.quantile(fraction), sketch.quantile(fraction))
+
+        # A restored sketch keeps accepting values and merging
+        restored.merge(QuantileSketch.from_bytes(self.build(self.values[:500]).to_bytes()))
+        restored.update(0.0)
+        self.assertEqual(restored.count, self.COUNT + 501)
+        self.assertEqual(restored.min_value, 0.0)
+
+    def test_rejects_bad_bytes(self):
+        data = self.build(self.values[:1000]).to_bytes()
+        for bad in (data[:10], data[:-1], data + b'\0', b'XXXX' + data[4:]):
+            with self.assertRaises(ValueError):
+                QuantileSketch.from_bytes(bad)
+
+    def test_empty_sketch(self):
+        sketch = QuantileSketch.from_bytes(QuantileSketch().to_bytes())
+        self.assertEqual(sketch.count, 0)
+        self.assertEqual(sketch.rank(1.0), 0.0)
+        self.assertTrue(math.isnan(sketch.quantile(0.5)))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,82 @@
+# tests/test_session_stats.py
+import os
+import tempfile
+import unittest
+from helpers.quantile_sketch import QuantileSketch
+from models.session_stats import SessionStats
+
+class SessionStatsTest(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, 'session_stats.bin')
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def make_stats(self, count=30):
+        stats = SessionStats()
+        for index in range(count):
+            stats.record('Europe', 35, 1000 + index)
+        return stats
+
+    def test_save_and_load(self):
+        self.make_stats().save(self.path)
+        loaded = SessionStats.load(self.path)
+        percentile, sessions = loaded.percentile('Europe', 40, 1015)
+        self.assertEqual(sessions, 30)
+        self.assertAlmostEqual(percentile, 16 / 30 * 100)
+        self.assertIsNone(loaded.percentile('Asia', 40, 1015))
+
+    def test_missing_file_loads_empty(self):
+        self.assertEqual(list(SessionStats.load(self.path).items()), [])
+
+    def test_corrupt_file_raises_and_is_kept(self):
+        data = self.make_stats().to_bytes()
+        for bad in (b'garbage', data[:-3], data + b'\0'):
+            with self.subTest(size=len(bad)):
+                with open(self.path, 'wb') as file:
+                    file.write(bad)
+                with self.assertRaises(ValueError):
+                    SessionStats.load(self.path)
+                with open(self.path, 'rb') as file:
+                    self.assertEqual(file.read(), bad)
+
+    def test_set_aside(self):
+        with open(self.path, 'wb') as file:
+            file.write(b'garbage')
+        bad_path = SessionStats.set_aside(self.path)
+        self.assertFalse(os.path.exists(self.path))
+        with open(bad_path, 'rb') as file:
+            self.assertEqual(file.read(), b'garbage')
+        # A fresh file can now be saved without losing the old one
+        self.make_stats().save(self.path)
+        self.assertEqual(SessionStats.load(self.path).sketches['Europe|30-44'].count, 30)
+
+    def test_merge(self):
+        stats = self.make_stats()
+        other = self.make_stats(10)
+        other.record('Asia', 70, 2000)
+        stats.merge(other)
+        self.assertEqual(stats.sketches['Europe|30-44'].count, 40)
+        self.assertEqual(stats.sketches['Asia|60-74'].count, 1)
+        # Copied, not shared
+        self.assertIsNot(stats.sketches['Asia|60-74'], other.sketches['Asia|60-74'])
+
+    def test_merge_rejects_different_k(self):
+        stats = self.make_stats()
+        other = SessionStats()
+        other.sketches['Asia|60-74'] = QuantileSketch(k=100)
+        other.sketches['Europe|30-44'] = QuantileSketch(k=100)
+        other.sketches['Europe|30-44'].update(5.0)
+        with self.assertRaises(ValueError):
+            stats.merge(other)
+        # Nothing was merged
+        self.assertEqual(sorted(stats.sketches), ['Europe|30-44'])
+        self.assertEqual(stats.sketches['Europe|30-44'].count, 30)
+        with self.assertRaises(ValueError):
+            QuantileSketch(k=100).merge(QuantileSketch(k=200))
+
+
+if __name__ == '__main__':
+    unittest.main()
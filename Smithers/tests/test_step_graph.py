@@ -0,0 +1,130 @@
+# tests/test_step_graph.py
+import unittest
+from datetime import date
+from models.birth_date_model import BirthDateModel
+from models.diet_model import DietModel
+from models.factor_table import FactorTable
+from models.gender_model import GenderModel
+from models.medications_model import MedicationsModel
+from step_graph import StepGraph
+from step_registry import StepRegistry, StepSpec
+
+def make_spec(name, order, factor_keys=(), show_when=()):
+    return StepSpec(
+        name=name,
+        target=f"steps.{name}_step:{name.title()}Step",
+        order=order,
+        title=name,
+        factor_keys=tuple(factor_keys),
+        source='builtin',
+        show_when=tuple((key, tuple(options)) for key, options in show_when),
+    )
+
+class StepGraphTest(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.table = FactorTable()
+        cls.female, cls.other = GenderModel.get_option_keys()[1:]
+        cls.fiber = MedicationsModel.get_option_keys()[1]
+
+    def build(self, specs, prune=True):
+        return StepGraph(specs, self.table, prune)
+
+    def names(self, graph, indices):
+        return [graph.nodes[index].spec.name for index in indices]
+
+    def test_prunes_steps_with_equal_factors(self):
+        graph = self.build([
+            make_spec('birth_date', 1, ['birth_date']),
+            make_spec('gender', 2, ['gender']),
+            make_spec('diet', 3, ['diet']),
+            make_spec('results', 4),
+        ])
+        self.assertEqual(graph.get_skipped(), ['gender'])
+        self.assertEqual(self.names(graph, graph.path({})), ['birth_date', 'diet', 'results'])
+        self.assertFalse(graph.nodes[1].affects_outcome)
+        # Unknown (e.g. plugin) keys are never pruned
+        self.assertTrue(self.build([make_spec('plugin', 1, ['gender', 'hydration'])]).nodes[0].needed)
+
+    def test_without_pruning_every_step_is_shown(self):
+        graph = self.build([make_spec('gender', 1, ['gender']), make_spec('diet', 2, ['diet'])], prune=False)
+        self.assertEqual(graph.get_skipped(), [])
+        self.assertEqual(graph.path({}), [0, 1])
+
+    def test_show_when_keeps_controlling_step(self):
+        specs = [
+            make_spec('gender', 1, ['gender']),
+            make_spec('diet', 2, ['diet'], [('gender', [self.female, self.other])]),
+            make_spec('results', 3),
+        ]
+        graph = self.build(specs)
+        # Gender can't change the factor, but it decides whether diet is asked
+        self.assertEqual(graph.get_skipped(), [])
+        self.assertEqual(self.names(graph, graph.path({})), ['gender', 'results'])
+        female = GenderModel.store(self.female)
+        self.assertEqual(self.names(graph, graph.path(female)), ['gender', 'diet', 'results'])
+        self.assertEqual(graph.next_index(0, female), 1)
+        self.assertEqual(graph.next_index(0, {}), 2)
+        self.assertEqual(graph.previous_index(2, {}), 0)
+        self.assertEqual(graph.previous_index(2, female), 1)
+        self.assertEqual(graph.first_index({}), 0)
+        self.assertIsNone(graph.next_index(2, female))
+
+    def test_pruned_step_is_kept_only_for_needed_dependents(self):
+        specs = [
+            make_spec('diet', 1, ['diet']),
+            make_spec('gender', 2, ['gender'], [('diet', [DietModel.get_option_keys()[1]])]),
+            make_spec('results', 3),
+        ]
+        graph = self.build(specs)
+        # Gender is conditional and itself prunable, so nothing keeps it
+        self.assertEqual(graph.get_skipped(), ['gender'])
+        high_fiber = DietModel.store(DietModel.get_option_keys()[1])
+        self.assertEqual(self.names(graph, graph.path(high_fiber)), ['diet', 'results'])
+
+    def test_chained_conditions(self):
+        specs = [
+            make_spec('gender', 1, ['gender']),
+            make_spec('medication', 2, ['medication'], [('gender', [self.female])]),
+            make_spec('diet', 3, ['diet'], [('medication', [self.fiber])]),
+        ]
+        graph = self.build(specs)
+        self.assertEqual(graph.get_skipped(), [])
+        answers = {**GenderModel.store(self.female), **MedicationsModel.store(self.fiber)}
+        self.assertEqual(graph.path(answers), [0, 1, 2])
+        self.assertEqual(graph.path(GenderModel.store(self.female)), [0, 1])
+        self.assertEqual(graph.path(MedicationsModel.store(self.fiber)), [0])
+
+    def test_ignores_conditions_on_later_or_unknown_keys(self):
+        specs = [
+            make_spec('diet', 1, ['diet'], [('gender', [self.female]), ('hydration', ['High'])]),
+            make_spec('gender', 2, ['gender']),
+        ]
+        graph = self.build(specs)
+        self.assertEqual(graph.nodes[0].conditions, ())
+        self.assertEqual(graph.get_skipped(), ['gender'])
+        self.assertEqual(graph.path({}), [0])
+
+    def test_builtin_steps(self):
+        registry = StepRegistry(include_entry_points=False)
+        specs = registry.discover()
+        graph = self.build(specs)
+        # Exactly the option steps whose answers the shipped model never reads
+        unread = [
+            spec.name for spec in specs
+            if spec.factor_keys and all(
+                key in self.table.models and len(set(self.table.factors[key])) == 1
+                for key in spec.factor_keys
+            )
+        ]
+        self.assertTrue(unread)
+        self.assertEqual(graph.get_skipped(), unread)
+        self.assertNotIn('diet', unread)
+        answers = BirthDateModel.store(date(1990, 1, 1))
+        self.assertEqual(len(graph.path(answers)), len(graph) - len(unread))
+        self.assertEqual(len(self.build(specs, prune=False).path(answers)), len(graph))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,137 @@
+# tests/test_step_navigator.py
+import unittest
+from components.step_navigator import StepNavigator
+
+class FakeWidget:
+    """Just enough of a Tk widget for StepNavigator (no display needed)."""
+
+    def __init__(self):
+        self.children = []
+
+    def winfo_children(self):
+        return list(self.children)
+
+    def grid(self, **options):
+        pass
+
+    def grid_rowconfigure(self, *args, **options):
+        pass
+
+    grid_columnconfigure = grid_rowconfigure
+
+    def grid_propagate(self, flag):
+        pass
+
+    def tkraise(self):
+        pass
+
+
+class FakeStep:
+    shares_widgets = False
+    widgets_created = False
+
+    def __init__(self, name, widgets):
+        self.name = name
+        self.widgets = widgets
+        self.frame = FakeWidget()
+        self.inputs = {}
+        self.value = None
+        self.restored = []
+
+    def create_widgets(self):
+        self.frame.children = [FakeWidget() for _ in range(self.widgets)]
+        self.value = 'default'
+
+    def destroy_widgets(self):
+        self.frame.children = []
+        self.value = None
+
+    def store_input(self):
+        return {self.name: self.value} if self.value is not None else {}
+
+    def restore_input(self, answers):
+        self.restored.append(dict(answers))
+        if self.name in answers:
+            self.value = answers[self.name]
+
+    def on_show(self):
+        pass
+
+
+class SharedStep(FakeStep):
+    """Drawn by a shared tree that isn't under its own frame."""
+    shares_widgets = True
+
+    def create_widgets(self):
+        self.value = 'default'
+
+
+class StepNavigatorTest(unittest.TestCase):
+
+    def make(self, steps, **budget):
+        return StepNavigator(FakeWidget(), steps, **budget)
+
+    def test_evicts_coldest_step_and_restores_it(self):
+        steps = [FakeStep(f"s{index}", 3) for index in range(3)]
+        navigator = self.make(steps, max_live_steps=2)
+        navigator.show(0)
+        steps[0].value = 'entered'
+        navigator.show(1)
+        navigator.show(2)
+        self.assertEqual(list(navigator.live_steps), [1, 2])
+        self.assertEqual(navigator.evicted, {0})
+        self.assertFalse(steps[0].widgets_created)
+        self.assertEqual(steps[0].inputs, {'s0': 'entered'})
+
+        navigator.show(0)
+        self.assertEqual(steps[0].value, 'entered')
+        self.assertEqual(list(navigator.live_steps), [2, 0])
+
+    def test_shared_steps_stay_out_of_the_budget(self):
+        heavy = [FakeStep('birth', 20), FakeStep('results', 30)]
+        shared = [SharedStep(f"option{index}", 0) for index in range(4)]
+        steps = [heavy[0]] + shared + [heavy[1]]
+        navigator = self.make(steps, max_live_steps=2)
+        for index in range(len(steps)):
+            navigator.show(index)
+        # Only the two widget-heavy steps take slots, so neither is evicted
+        self.assertEqual(list(navigator.live_steps), [0, 5])
+        self.assertEqual(navigator.evicted, set())
+        self.assertTrue(all(step.widgets_created for step in steps))
+
+    def test_widget_budget(self):
+        steps = [FakeStep(f"s{index}", 10) for index in range(3)]
+        navigator = self.make(steps, max_widgets=25)
+        for index in range(3):
+            navigator.show(index)
+        self.assertEqual(dict(navigator.live_steps), {1: 10, 2: 10})
+
+    def test_never_evicts_visible_step(self):
+        steps = [FakeStep('big', 50)]
+        navigator = self.make(steps, max_widgets=10)
+        navigator.show(0)
+        self.assertEqual(list(navigator.live_steps), [0])
+
+    def test_load_answers(self):
+        steps = [FakeStep('a', 1), FakeStep('b', 1)]
+        navigator = self.make(steps)
+        navigator.show(0)
+        steps[1].inputs = {'b': 'stale'}
+        navigator.load_answers({'a': 'resumed', 'b': 'resumed'})
+        self.assertEqual(steps[0].value, 'resumed')
+        self.assertEqual(steps[1].inputs, {})
+        self.assertEqual(steps[1].restored, [])   # Not built yet
+        navigator.show(1)
+        self.assertEqual(steps[1].value, 'resumed')
+
+    def test_back(self):
+        navigator = self.make([FakeStep('a', 1), FakeStep('b', 1)])
+        self.assertIsNone(navigator.back())
+        navigator.show(0)
+        navigator.show(1)
+        self.assertEqual(navigator.back().name, 'a')
+        self.assertIsNone(navigator.show(5))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,119 @@
+# tests/test_step_registry.py
+import os
+import sys
+import tempfile
+import textwrap
+import unittest
+from pathlib import Path
+from step_registry import StepRegistry
+from steps import UnavailableStep
+from steps_manager import LazyStep
+
+class FindModuleSourceTest(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        package = os.path.join(self.tmp.name, 'smithers_test_pack')
+        os.makedirs(os.path.join(package, 'steps'))
+        with open(os.path.join(package, '__init__.py'), 'w') as file:
+            file.write("raise RuntimeError('package imported during discovery')\n")
+        with open(os.path.join(package, 'steps', '__init__.py'), 'w') as file:
+            file.write("raise RuntimeError('subpackage imported during discovery')\n")
+        self.module_path = os.path.join(package, 'steps', 'hydration.py')
+        with open(self.module_path, 'w') as file:
+            file.write(textwrap.dedent("""
+                from steps import Step
+
+                class HydrationDetailsStep(Step):
+                    _order = 4
+                    TITLE = "Hydration"
+                    FACTOR_KEYS = ("hydration",)
+                    SHOW_WHEN = {"liquid_intake": ("High",)}
+            """))
+        sys.path.insert(0, self.tmp.name)
+
+    def tearDown(self):
+        sys.path.remove(self.tmp.name)
+        for name in [name for name in sys.modules if name.startswith('smithers_test_pack')]:
+            del sys.modules[name]
+        self.tmp.cleanup()
+
+    def test_finds_dotted_module_without_importing_parents(self):
+        path = StepRegistry.find_module_source('smithers_test_pack.steps.hydration')
+        self.assertEqual(os.path.realpath(path), os.path.realpath(self.module_path))
+        self.assertNotIn('smithers_test_pack', sys.modules)
+
+    def test_reads_plugin_metadata_from_found_source(self):
+        registry = StepRegistry(include_entry_points=False)
+        path = StepRegistry.find_module_source('smithers_test_pack.steps.hydration')
+        registry._register_from_source(
+            'hydration', 'smithers_test_pack.steps.hydration:HydrationDetailsStep', path, 'plugin'
+        )
+        spec = registry.specs['hydration']
+        self.assertEqual(spec.order, 4)
+        self.assertEqual(spec.factor_keys, ('hydration',))
+        self.assertEqual(spec.show_when, (('liquid_intake', ('High',)),))
+        self.assertNotIn('smithers_test_pack', sys.modules)
+
+    def test_missing_module_raises(self):
+        with self.assertRaises(ModuleNotFoundError):
+            StepRegistry.find_module_source('smithers_test_pack.steps.missing')
+        with self.assertRaises(ModuleNotFoundError):
+            StepRegistry.find_module_source('smithers_test_pack.steps.hydration.inner')
+
+    def test_uses_already_imported_modules(self):
+        import models.factor_table
+        path = StepRegistry.find_module_source('models.factor_table')
+        self.assertEqual(path, Path(models.factor_table.__spec__.origin))
+
+
+class UnavailableStepsTest(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = Path(self.tmp.name) / 'computed_step.py'
+        self.path.write_text(textwrap.dedent("""
+            ORDER = 3
+
+            class ComputedStep:
+                _order = ORDER + 1
+        """), encoding='utf-8')
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_non_literal_metadata_is_registered_as_unavailable(self):
+        registry = StepRegistry(include_entry_points=False)
+        registry._register_from_source('computed', 'steps.computed_step', self.path, 'builtin')
+        spec = registry.specs['computed']
+        self.assertIsNotNone(spec.error)
+        self.assertIn('computed', registry.errors)
+        self.assertEqual(spec.title, 'Computed')
+        self.assertEqual(spec.order, StepRegistry.DEFAULT_ORDER)
+
+        step = LazyStep(spec, registry, None).resolve()
+        self.assertIsInstance(step, UnavailableStep)
+        self.assertEqual(step.reason, spec.error)
+
+    def test_missing_plugin_module_is_registered_as_unavailable(self):
+        registry = StepRegistry(include_entry_points=False)
+        try:
+            StepRegistry.find_module_source('smithers_missing_pack.steps')
+        except ModuleNotFoundError as e:
+            registry.register_unavailable(
+                'hydration', 'smithers_missing_pack.steps:HydrationDetailsStep', 'pack', e
+            )
+        spec = registry.specs['hydration']
+        self.assertEqual(spec.title, 'Hydration Details')
+        self.assertIn('smithers_missing_pack', spec.error)
+
+    def test_builtin_steps_have_no_errors(self):
+        registry = StepRegistry(include_entry_points=False)
+        specs = registry.discover()
+        self.assertEqual(registry.errors, {})
+        self.assertTrue(specs)
+        self.assertTrue(all(spec.error is None for spec in specs))
+
+
+if __name__ == '__main__':
+    unittest.main()
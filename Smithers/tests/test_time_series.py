@@ -0,0 +1,53 @@
+# tests/test_time_series.py
+import math
+import random
+import unittest
+from datetime import date
+from helpers.time_series import TimeSeries
+
+class DownsampleTest(unittest.TestCase):
+
+    def setUp(self):
+        generator = random.Random(5)
+        self.values = [math.sin(index / 50) * 10 + generator.random() for index in range(1000)]
+
+    def test_keeps_first_and_last_points(self):
+        for threshold in (2, 3, 10, 999):
+            with self.subTest(threshold=threshold):
+                sampled = TimeSeries.downsample(self.values, threshold)
+                self.assertEqual(sampled[0], (0, self.values[0]))
+                self.assertEqual(sampled[-1], (999, self.values[-1]))
+
+    def test_exact_output_count(self):
+        for threshold in (3, 4, 7, 100, 333, 999):
+            with self.subTest(threshold=threshold):
+                sampled = TimeSeries.downsample(self.values, threshold)
+                self.assertEqual(len(sampled), threshold)
+                indices = [index for index, _ in sampled]
+                self.assertEqual(indices, sorted(set(indices)))
+                for index, value in sampled:
+                    self.assertEqual(value, self.values[index])
+
+    def test_passthrough_when_small_enough(self):
+        for threshold in (1000, 5000):
+            self.assertEqual(TimeSeries.downsample(self.values, threshold), list(enumerate(self.values)))
+        self.assertEqual(TimeSeries.downsample([], 10), [])
+        self.assertEqual(TimeSeries.downsample([4.0], 1), [(0, 4.0)])
+
+    def test_keeps_a_spike(self):
+        values = [0.0] * 500
+        values[237] = 100.0
+        self.assertIn((237, 100.0), TimeSeries.downsample(values, 20))
+
+    def test_lifetime_curve_and_yearly_totals(self):
+        curve = TimeSeries.build_lifetime_curve(
+            date(2000, 1, 1), 0.5, today=date(2010, 1, 1), life_expectancy_years=20
+        )
+        yearly = TimeSeries.yearly_totals(curve['cumulative'])
+        self.assertEqual(len(yearly), 20)
+        self.assertAlmostEqual(yearly[0], 365 * 0.5)
+        self.assertAlmostEqual(yearly[-1], 20 * 365 * 0.5)
+
+
+if __name__ == '__main__':
+    unittest.main()
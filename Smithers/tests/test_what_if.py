@@ -0,0 +1,75 @@
+# tests/test_what_if.py
+import unittest
+from helpers.data_processing import DataProcessor
+from models.factor_table import FactorTable
+from models.what_if import WhatIf
+
+class WhatIfTest(unittest.TestCase):
+
+    DAYS = 40 * 365
+
+    @classmethod
+    def setUpClass(cls):
+        cls.table = FactorTable()
+        cls.what_if = WhatIf(cls.table)
+        cls.row = cls.table.encode({
+            **cls.table.models['diet'].store('Low fiber diet'),
+            **cls.table.models['region'].store('Europe'),
+        })
+
+    def calculator_kg(self, selections):
+        """Total over DAYS from the calculator itself, for step key -> option."""
+        answers = {}
+        for key, code in zip(self.table.keys, self.row):
+            option = selections.get(key, self.table.options[key][code])
+            answers.update(self.table.models[key].store(option))
+        factor = DataProcessor.calculate_adjustment_factor(answers)
+        return DataProcessor.calculate_total_poop(
+            self.DAYS / 365,
+            DataProcessor.BASE_POOPS_PER_DAY,
+            DataProcessor.BASE_GRAMS_PER_POOP,
+            factor
+        )['total_kg']
+
+    def test_deltas_match_calculator(self):
+        current_kg = self.calculator_kg({})
+        results = self.what_if.sweep(self.row, self.DAYS, pairs=True)
+        self.assertTrue(results)
+        for result in results:
+            with self.subTest(changes=result['changes']):
+                total_kg = self.calculator_kg(dict(result['changes']))
+                self.assertAlmostEqual(result['total_kg'], total_kg)
+                self.assertAlmostEqual(result['delta_kg'], total_kg - current_kg)
+                self.assertAlmostEqual(result['factor'], total_kg / current_kg * self.table.factor_of(self.row))
+
+    def test_ranked_by_size_of_change(self):
+        results = self.what_if.sweep(self.row, self.DAYS, pairs=True)
+        sizes = [abs(result['delta_kg']) for result in results]
+        self.assertEqual(sizes, sorted(sizes, reverse=True))
+        # Low fiber in Europe (0.8 x 1.1): high fiber alone (1.2 x 1.1) moves the total most
+        self.assertEqual(results[0]['changes'], (('diet', 'High fiber diet'),))
+        self.assertEqual(dict(results[0]['changes'])['diet'], 'High fiber diet')
+        self.assertGreater(results[0]['delta_kg'], 0)
+
+    def test_unchanged_alternatives(self):
+        results = self.what_if.sweep(self.row, self.DAYS)
+        self.assertTrue(all(abs(result['delta_kg']) > 1e-9 for result in results))
+        every = self.what_if.sweep(self.row, self.DAYS, include_unchanged=True)
+        singles = sum(len(options) - 1 for options in self.table.options.values())
+        self.assertEqual(len(every), singles)
+        self.assertEqual(len(self.what_if.alternatives(self.row)), singles)
+
+    def test_pairs_use_two_steps(self):
+        for changes in self.what_if.alternatives(self.row, pairs=True):
+            columns = [column for column, _ in changes]
+            self.assertEqual(len(columns), len(set(columns)))
+            for column, code in changes:
+                self.assertNotEqual(code, self.row[column])
+
+    def test_describe(self):
+        result = {'changes': (('diet', 'High fiber diet'), ('liquid_intake', 'High'))}
+        self.assertEqual(WhatIf.describe(result), "diet → High fiber diet + liquid intake → High")
+
+
+if __name__ == '__main__':
+    unittest.main()